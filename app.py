@@ -1,15 +1,19 @@
 import streamlit as st
-from groq import Groq
 from dotenv import load_dotenv
 import os
-import asyncio
-from websearcher import WebSearcher
 from datetime import datetime
 from fpdf import FPDF, XPos, YPos
 import textwrap
-from organization_searcher import OrganizationSearcher
-from database_manager import DatabaseManager
-from data_processor import DataProcessor
+from async_runtime import run_async
+from cache import cached_completion, get_completion_cache
+from resources import (
+    get_data_processor,
+    get_database_manager,
+    get_groq_client,
+    get_org_searcher,
+    get_web_searcher,
+)
+from storage_backend import NEWS_WINDOW_DAYS, UNDATED_PUBLICATION_DATE, news_window_start
 import time
 
 # Configure logging
@@ -33,12 +37,19 @@ if not os.getenv('SERPAPI_KEY'):
     st.error("⚠️ SERPAPI_KEY is not set. Please set it in your environment variables.")
     st.stop()
 
-# Initialize clients
-groq_client = Groq(api_key=GROQ_API_KEY)
-web_searcher = WebSearcher()
-db_manager = DatabaseManager()
-data_processor = DataProcessor()
-org_searcher = OrganizationSearcher()
+# Initialize clients (shared across reruns and sessions, see resources.py)
+groq_client = get_groq_client()
+web_searcher = get_web_searcher()
+data_processor = get_data_processor()
+org_searcher = get_org_searcher()
+completion_cache = get_completion_cache()
+
+try:
+    db_manager = get_database_manager()
+except Exception as e:
+    st.error(f"❌ Database setup failed: {str(e)}")
+    st.info("Please check your database configuration and refresh the page")
+    st.stop()
 
 # Initialize session state
 if 'report' not in st.session_state:
@@ -82,13 +93,14 @@ def generate_report(content, sources):
     """
     
     try:
-        response = groq_client.chat.completions.create(
+        return cached_completion(
+            groq_client,
+            completion_cache,
             model="llama-3.2-90b-vision-preview",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
             max_tokens=4000
         )
-        return response.choices[0].message.content
     except Exception as e:
         st.error(f"Error generating report: {str(e)}")
         return None
@@ -97,7 +109,7 @@ def generate_report_clicked():
     """Handle report generation button click"""
     with st.spinner("🔎 Searching and analyzing content..."):
         try:
-            result = asyncio.run(web_searcher.search_company_info(st.session_state.query))
+            result = run_async(web_searcher.search_company_info(st.session_state.query))
             
             if not result or not result['articles']:
                 st.error("Unable to fetch search results. Please try a different query.")
@@ -346,7 +358,7 @@ with tab1:
         try:
             with st.spinner("🔄 Searching and processing..."):
                 # Get organization data
-                org_data = asyncio.run(org_searcher.fetch_organization_data(search_query))
+                org_data = run_async(org_searcher.fetch_organization_data(search_query))
                 
                 # Debug: Show raw data structure
                 st.write("### Debug: Data Structure")
@@ -402,49 +414,84 @@ with tab1:
             logging.error(f"Error in organization search: {str(e)}")
 
 with tab2:
+    SEARCH_PAGE_SIZE = 20
+
     search_term = st.text_input("Search organizations or members:", 
                                help="Enter name, location, or other keywords",
                                key="search_db")
     
     if st.button("Search", key="search_button"):
-        if search_term:
-            # Search in database
-            org_results = db_manager.search_organizations(search_term)
-            member_results = db_manager.search_members(search_term)
-            
-            if org_results:
-                st.subheader("Organizations Found")
-                for org in org_results:
-                    st.markdown("---")
-                    st.write(f"🏢 **{org['name']}**")
-                    st.write(f"**Description:** {org['description']}")
-                    st.write(f"**Ideology:** {org['ideology']}")
-                    st.write(f"**Founded:** {org['founding_date']}")
-                    st.write(f"**Headquarters:** {org['headquarters']}")
-                    if org.get('website'):
-                        st.write(f"**Website:** {org['website']}")
-            
-            if member_results:
-                st.subheader("Members/Leaders Found")
-                for member in member_results:
-                    st.markdown("---")
-                    st.write(f"👤 **{member['name']}** - {member['position']}")
-                    st.write(f"**Organization:** {member['organization_name']}")
-                    if member.get('background'):
-                        st.write(f"**Background:** {member['background']}")
-                    if member.get('education'):
-                        st.write(f"**Education:** {member['education']}")
-                    if member.get('political_history'):
-                        st.write(f"**Political History:** {member['political_history']}")
-            
-            if not org_results and not member_results:
-                st.info("No results found for your search term.")
+        st.session_state.search_submitted = search_term
+        st.session_state.search_page = 0
+
+    submitted_term = st.session_state.get('search_submitted')
+    if submitted_term:
+        page = st.session_state.get('search_page', 0)
+        # One ranked request covers both organizations and members
+        search_results = db_manager.search_directory(
+            submitted_term, limit=SEARCH_PAGE_SIZE, offset=page * SEARCH_PAGE_SIZE
+        )
+        hits = search_results["results"]
+        total = search_results["total"]
+
+        if hits:
+            st.caption(f"Showing {page * SEARCH_PAGE_SIZE + 1}-{page * SEARCH_PAGE_SIZE + len(hits)} of {total} results, best matches first")
+            for hit in hits:
+                details = hit.get("details") or {}
+                st.markdown("---")
+                if hit["kind"] == "organization":
+                    st.write(f"🏢 **{details.get('name')}**")
+                    st.write(f"**Description:** {details.get('description')}")
+                    st.write(f"**Ideology:** {details.get('ideology')}")
+                    st.write(f"**Founded:** {details.get('founding_date')}")
+                    st.write(f"**Headquarters:** {details.get('headquarters')}")
+                    if details.get('website'):
+                        st.write(f"**Website:** {details['website']}")
+                else:
+                    st.write(f"👤 **{details.get('name')}** - {details.get('position')}")
+                    st.write(f"**Organization:** {details.get('organization_name')}")
+                    if details.get('background'):
+                        st.write(f"**Background:** {details['background']}")
+                    if details.get('education'):
+                        st.write(f"**Education:** {details['education']}")
+                    if details.get('political_history'):
+                        st.write(f"**Political History:** {details['political_history']}")
+
+            prev_col, next_col = st.columns(2)
+            with prev_col:
+                if page > 0 and st.button("⬅️ Previous", key="search_prev"):
+                    st.session_state.search_page = page - 1
+                    st.rerun()
+            with next_col:
+                if (page + 1) * SEARCH_PAGE_SIZE < total and st.button("Next ➡️", key="search_next"):
+                    st.session_state.search_page = page + 1
+                    st.rerun()
+        else:
+            st.info("No results found for your search term.")
 
 with tab3:
+    BROWSE_PAGE_SIZE = 50
+
     st.subheader("Browse Organizations")
     
-    # Get all organizations
-    orgs = db_manager.get_all_organizations()
+    name_filter = st.text_input("Filter organizations:", key="browse_filter",
+                                placeholder="Start typing an organization name...")
+
+    # Restart paging whenever the filter changes
+    if st.session_state.get('browse_filter_applied') != name_filter:
+        st.session_state.browse_filter_applied = name_filter
+        st.session_state.browse_cursors = [None]
+        st.session_state.browse_total = None
+
+    # Fetch one page of summaries (name, counts, latest activity), keyed on the last name of the previous page
+    orgs_page = db_manager.get_organization_summaries(
+        after=st.session_state.browse_cursors[-1],
+        limit=BROWSE_PAGE_SIZE,
+        search=name_filter or None
+    )
+    if orgs_page["total"] is not None:
+        st.session_state.browse_total = orgs_page["total"]
+    orgs = orgs_page["items"]
     
     if orgs:
         col1, col2 = st.columns([3, 1])
@@ -455,6 +502,34 @@ with tab3:
                 [org['name'] for org in orgs],
                 key="org_selector"
             )
+
+            st.dataframe(
+                [
+                    {
+                        "Organization": org["name"],
+                        "Leaders": org.get("leader_count"),
+                        "News": org.get("news_count"),
+                        "Latest news": org.get("latest_publication_date"),
+                        "Last researched": org.get("last_researched_at")
+                    }
+                    for org in orgs
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+
+            page_number = len(st.session_state.browse_cursors)
+            if st.session_state.browse_total is not None:
+                st.caption(f"Page {page_number} · {st.session_state.browse_total} organizations")
+            prev_col, next_col = st.columns(2)
+            with prev_col:
+                if page_number > 1 and st.button("⬅️ Previous page", key="browse_prev"):
+                    st.session_state.browse_cursors.pop()
+                    st.rerun()
+            with next_col:
+                if orgs_page["next_cursor"] and st.button("Next page ➡️", key="browse_next"):
+                    st.session_state.browse_cursors.append(orgs_page["next_cursor"])
+                    st.rerun()
         
         with col2:
             # Initialize session state for delete confirmation
@@ -476,6 +551,8 @@ with tab3:
                         # Reset session state
                         st.session_state.delete_confirmation = False
                         st.session_state.org_to_delete = None
+                        st.session_state.browse_cursors = [None]
+                        st.session_state.browse_total = None
                         # Rerun to refresh the page
                         time.sleep(1)
                         st.rerun()
@@ -489,7 +566,10 @@ with tab3:
 
         # Display organization information only if not in delete confirmation mode
         if selected_org and not st.session_state.delete_confirmation:
-            org = next((org for org in orgs if org['name'] == selected_org), None)
+            # Organization, leaders and latest news arrive in a single request; the date bound
+            # keeps the news read to the recent monthly partitions
+            detail = db_manager.get_organization_detail(selected_org, news_since=news_window_start())
+            org = detail.get("organization")
             if org:
                 # Organization Overview
                 st.markdown(f"""
@@ -505,7 +585,7 @@ with tab3:
                 
                 # Leadership Section
                 st.markdown('<h3 class="section-header">👥 Leadership and Key Members</h3>', unsafe_allow_html=True)
-                members = db_manager.get_organization_members(org['name'])
+                members = detail.get("leaders", [])
                 
                 if members:
                     for member in members:
@@ -522,31 +602,32 @@ with tab3:
                     st.info("No leadership information available for this organization.")
                 # News Section
                 st.markdown('<h3 class="section-header">📰 Recent News</h3>', unsafe_allow_html=True)
-                news = db_manager.get_organization_news(org['name'])
+                news = detail.get("news", [])
                 
                 if news:
                     for article in news:
+                        # Day of the parsed timestamp; the text as researched when it could not be parsed
+                        publication_date = article.get("publication_date")
+                        if publication_date == UNDATED_PUBLICATION_DATE:
+                            publication_date = None
+                        published = (publication_date or "")[:10] or article.get("publication_date_raw")
                         st.markdown(f"""
                         <div class="news-card">
                             <h4>{article['title']}</h4>
                             <p>{article['content']}</p>
                             {f'<p><a href="{article["source_url"]}" target="_blank">Read more →</a></p>' if article.get('source_url') else ''}
-                            {f'<p class="small-text">Published: {article["publication_date"]}</p>' if article.get('publication_date') else ''}
+                            {f'<p class="small-text">Published: {published}</p>' if published else ''}
                         </div>
                         """, unsafe_allow_html=True)
                 else:
-                    st.info("No recent news available for this organization.")
+                    st.info(f"No news from the last {NEWS_WINDOW_DAYS} days for this organization.")
+    elif len(st.session_state.browse_cursors) > 1:
+        # A later page can come back empty when organizations were deleted after the previous page loaded
+        st.info("No more organizations on this page.")
+        if st.button("⬅️ Previous page", key="browse_prev"):
+            st.session_state.browse_cursors.pop()
+            st.rerun()
+    elif name_filter:
+        st.info(f"No organizations match '{name_filter}'.")
     else:
         st.info("No organizations found in the database. Use the Research tab to add organizations.")
-# Add after initializing db_manager
-try:
-    # Test database connection without adding/deleting data
-    db_manager = DatabaseManager()
-    # Just check if we can query the database
-    test_query = db_manager.supabase.table('organizations').select("*").limit(1).execute()
-    if test_query:
-        st.success("✅ Database connected successfully!")
-except Exception as e:
-    st.error(f"❌ Database setup failed: {str(e)}")
-    st.info("Please check your database configuration and refresh the page")
-    st.stop() 
\ No newline at end of file
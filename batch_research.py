@@ -0,0 +1,249 @@
+"""Research and save many organizations from the command line.
+
+Usage:
+    python batch_research.py organizations.csv --workers 8
+    python batch_research.py organizations.jsonl --checkpoint run.checkpoint.jsonl
+    python batch_research.py researched.jsonl --import --backend postgres
+
+CSV input uses the "name" column when there is a header, otherwise the first
+column. JSONL input accepts {"name": ...} objects or bare JSON strings.
+Completed organizations are appended to the checkpoint file, and a rerun with
+the same checkpoint skips them.
+
+With --import the input is JSONL of already researched organizations
+({"organization": {...}, "leaders": [...], "news": [...]}, the shape returned by
+fetch_organization_data), which is written straight to the database with
+bulk_import.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+from dotenv import load_dotenv
+from http_client import RateLimiter
+from organization_searcher import OrganizationSearcher
+from storage_backend import create_database_manager
+
+logger = logging.getLogger("batch_research")
+
+
+def read_organization_names(path: str) -> List[str]:
+    """Read organization names from a CSV or JSONL file, dropping blanks and duplicates"""
+    names = []
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if isinstance(record, dict):
+                    record = record.get('name') or record.get('organization') or ''
+                names.append(str(record))
+        else:
+            rows = list(csv.reader(f))
+            if rows and 'name' in [cell.strip().lower() for cell in rows[0]]:
+                column = [cell.strip().lower() for cell in rows[0]].index('name')
+                rows = rows[1:]
+            else:
+                column = 0
+            names.extend(row[column] for row in rows if len(row) > column)
+
+    seen = set()
+    unique = []
+    for name in names:
+        name = name.strip()
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            unique.append(name)
+    return unique
+
+
+class Checkpoint:
+    """Append-only JSONL record of finished organizations"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def completed(self) -> Set[str]:
+        """Names that were saved successfully in a previous run"""
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A run killed mid-write can leave a truncated last line
+                    continue
+                # "researched" entries come from --no-save runs and still need saving
+                if record.get('status') == 'saved':
+                    done.add(record['name'].lower())
+        return done
+
+    def record(self, entry: Dict):
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+                f.flush()
+
+
+class BatchResearcher:
+    """Runs fetch_organization_data and save_organization_data for many organizations"""
+
+    def __init__(self,
+                 workers: int = 4,
+                 retries: int = 2,
+                 groq_rate: float = 0.5,
+                 checkpoint: Optional[Checkpoint] = None,
+                 save: bool = True,
+                 backend: Optional[str] = None):
+        self.workers = workers
+        self.retries = retries
+        self.groq_limiter = RateLimiter(groq_rate)
+        self.org_searcher = OrganizationSearcher()
+        self.db_manager = create_database_manager(backend) if save else None
+        self.checkpoint = checkpoint
+        self.stats = {"saved": 0, "researched": 0, "failed": 0, "skipped": 0, "leaders": 0, "news": 0}
+
+    async def _research_one(self, name: str) -> Dict:
+        """Research and save one organization, retrying with backoff"""
+        started = time.monotonic()
+        error = "no data returned"
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(2 ** attempt)
+            try:
+                await self.groq_limiter.acquire()
+                data = await self.org_searcher.fetch_organization_data(name)
+                if not data or not data.get("organization"):
+                    error = "no data returned"
+                    continue
+
+                # Store under the name we were asked for so reruns and the checkpoint line up
+                data["organization"]["name"] = name
+
+                if self.db_manager is not None:
+                    saved = await asyncio.to_thread(self.db_manager.save_organization_data, data)
+                    if not saved:
+                        error = "save failed"
+                        continue
+
+                return {
+                    "name": name,
+                    "status": "saved" if self.db_manager is not None else "researched",
+                    "leaders": len(data.get("leaders", [])),
+                    "news": len(data.get("news", [])),
+                    "attempts": attempt + 1,
+                    "seconds": round(time.monotonic() - started, 2)
+                }
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"Attempt {attempt + 1} for {name} failed: {error}")
+
+        return {
+            "name": name,
+            "status": "failed",
+            "error": error,
+            "attempts": self.retries + 1,
+            "seconds": round(time.monotonic() - started, 2)
+        }
+
+    async def run(self, names: List[str]) -> Dict:
+        """Process every name with at most `workers` in flight"""
+        done = self.checkpoint.completed() if self.checkpoint else set()
+        pending = [name for name in names if name.lower() not in done]
+        self.stats["skipped"] = len(names) - len(pending)
+        if self.stats["skipped"]:
+            logger.info(f"Skipping {self.stats['skipped']} organizations already in the checkpoint")
+
+        semaphore = asyncio.Semaphore(self.workers)
+        finished = 0
+        started = time.monotonic()
+
+        async def worker(name: str):
+            nonlocal finished
+            async with semaphore:
+                result = await self._research_one(name)
+
+            if result["status"] in ("saved", "researched"):
+                self.stats[result["status"]] += 1
+                self.stats["leaders"] += result["leaders"]
+                self.stats["news"] += result["news"]
+            else:
+                self.stats["failed"] += 1
+            if self.checkpoint:
+                self.checkpoint.record(result)
+
+            finished += 1
+            logger.info(f"[{finished}/{len(pending)}] {result['status']}: {name} ({result['seconds']}s)")
+
+        await asyncio.gather(*(worker(name) for name in pending))
+
+        elapsed = time.monotonic() - started
+        self.stats["seconds"] = round(elapsed, 2)
+        self.stats["per_minute"] = round(len(pending) / elapsed * 60, 2) if elapsed else 0.0
+        return self.stats
+
+
+def read_research_bundles(path: str) -> List[Dict]:
+    """Read researched organizations from a JSONL file, one bundle per line"""
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Research and save organizations in bulk")
+    parser.add_argument("input", help="CSV or JSONL file of organization names")
+    parser.add_argument("--workers", type=int, default=4, help="organizations researched at the same time")
+    parser.add_argument("--retries", type=int, default=2, help="retries per organization after the first attempt")
+    parser.add_argument("--groq-rate", type=float, default=0.5, help="max Groq requests per second")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <input>.checkpoint.jsonl)")
+    parser.add_argument("--no-save", action="store_true", help="research only, do not write to the database")
+    parser.add_argument("--backend", choices=["supabase", "postgres", "sqlite"],
+                        help="storage backend (default: STORAGE_BACKEND or supabase)")
+    parser.add_argument("--import", dest="import_bundles", action="store_true",
+                        help="input is JSONL of researched organizations; save them without researching")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    load_dotenv()
+
+    if args.import_bundles:
+        started = time.monotonic()
+        bundles = read_research_bundles(args.input)
+        totals = create_database_manager(args.backend).bulk_import(bundles)
+        print(f"Imported {totals['organizations']} of {len(bundles)} organizations "
+              f"in {round(time.monotonic() - started, 2)}s")
+        print(f"Leaders: {totals['leaders']}")
+        print(f"News: {totals['news']}")
+        return
+
+    names = read_organization_names(args.input)
+    checkpoint = Checkpoint(args.checkpoint or f"{args.input}.checkpoint.jsonl")
+    researcher = BatchResearcher(
+        workers=args.workers,
+        retries=args.retries,
+        groq_rate=args.groq_rate,
+        checkpoint=checkpoint,
+        save=not args.no_save,
+        backend=args.backend
+    )
+
+    stats = asyncio.run(researcher.run(names))
+
+    print(f"Organizations: {len(names)} total, {stats['saved']} saved, {stats['researched']} researched only, "
+          f"{stats['failed']} failed, {stats['skipped']} skipped")
+    print(f"Rows: {stats['leaders']} leaders, {stats['news']} news items")
+    print(f"Elapsed: {stats['seconds']}s ({stats['per_minute']} organizations/minute)")
+
+
+if __name__ == "__main__":
+    main()
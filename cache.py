@@ -0,0 +1,328 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+class DiskCache:
+    """Small SQLite-backed key/value cache with per-entry TTL and size-bounded eviction"""
+
+    def __init__(self, path: str, max_entries: int = 5000, touch_interval: Optional[float] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_entries = max_entries
+        # accessed_at only orders LRU eviction, so hits within this many seconds of the last
+        # recorded access skip the write
+        self.touch_interval = (touch_interval if touch_interval is not None
+                               else float(os.getenv("CACHE_TOUCH_INTERVAL", 300)))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at, accessed_at FROM cache_entries WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None or row[1] < now:
+                    if row is not None:
+                        self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                        self._conn.commit()
+                    self.misses += 1
+                    return None
+
+                if now - row[2] >= self.touch_interval:
+                    self._conn.execute(
+                        "UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key)
+                    )
+                    self._conn.commit()
+                self.hits += 1
+            return json.loads(row[0])
+        except Exception as e:
+            self.logger.error(f"Error reading cache entry: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value for ttl seconds"""
+        now = time.time()
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, payload, now + ttl, now)
+                )
+                self._evict(now)
+                self._conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error writing cache entry: {str(e)}")
+
+    def delete(self, key: str):
+        """Remove a single entry"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every entry and reset the counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self, now: float):
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
+        count = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE key IN ("
+                "SELECT key FROM cache_entries ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with per-entry TTL"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class SearchCache:
+    """Persistent cache for SerpAPI responses keyed on the normalized search parameters"""
+
+    # Parameters that change the result set; everything else (api_key, output, ...) is ignored
+    KEY_PARAMS = ("q", "engine", "tbm", "tbs", "num", "gl", "hl")
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 news_ttl: Optional[float] = None,
+                 organic_ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        self.news_ttl = news_ttl if news_ttl is not None else float(os.getenv("SEARCH_CACHE_NEWS_TTL", 15 * 60))
+        self.organic_ttl = organic_ttl if organic_ttl is not None else float(os.getenv("SEARCH_CACHE_TTL", 24 * 60 * 60))
+        self.store = DiskCache(
+            path or os.getenv("SEARCH_CACHE_PATH", os.path.join(".cache", "serpapi.sqlite3")),
+            max_entries=max_entries or int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", 5000))
+        )
+
+    def make_key(self, params: Dict) -> str:
+        """Build a stable cache key from the result-affecting parameters"""
+        normalized = {}
+        for name in self.KEY_PARAMS:
+            value = params.get(name)
+            if value is None or value == "":
+                continue
+            value = str(value).strip()
+            if name == "q":
+                value = " ".join(value.lower().split())
+            normalized[name] = value
+        # SerpAPI defaults to the google engine when none is given
+        normalized.setdefault("engine", "google")
+        return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def ttl_for(self, params: Dict) -> float:
+        """News results go stale quickly, organic results do not"""
+        return self.news_ttl if params.get("tbm") == "nws" else self.organic_ttl
+
+    def get(self, params: Dict) -> Optional[Dict]:
+        return self.store.get(self.make_key(params))
+
+    def set(self, params: Dict, response: Dict):
+        # Never cache error payloads, they would mask a recovered API
+        if not response or "error" in response:
+            return
+        self.store.set(self.make_key(params), response, self.ttl_for(params))
+
+    def stats(self) -> Dict[str, int]:
+        return self.store.stats()
+
+
+class CompletionCache:
+    """Content-addressed cache for chat completions with a memory tier in front of a disk tier"""
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 ttl: Optional[float] = None,
+                 memory_entries: Optional[int] = None,
+                 max_entries: Optional[int] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("COMPLETION_CACHE_TTL", 7 * 24 * 60 * 60))
+        self.memory = MemoryCache(max_entries=memory_entries or int(os.getenv("COMPLETION_CACHE_MEMORY_ENTRIES", 128)))
+        self.store = DiskCache(
+            path or os.getenv("COMPLETION_CACHE_PATH", os.path.join(".cache", "completions.sqlite3")),
+            max_entries=max_entries or int(os.getenv("COMPLETION_CACHE_MAX_ENTRIES", 2000))
+        )
+
+    def make_key(self, model: str, messages: List[Dict], temperature: Optional[float], max_tokens: Optional[int]) -> str:
+        """Hash everything that determines the completion"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        content = self.memory.get(key)
+        if content is not None:
+            return content
+
+        content = self.store.get(key)
+        if content is not None:
+            # Promote disk hits so the next lookup stays in memory
+            self.memory.set(key, content, self.ttl)
+        return content
+
+    def set(self, key: str, content: str):
+        if not content:
+            return
+        self.memory.set(key, content, self.ttl)
+        self.store.set(key, content, self.ttl)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {"memory": self.memory.stats(), "disk": self.store.stats()}
+
+
+def cached_completion(client, cache: "CompletionCache", model: str, messages: List[Dict],
+                      temperature: Optional[float] = None, max_tokens: Optional[int] = None) -> str:
+    """Return the message content for a chat completion, calling the API only on a cache miss"""
+    key = cache.make_key(model, messages, temperature, max_tokens)
+    content = cache.get(key)
+    if content is not None:
+        logging.getLogger(__name__).info("Completion cache hit")
+        return content
+
+    response = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    content = response.choices[0].message.content
+    cache.set(key, content)
+    return content
+
+
+async def acached_completion(client, cache: "CompletionCache", model: str, messages: List[Dict],
+                             temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                             timeout: Optional[float] = None) -> str:
+    """Async variant of cached_completion for AsyncGroq clients; raises asyncio.TimeoutError after timeout"""
+    key = cache.make_key(model, messages, temperature, max_tokens)
+    # The disk tier does blocking SQLite I/O, keep it off the event loop
+    content = await asyncio.to_thread(cache.get, key)
+    if content is not None:
+        logging.getLogger(__name__).info("Completion cache hit")
+        return content
+
+    # wait_for cancels the in-flight request on timeout or when the caller is cancelled
+    response = await asyncio.wait_for(
+        client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        ),
+        timeout=timeout
+    )
+    content = response.choices[0].message.content
+    await asyncio.to_thread(cache.set, key, content)
+    return content
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+_completion_cache: Optional[CompletionCache] = None
+_completion_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Return the process-wide SerpAPI cache"""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SearchCache()
+        return _search_cache
+
+
+def get_completion_cache() -> CompletionCache:
+    """Return the process-wide chat completion cache"""
+    global _completion_cache
+    with _completion_cache_lock:
+        if _completion_cache is None:
+            _completion_cache = CompletionCache()
+        return _completion_cache
@@ -6,8 +6,8 @@ import logging
 import re
 
 class DataProcessor:
-    def __init__(self):
-        self.groq_client = Groq(api_key=os.getenv('GROQ_API_KEY'))
+    def __init__(self, groq_client: Optional[Groq] = None):
+        self.groq_client = groq_client or Groq(api_key=os.getenv('GROQ_API_KEY'))
         self.logger = logging.getLogger(__name__)
 
     def structure_organization_data(self, data):
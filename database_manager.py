@@ -1,10 +1,18 @@
 from supabase import create_client
+from postgrest.exceptions import APIError
 import streamlit as st
+import copy
 import logging
-from typing import List, Dict, Optional
+import os
 from datetime import datetime
+from typing import Callable, List, Dict, Optional
+from cache import MemoryCache
+from date_utils import format_timestamp
+from schema_migrations import ensure_schema
+from storage_backend import (StorageBackend, ORGANIZATION_COLUMNS, LEADER_COLUMNS, NEWS_COLUMNS, SUMMARY_COLUMNS,
+                             NEWS_DERIVED_FIELDS, news_window_start)
 
-class DatabaseManager:
+class DatabaseManager(StorageBackend):
     def __init__(self):
         try:
             self.supabase = create_client(
@@ -12,184 +20,297 @@ class DatabaseManager:
                 st.secrets["SUPABASE_KEY"]
             )
             self.logger = logging.getLogger(__name__)
-            self._check_tables()
-            self._initialize_database()
+            # Read-through cache for the browse/search queries; cleared on every write
+            self.read_cache = MemoryCache(max_entries=int(os.getenv("DB_CACHE_MAX_ENTRIES", 512)))
+            self.read_cache_ttl = float(os.getenv("DB_CACHE_TTL", 300))
+            # Rows per insert request when writing leaders and news in bulk
+            self.batch_size = int(os.getenv("DB_BATCH_SIZE", 500))
+            # Save through the save_organization_bundle RPC when the function is deployed
+            self.use_save_rpc = os.getenv("DB_USE_SAVE_RPC", "true").lower() != "false"
+            # Verifies (and applies pending) migrations once per process
+            ensure_schema(self.supabase)
         except Exception as e:
             st.error(f"Failed to initialize database: {str(e)}")
             raise e
 
-    def _initialize_database(self):
-        """Initialize database tables if they don't exist"""
-        try:
-            # Check if tables exist by attempting to select from them
-            try:
-                self.supabase.table('organizations').select("*").limit(1).execute()
-                self.supabase.table('leaders').select("*").limit(1).execute()
-                self.logger.info("Database tables already exist")
-                return
-            except Exception:
-                # Tables don't exist, create them using rpc
-                sql = """
-                CREATE TABLE IF NOT EXISTS organizations (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL UNIQUE,
-                    description TEXT,
-                    ideology VARCHAR(255),
-                    founding_date VARCHAR(255),
-                    headquarters VARCHAR(255),
-                    website VARCHAR(255),
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-
-                CREATE TABLE IF NOT EXISTS leaders (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(255) NOT NULL,
-                    position VARCHAR(255),
-                    organization VARCHAR(255) REFERENCES organizations(name),
-                    background TEXT,
-                    education TEXT,
-                    political_history TEXT,
-                    achievements TEXT,
-                    source_url TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                """
-                # Use rpc to execute raw SQL
-                self.supabase.rpc('exec_sql', {'query': sql}).execute()
-                self.logger.info("Database tables created successfully")
-                
-        except Exception as e:
-            self.logger.error(f"Error initializing database: {e}")
-            raise e
+    def _cached_read(self, key: str, loader: Callable[[], List[Dict]]):
+        """Return a cached query result, running loader on a miss.
+
+        Callers get their own copy, so sorting or annotating rows cannot change the cached entry.
+        """
+        result = self.read_cache.get(key)
+        if result is None:
+            result = loader()
+            if result is not None:
+                self.read_cache.set(key, result, self.read_cache_ttl)
+        return copy.deepcopy(result)
+
+    def invalidate_cache(self):
+        """Drop every cached read after a write"""
+        self.read_cache.clear()
+
+    def _bulk_insert(self, table: str, records: List[Dict]) -> int:
+        """Insert records in chunks of batch_size, one request per chunk; returns rows written"""
+        written = 0
+        for start in range(0, len(records), self.batch_size):
+            chunk = records[start:start + self.batch_size]
+            response = self.supabase.table(table).insert(chunk).execute()
+            written += len(response.data) if response.data else 0
+        return written
 
     def save_organization_data(self, data: Dict) -> bool:
         """Save organization data including leaders and news"""
         try:
             self.logger.info("Starting to save organization data")
-            
-            # Extract data
-            org_data = data.get("organization", {})
-            leaders_data = data.get("leaders", [])
-            news_data = data.get("news", [])
-
-            # Validate organization data
-            if not org_data:
-                self.logger.error("No organization data to save")
-                return False
 
-            # Ensure required fields exist
-            org_name = org_data.get("name", "").strip()
-            if not org_name:
-                self.logger.error("Organization name is required")
+            bundle = self._build_records(data)
+            if bundle is None:
                 return False
 
-            # Prepare organization data
-            org_record = {
-                "name": org_name,
-                "description": org_data.get("description", ""),
-                "ideology": org_data.get("ideology", ""),
-                "founding_date": org_data.get("founded", ""),
-                "headquarters": org_data.get("headquarters", ""),
-                "website": org_data.get("website", "")
-            }
-
-            # Save organization
-            try:
-                # Check if organization exists
-                existing = self.supabase.table('organizations').select("*").eq('name', org_name).execute()
-                
-                if not existing.data:
-                    self.logger.info(f"Creating new organization: {org_name}")
-                    self.supabase.table('organizations').insert(org_record).execute()
-                else:
-                    self.logger.info(f"Updating existing organization: {org_name}")
-                    self.supabase.table('organizations').update(org_record).eq('name', org_name).execute()
-            except Exception as e:
-                self.logger.error(f"Error saving organization: {str(e)}")
-                raise
-
-            # Save leaders
-            if leaders_data:
-                try:
-                    # Delete existing leaders
-                    self.supabase.table('leaders').delete().eq('organization', org_name).execute()
-                    
-                    # Prepare and insert new leaders
-                    for leader in leaders_data:
-                        leader_record = {
-                            "name": leader.get("name", ""),
-                            "position": leader.get("position", ""),
-                            "background": leader.get("background", ""),
-                            "organization": org_name
-                        }
-                        self.supabase.table('leaders').insert(leader_record).execute()
-                    self.logger.info(f"Saved {len(leaders_data)} leaders")
-                except Exception as e:
-                    self.logger.error(f"Error saving leaders: {str(e)}")
-                    # Continue execution even if leaders fail
-
-            # Save news
-            if news_data:
+            # Preferred path: one atomic RPC for the whole bundle
+            if self.use_save_rpc:
                 try:
-                    # Delete existing news
-                    self.supabase.table('news_articles').delete().eq('organization', org_name).execute()
-                    
-                    # Prepare and insert new news
-                    for article in news_data:
-                        news_record = {
-                            "title": article.get("title", ""),
-                            "content": article.get("content", ""),
-                            "source_url": article.get("source_url", ""),
-                            "publication_date": article.get("publication_date", datetime.now().isoformat()),
-                            "organization": org_name
-                        }
-                        self.supabase.table('news_articles').insert(news_record).execute()
-                    self.logger.info(f"Saved {len(news_data)} news articles")
-                except Exception as e:
-                    self.logger.error(f"Error saving news: {str(e)}")
-                    # Continue execution even if news fails
+                    self._save_bundle_rpc(bundle)
+                    self.logger.info("Successfully saved all organization data")
+                    return True
+                except APIError as e:
+                    # Only a missing function falls back; any other failure must not turn into a partial save
+                    if str(e.code) not in ("PGRST202", "404"):
+                        raise
+                    self.logger.warning(f"save_organization_bundle RPC is not deployed, using table writes: {e.message}")
+                    self.use_save_rpc = False
 
+            self._save_bundle_tables(bundle)
             self.logger.info("Successfully saved all organization data")
             return True
 
         except Exception as e:
             self.logger.error(f"Error in save_organization_data: {str(e)}")
             return False
+        finally:
+            self.invalidate_cache()
 
-    def get_organization_data(self, org_name: str) -> Dict:
-        """Get complete organization data including leaders and news"""
+    def save_organization_bundle(self, data: Dict) -> Optional[Dict]:
+        """Save organization, leaders and news in one transaction with a single RPC call"""
         try:
-            # Get organization
-            org = self.supabase.table('organizations').select("*").eq('name', org_name).execute()
-            
-            if not org.data:
-                return {}
+            bundle = self._build_records(data)
+            if bundle is None:
+                return None
+            return self._save_bundle_rpc(bundle)
+        except Exception as e:
+            self.logger.error(f"Error in save_organization_bundle: {str(e)}")
+            return None
+        finally:
+            self.invalidate_cache()
 
-            # Get leaders
-            leaders = self.supabase.table('leaders').select("*").eq('organization', org_name).execute()
-            
-            # Get news
-            news = self.supabase.table('news_articles').select("*").eq('organization', org_name).execute()
+    def _save_bundle_rpc(self, bundle: Dict) -> Dict:
+        """Call the save_organization_bundle database function (see supabase/migrations)"""
+        response = self.supabase.rpc('save_organization_bundle', {'payload': bundle}).execute()
+        result = response.data or {}
+        self.logger.info(
+            f"Saved {bundle['organization']['name']} via RPC: "
+            f"leaders {result.get('leaders')}, news {result.get('news')}"
+        )
+        return result
+
+    def _sync_rows(self,
+                   table: str,
+                   org_id: int,
+                   incoming: List[Dict],
+                   key_fn: Callable[[Dict], str],
+                   defaults: Optional[Dict] = None,
+                   derived: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+        """Apply only the inserts, updates and deletes needed to make stored rows match incoming"""
+        fields = list(incoming[0])
+        existing = self.supabase.table(table).select(",".join(["id"] + fields)).eq(
+            'organization_id', org_id
+        ).execute().data or []
 
-            return {
-                "organization": org.data[0] if org.data else {},
-                "leaders": leaders.data if leaders.data else [],
-                "news": news.data if news.data else []
-            }
+        to_insert, to_update, to_delete = self._diff_rows(existing, incoming, key_fn, fields, defaults, derived)
 
+        if to_delete:
+            self.supabase.table(table).delete().in_('id', to_delete).execute()
+        for row_id, changes in to_update:
+            self.supabase.table(table).update(changes).eq('id', row_id).execute()
+        inserted = self._bulk_insert(
+            table, [{**record, "organization_id": org_id} for record in to_insert]
+        ) if to_insert else 0
+
+        return {"inserted": inserted, "updated": len(to_update), "deleted": len(to_delete)}
+
+    def _save_bundle_tables(self, bundle: Dict):
+        """Save a bundle with separate table requests (used when the RPC is unavailable)"""
+        org_record = bundle["organization"]
+        org_name = org_record["name"]
+
+        # Save organization (insert or update in a single request, keyed on the unique name)
+        try:
+            self.logger.info(f"Upserting organization: {org_name}")
+            response = self.supabase.table('organizations').upsert(org_record, on_conflict='name').execute()
+            org_id = response.data[0]["id"] if response.data else self.get_organization_by_name(org_name)["id"]
+        except Exception as e:
+            self.logger.error(f"Error saving organization: {str(e)}")
+            raise
+
+        # Save leaders, touching only rows that differ from what is stored
+        if bundle["leaders"]:
+            try:
+                changes = self._sync_rows('leaders', org_id, bundle["leaders"], self._leader_key)
+                self.logger.info(f"Synced leaders: {changes}")
+            except Exception as e:
+                self.logger.error(f"Error saving leaders: {str(e)}")
+                # Continue execution even if leaders fail
+
+        # Save news, touching only rows that differ from what is stored
+        if bundle["news"]:
+            try:
+                watermark = self.supabase.table('news_compaction_watermarks').select('compacted_before').eq(
+                    'organization_id', org_id
+                ).execute().data
+                news = self._drop_compacted_news(bundle["news"], watermark[0]["compacted_before"] if watermark else None)
+                if news:
+                    changes = self._sync_rows(
+                        'news_articles', org_id, news, self._news_key,
+                        self._undated_news_defaults(), NEWS_DERIVED_FIELDS
+                    )
+                    self.logger.info(f"Synced news articles: {changes}")
+            except Exception as e:
+                self.logger.error(f"Error saving news: {str(e)}")
+                # Continue execution even if news fails
+
+    def get_organization_data(self, org_name: str) -> Dict:
+        """Get complete organization data including leaders and news"""
+        return self._organization_detail(org_name, None, None)
+
+    def get_organization_detail(self,
+                                org_name: str,
+                                news_limit: Optional[int] = 10,
+                                news_since: Optional[datetime] = None) -> Dict:
+        """Get an organization with its leaders and latest news in a single request"""
+        return self._organization_detail(org_name, news_limit, news_since or news_window_start())
+
+    def _organization_detail(self, org_name: str, news_limit: Optional[int], news_since: Optional[datetime]) -> Dict:
+        try:
+            return self._cached_read(
+                f"detail:{org_name}:{news_limit}:{news_since}",
+                lambda: self._fetch_organization_detail(org_name, news_limit, news_since)
+            )
         except Exception as e:
             self.logger.error(f"Error retrieving organization data: {str(e)}")
             return {}
 
+    def _fetch_organization_detail(self, org_name: str, news_limit: Optional[int], news_since: Optional[datetime]) -> Dict:
+        # Leaders and news are embedded through their foreign keys to organizations
+        query = self.supabase.table('organizations').select(
+            f"{ORGANIZATION_COLUMNS},leaders({LEADER_COLUMNS}),news_articles({NEWS_COLUMNS})"
+        ).eq('name', org_name).order('publication_date', desc=True, foreign_table='news_articles')
+        if news_since is not None:
+            # Filters the embedded articles only; the date bound prunes old partitions
+            query = query.gte('news_articles.publication_date', format_timestamp(news_since))
+        if news_limit is not None:
+            query = query.limit(news_limit, foreign_table='news_articles')
+
+        response = query.execute()
+        if not response.data:
+            return {}
+
+        organization = dict(response.data[0])
+        leaders = organization.pop('leaders', None) or []
+        news = organization.pop('news_articles', None) or []
+        return {
+            "organization": organization,
+            "leaders": leaders,
+            "news": news
+        }
+
+    def _fetch_children(self,
+                        table: str,
+                        org_name: str,
+                        order_by: Optional[str] = None,
+                        since: Optional[datetime] = None) -> List[Dict]:
+        """Rows of a child table for an organization, embedded through organization_id in one request.
+
+        `since` keeps rows whose order_by column is at or after it.
+        """
+        query = self.supabase.table('organizations').select(f"{table}(*)").eq('name', org_name)
+        if order_by:
+            query = query.order(order_by, desc=True, foreign_table=table)
+        if order_by and since:
+            query = query.gte(f"{table}.{order_by}", format_timestamp(since))
+        response = query.execute()
+        return (response.data[0].get(table) or []) if response.data else []
+
     def get_all_organizations(self) -> List[Dict]:
         """Fetch all organizations from the database"""
         try:
-            response = self.supabase.table('organizations').select("*").execute()
-            return response.data
+            return self._cached_read(
+                "organizations",
+                lambda: self.supabase.table('organizations').select("*").execute().data
+            )
         except Exception as e:
             self.logger.error(f"Error fetching organizations: {e}")
             return []
 
+    def list_organizations(self,
+                           after: Optional[str] = None,
+                           limit: int = 50,
+                           search: Optional[str] = None,
+                           columns: str = "name") -> Dict:
+        """List organizations ordered by name, one page at a time.
+
+        Pass the previous page's next_cursor as `after` to continue (keyset pagination on
+        the unique name). `total` is only counted for the first page, otherwise None.
+        """
+        try:
+            return self._cached_read(
+                f"list:{columns}:{search}:{after}:{limit}",
+                lambda: self._fetch_name_page('organizations', after, limit, search, columns)
+            )
+        except Exception as e:
+            self.logger.error(f"Error listing organizations: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def get_organization_summaries(self,
+                                   after: Optional[str] = None,
+                                   limit: int = 50,
+                                   search: Optional[str] = None) -> Dict:
+        """Page through organization_summaries (counts and latest activity per organization).
+
+        Same paging contract as list_organizations.
+        """
+        try:
+            return self._cached_read(
+                f"summaries:{search}:{after}:{limit}",
+                lambda: self._fetch_name_page('organization_summaries', after, limit, search, SUMMARY_COLUMNS)
+            )
+        except Exception as e:
+            self.logger.error(f"Error listing organization summaries: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def _fetch_name_page(self, table: str, after: Optional[str], limit: int, search: Optional[str], columns: str) -> Dict:
+        """One keyset page of a table with a unique name column, ordered by name"""
+        if "name" not in columns.split(","):
+            columns = f"name,{columns}"
+
+        query = self.supabase.table(table).select(
+            columns, count='exact' if after is None else None
+        )
+        if search:
+            query = query.ilike('name', f"%{search}%")
+        if after is not None:
+            query = query.gt('name', after)
+
+        # One extra row tells whether a next page exists without a second query
+        response = query.order('name').limit(limit + 1).execute()
+        items = response.data or []
+        has_more = len(items) > limit
+        items = items[:limit]
+        return {
+            "items": items,
+            "next_cursor": items[-1]["name"] if has_more else None,
+            "total": response.count if after is None else None
+        }
+
     def get_organization_by_name(self, name: str) -> Optional[Dict]:
         """Fetch organization by name"""
         try:
@@ -200,9 +321,10 @@ class DatabaseManager:
             return None
 
     def add_organization(self, org_data: Dict) -> Optional[Dict]:
-        """Add a new organization to the database"""
+        """Add an organization, updating the existing row if the name is already taken"""
         try:
-            response = self.supabase.table('organizations').insert(org_data).execute()
+            response = self.supabase.table('organizations').upsert(org_data, on_conflict='name').execute()
+            self.invalidate_cache()
             return response.data[0] if response.data else None
         except Exception as e:
             self.logger.error(f"Error adding organization: {e}")
@@ -211,7 +333,8 @@ class DatabaseManager:
     def add_leader(self, leader_data: Dict) -> Optional[Dict]:
         """Add a new leader to the database"""
         try:
-            response = self.supabase.table('leaders').insert(leader_data).execute()
+            response = self.supabase.table('leaders').insert(self._with_organization_id(leader_data)).execute()
+            self.invalidate_cache()
             return response.data[0] if response.data else None
         except Exception as e:
             self.logger.error(f"Error adding leader: {e}")
@@ -220,25 +343,26 @@ class DatabaseManager:
     def get_leaders_by_organization(self, organization_name: str) -> List[Dict]:
         """Fetch all leaders for a specific organization"""
         try:
-            response = self.supabase.table('leaders').select("*").eq('organization', organization_name).execute()
-            return response.data
+            return self._fetch_children('leaders', organization_name)
         except Exception as e:
             self.logger.error(f"Error fetching leaders for organization: {e}")
             return []
 
     def update_organization(self, name: str, update_data: Dict) -> Optional[Dict]:
-        """Update an existing organization"""
+        """Update an existing organization; returns None when no organization has that name"""
         try:
             response = self.supabase.table('organizations').update(update_data).eq('name', name).execute()
+            self.invalidate_cache()
             return response.data[0] if response.data else None
         except Exception as e:
             self.logger.error(f"Error updating organization: {e}")
             return None
 
     def delete_organization(self, name: str) -> bool:
-        """Delete an organization and its associated leaders"""
+        """Delete an organization; its leaders and news go with it (ON DELETE CASCADE)"""
         try:
             response = self.supabase.table('organizations').delete().eq('name', name).execute()
+            self.invalidate_cache()
             return response.data[0] if response.data else None
         except Exception as e:
             self.logger.error(f"Error deleting organization: {e}")
@@ -248,10 +372,12 @@ class DatabaseManager:
         """Search organizations by name, description, or ideology"""
         try:
             query = f"%{search_term}%"
-            response = self.supabase.table('organizations').select("*").or_(
-                f"name.ilike.{query},description.ilike.{query},ideology.ilike.{query}"
-            ).execute()
-            return response.data
+            return self._cached_read(
+                f"search_organizations:{search_term}",
+                lambda: self.supabase.table('organizations').select(ORGANIZATION_COLUMNS).or_(
+                    f"name.ilike.{query},description.ilike.{query},ideology.ilike.{query}"
+                ).execute().data
+            )
         except Exception as e:
             self.logger.error(f"Error searching organizations: {e}")
             return []
@@ -260,52 +386,126 @@ class DatabaseManager:
         """Search leaders/members by name or position"""
         try:
             query = f"%{search_term}%"
-            response = self.supabase.table('leaders').select("*").or_(
-                f"name.ilike.{query},position.ilike.{query}"
-            ).execute()
-            return response.data
+            rows = self._cached_read(
+                f"search_members:{search_term}",
+                # Explicit columns keep the generated search_vector out of the response
+                lambda: self.supabase.table('leaders').select(
+                    f"{LEADER_COLUMNS},organization_id,created_at,organizations(name)"
+                ).or_(
+                    f"name.ilike.{query},position.ilike.{query}"
+                ).execute().data
+            )
+            # Flatten the embedded organization to the organization_name field search_directory uses
+            return [
+                {**{key: value for key, value in row.items() if key != 'organizations'},
+                 "organization_name": (row.get('organizations') or {}).get('name')}
+                for row in rows
+            ]
         except Exception as e:
             self.logger.error(f"Error searching members: {e}")
             return []
 
+    def search_directory(self, search_term: str, limit: int = 20, offset: int = 0) -> Dict:
+        """Ranked full-text search over organizations and leaders in one request.
+
+        Returns {"results": [...], "total": n}; each result has kind ('organization' or
+        'leader'), name, organization_name, rank and the matching row under details.
+        """
+        try:
+            return self._cached_read(
+                f"search_directory:{search_term}:{limit}:{offset}",
+                lambda: self._search_directory_rpc(search_term, limit, offset)
+            )
+        except Exception as e:
+            self.logger.warning(f"search_directory RPC failed, falling back to ilike search: {e}")
+
+        # Unranked fallback for databases without the full-text search migration
+        results = [
+            {"kind": "organization", "name": org["name"], "organization_name": org["name"],
+             "rank": None, "details": org}
+            for org in self.search_organizations(search_term)
+        ] + [
+            {"kind": "leader", "name": member["name"], "organization_name": member.get("organization_name"),
+             "rank": None, "details": member}
+            for member in self.search_members(search_term)
+        ]
+        return {"results": results[offset:offset + limit], "total": len(results)}
+
+    def _search_directory_rpc(self, search_term: str, limit: int, offset: int) -> Dict:
+        response = self.supabase.rpc('search_directory', {
+            'search_query': search_term,
+            'page_size': limit,
+            'page_offset': offset
+        }).execute()
+        rows = response.data or []
+        return {
+            "results": rows,
+            "total": rows[0]["total_count"] if rows else 0
+        }
+
     def get_organization_members(self, organization_name: str) -> List[Dict]:
         """Get all members/leaders for a specific organization"""
         try:
-            response = self.supabase.table('leaders').select("*").eq(
-                'organization', organization_name
-            ).execute()
-            return response.data
+            return self._cached_read(
+                f"members:{organization_name}",
+                lambda: self._fetch_children('leaders', organization_name)
+            )
         except Exception as e:
             self.logger.error(f"Error fetching organization members: {e}")
             return []
 
-    def get_organization_news(self, org_name):
-        """Get news articles for an organization"""
+    def get_organization_news(self, org_name: str, since: Optional[datetime] = None) -> List[Dict]:
+        """Get news articles for an organization, newest first"""
+        since = since or news_window_start()
         try:
-            response = self.supabase.table('news_articles') \
-                .select("*") \
-                .eq('organization', org_name) \
-                .order('publication_date', desc=True) \
-                .execute()
+            news = self._cached_read(
+                f"news:{org_name}:{since}",
+                lambda: self._fetch_children('news_articles', org_name, order_by='publication_date', since=since)
+            )
             
-            logging.info(f"Retrieved {len(response.data)} news articles for {org_name}")
-            return response.data
+            logging.info(f"Retrieved {len(news)} news articles for {org_name}")
+            return news
         except Exception as e:
             logging.error(f"Error fetching organization news: {str(e)}")
             return []
 
-    def _check_tables(self):
-        """Debug method to check table structure"""
+    def get_news_between(self, start: datetime, end: datetime, limit: int = 100) -> List[Dict]:
+        """News published in [start, end) across all organizations, newest first, with organization_name"""
         try:
-            # Check organizations table
-            org_response = self.supabase.table('organizations').select("*").limit(1).execute()
-            st.write("Organizations table exists")
-            
-            # Check leaders table
-            leader_response = self.supabase.table('leaders').select("*").limit(1).execute()
-            st.write("Leaders table exists")
-            
-            return True
+            # Not cached: range ends usually move with the clock
+            rows = self.supabase.table('news_articles').select(f"{NEWS_COLUMNS},organizations(name)").gte(
+                'publication_date', format_timestamp(start)
+            ).lt('publication_date', format_timestamp(end)).order(
+                'publication_date', desc=True
+            ).limit(limit).execute().data
+            return [
+                {**{key: value for key, value in row.items() if key != 'organizations'},
+                 "organization_name": (row.get('organizations') or {}).get('name')}
+                for row in rows
+            ]
+        except Exception as e:
+            self.logger.error(f"Error fetching news between {start} and {end}: {e}")
+            return []
+
+    def get_news_history(self, org_name: str) -> List[Dict]:
+        """Monthly article counts and headlines kept for news past retention, newest month first"""
+        try:
+            return self._cached_read(
+                f"news_history:{org_name}",
+                lambda: self._fetch_children('news_monthly_summaries', org_name, order_by='month')
+            )
         except Exception as e:
-            st.error(f"Table check failed: {str(e)}")
-            return False 
\ No newline at end of file
+            self.logger.error(f"Error fetching news history: {e}")
+            return []
+
+    def maintain_news(self, retention_months: Optional[int] = None, archive: bool = False) -> Dict:
+        """Create upcoming news partitions and compact old news with the maintain_news_partitions function"""
+        try:
+            result = self.supabase.rpc('maintain_news_partitions', {
+                'retention_months': retention_months,
+                'archive': archive
+            }).execute().data or {}
+            self.logger.info(f"News maintenance: {result}")
+            return result
+        finally:
+            self.invalidate_cache()
@@ -0,0 +1,59 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Union
+from dateutil import parser as date_parser
+from dateutil.relativedelta import relativedelta
+
+# "3 days ago", "1 hour ago" as returned by SerpAPI news results and repeated by the LLM
+RELATIVE_DATE = re.compile(r"^(\d+)\s+(second|minute|hour|day|week|month|year)s?\s+ago$", re.IGNORECASE)
+
+# Dates further ahead than this are treated as unparseable rather than stored
+MAX_FUTURE = timedelta(days=1)
+
+
+def parse_publication_date(value: Union[str, datetime, None], now: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse a free-form publication date into an aware UTC datetime, or None if it cannot be read"""
+    now = now or datetime.now(timezone.utc)
+    if value is None:
+        return None
+
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = str(value).strip().rstrip('.')
+        if not text:
+            return None
+
+        lowered = text.lower()
+        match = RELATIVE_DATE.match(lowered)
+        if lowered in ("today", "just now"):
+            parsed = now
+        elif lowered == "yesterday":
+            parsed = now - timedelta(days=1)
+        elif match:
+            amount, unit = int(match.group(1)), match.group(2).lower()
+            parsed = now - relativedelta(**{f"{unit}s": amount})
+        else:
+            try:
+                # Missing parts default to the start of the current year ("March 2024" -> 2024-03-01)
+                parsed = date_parser.parse(text, default=datetime(now.year, 1, 1))
+            except (ValueError, OverflowError):
+                return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    parsed = parsed.astimezone(timezone.utc).replace(microsecond=0)
+    return parsed if parsed <= now + MAX_FUTURE else None
+
+
+def format_timestamp(value: datetime) -> str:
+    """ISO 8601 in UTC without fractions, so stored timestamps also sort correctly as text"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def normalize_publication_date(value: Union[str, datetime, None]) -> Optional[str]:
+    """parse_publication_date formatted for storage; None when the date cannot be read"""
+    parsed = parse_publication_date(value)
+    return format_timestamp(parsed) if parsed else None
@@ -0,0 +1,223 @@
+import aiohttp
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional
+from cache import SearchCache, get_search_cache
+
+SERPAPI_URL = "https://serpapi.com/search"
+
+# Status codes worth retrying; everything else is returned to the caller as-is
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Spaces calls so that at most `rate` start per second, across all loops and threads"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class AsyncHttpClient:
+    """Base class holding one long-lived aiohttp session per event loop"""
+
+    def __init__(self,
+                 timeout: float = 15,
+                 max_retries: int = 3,
+                 backoff: float = 0.5,
+                 headers: Optional[Dict] = None):
+        self.logger = logging.getLogger(__name__)
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.headers = headers or {}
+        # aiohttp sessions are bound to the loop they were created on
+        self._sessions = weakref.WeakKeyDictionary()
+
+    def _new_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the session for the running loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._new_connector(),
+                timeout=self.timeout,
+                headers=self.headers
+            )
+            self._sessions[loop] = session
+        return session
+
+    async def close(self):
+        """Close the session that belongs to the running loop"""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def _sleep_before_retry(self, attempt: int):
+        # Exponential backoff with jitter so concurrent callers do not retry in lockstep
+        await asyncio.sleep(self.backoff * (2 ** attempt) + random.uniform(0, self.backoff))
+
+    async def _get(self, url: str, params: Optional[Dict], as_json: bool):
+        """GET url, retrying on timeouts, connection errors and 429/5xx"""
+        session = await self.get_session()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        if as_json:
+                            return await response.json(content_type=None)
+                        return await response.text(errors="replace")
+                    if response.status not in RETRY_STATUSES:
+                        self.logger.error(f"Request to {url} failed with status {response.status}")
+                        return None
+                    self.logger.warning(f"Request to {url} returned {response.status} (attempt {attempt + 1})")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Request to {url} failed (attempt {attempt + 1}): {str(e)}")
+
+            if attempt < self.max_retries:
+                await self._sleep_before_retry(attempt)
+
+        self.logger.error(f"Giving up on {url} after {self.max_retries + 1} attempts")
+        return None
+
+    async def get_json(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """GET a JSON document"""
+        return await self._get(url, params, as_json=True)
+
+    async def get_text(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
+        """GET a text document"""
+        return await self._get(url, params, as_json=False)
+
+
+class SerpApiClient(AsyncHttpClient):
+    """Async SerpAPI client backed by the shared search cache"""
+
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 search_cache: Optional[SearchCache] = None,
+                 timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None,
+                 max_concurrency: Optional[int] = None,
+                 rate_limit: Optional[float] = None):
+        super().__init__(
+            timeout=timeout if timeout is not None else float(os.getenv("SERPAPI_TIMEOUT", 20)),
+            max_retries=max_retries if max_retries is not None else int(os.getenv("SERPAPI_MAX_RETRIES", 2))
+        )
+        self.api_key = api_key or os.getenv("SERPAPI_KEY")
+        self.search_cache = search_cache or get_search_cache()
+        self.max_concurrency = max_concurrency or int(os.getenv("SERPAPI_MAX_CONCURRENCY", 5))
+        self.rate_limiter = RateLimiter(
+            rate_limit if rate_limit is not None else float(os.getenv("SERPAPI_RATE_LIMIT", 5))
+        )
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def search(self, params: Dict) -> Optional[Dict]:
+        """Run a search, serving repeated queries from the cache"""
+        # The cache is a SQLite file; its reads and writes run off the event loop
+        cached = await asyncio.to_thread(self.search_cache.get, params)
+        if cached is not None:
+            self.logger.info(f"Search cache hit for query: {params.get('q')}")
+            return cached
+
+        # Only real API calls count against the concurrency and rate limits
+        async with self._get_semaphore():
+            await self.rate_limiter.acquire()
+            data = await self.get_json(SERPAPI_URL, {**params, "api_key": self.api_key})
+
+        if data is not None:
+            await asyncio.to_thread(self.search_cache.set, params, data)
+        return data
+
+    async def search_many(self, params_list: List[Dict]) -> List[Optional[Dict]]:
+        """Run several searches concurrently; results are in the same order as params_list"""
+        return await asyncio.gather(*(self.search(params) for params in params_list))
+
+
+class PageFetcher(AsyncHttpClient):
+    """Pooled page downloader with global and per-host connection caps"""
+
+    def __init__(self,
+                 max_connections: Optional[int] = None,
+                 max_per_host: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None,
+                 headers: Optional[Dict] = None):
+        super().__init__(
+            timeout=timeout if timeout is not None else float(os.getenv("FETCH_TIMEOUT", 10)),
+            max_retries=max_retries if max_retries is not None else int(os.getenv("FETCH_MAX_RETRIES", 1)),
+            headers=headers
+        )
+        self.max_connections = max_connections or int(os.getenv("FETCH_MAX_CONNECTIONS", 20))
+        self.max_per_host = max_per_host or int(os.getenv("FETCH_MAX_PER_HOST", 4))
+
+    def _new_connector(self) -> aiohttp.TCPConnector:
+        # The connector limits double as concurrency caps: requests beyond them wait for a free slot
+        return aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=30
+        )
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Download a single page, returning None on failure"""
+        try:
+            return await self.get_text(url)
+        except Exception as e:
+            self.logger.error(f"Error fetching {url}: {str(e)}")
+            return None
+
+    async def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """Download pages concurrently; results are in the same order as urls"""
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+
+_serpapi_client: Optional[SerpApiClient] = None
+_serpapi_client_lock = threading.Lock()
+_page_fetcher: Optional[PageFetcher] = None
+_page_fetcher_lock = threading.Lock()
+
+
+def get_serpapi_client() -> SerpApiClient:
+    """Return the process-wide SerpAPI client"""
+    global _serpapi_client
+    with _serpapi_client_lock:
+        if _serpapi_client is None:
+            _serpapi_client = SerpApiClient()
+        return _serpapi_client
+
+
+def get_page_fetcher(headers: Optional[Dict] = None) -> PageFetcher:
+    """Return the process-wide page fetcher"""
+    global _page_fetcher
+    with _page_fetcher_lock:
+        if _page_fetcher is None:
+            _page_fetcher = PageFetcher(headers=headers)
+        return _page_fetcher
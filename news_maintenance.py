@@ -0,0 +1,48 @@
+"""Create upcoming news partitions and compact old news from the command line.
+
+Usage:
+    python news_maintenance.py
+    python news_maintenance.py --retention-months 24
+    python news_maintenance.py --retention-months 12 --archive --backend postgres
+
+Meant to run from cron, daily or monthly. Every run makes sure monthly
+news_articles partitions exist for the next few months. With a retention age
+(--retention-months or NEWS_RETENTION_MONTHS), articles published before the
+start of the month that many months ago are folded into news_monthly_summaries
+(per organization and month: article count, date range and latest headlines)
+and then dropped, or kept in archive tables with --archive.
+"""
+import argparse
+import json
+import logging
+import os
+from dotenv import load_dotenv
+from storage_backend import create_database_manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain news partitions and apply the news retention policy")
+    parser.add_argument("--retention-months", type=int,
+                        help="keep articles from this many whole months (default: NEWS_RETENTION_MONTHS, "
+                             "unset keeps everything)")
+    parser.add_argument("--archive", action="store_true",
+                        help="keep compacted articles in archive tables instead of dropping them")
+    parser.add_argument("--backend", choices=["supabase", "postgres", "sqlite"],
+                        help="storage backend (default: STORAGE_BACKEND or supabase)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    load_dotenv()
+
+    retention_months = args.retention_months
+    if retention_months is None and os.getenv("NEWS_RETENTION_MONTHS"):
+        retention_months = int(os.getenv("NEWS_RETENTION_MONTHS"))
+    if retention_months is not None and retention_months < 1:
+        parser.error("--retention-months must be at least 1")
+
+    result = create_database_manager(args.backend).maintain_news(retention_months, archive=args.archive)
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
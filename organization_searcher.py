@@ -1,18 +1,36 @@
-import aiohttp
 import asyncio
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 import logging
-from groq import Groq
+from groq import AsyncGroq
 import os
+import weakref
 from datetime import datetime
 import re
+from cache import CompletionCache, acached_completion, get_completion_cache
+from http_client import SerpApiClient, get_serpapi_client
 
 class OrganizationSearcher:
-    def __init__(self):
-        self.groq_client = Groq(api_key=os.getenv('GROQ_API_KEY'))
-        self.serpapi_key = os.getenv('SERPAPI_KEY')
+    def __init__(self,
+                 serpapi_client: Optional[SerpApiClient] = None,
+                 completion_cache: Optional[CompletionCache] = None,
+                 llm_timeout: Optional[float] = None):
+        self.groq_api_key = os.getenv('GROQ_API_KEY')
+        self.serpapi_client = serpapi_client or get_serpapi_client()
+        self.completion_cache = completion_cache or get_completion_cache()
+        self.llm_timeout = llm_timeout if llm_timeout is not None else float(os.getenv('LLM_TIMEOUT', 60))
         self.logger = logging.getLogger(__name__)
+        # AsyncGroq's connection pool is bound to the loop it was first used on
+        self._async_groq_clients = weakref.WeakKeyDictionary()
+
+    def _get_async_groq(self) -> AsyncGroq:
+        """Return the AsyncGroq client for the running loop"""
+        loop = asyncio.get_running_loop()
+        client = self._async_groq_clients.get(loop)
+        if client is None:
+            client = AsyncGroq(api_key=self.groq_api_key, timeout=self.llm_timeout)
+            self._async_groq_clients[loop] = client
+        return client
 
     async def fetch_organization_data(self, org_name: str) -> Dict:
         """Fetch organization data including leaders and news"""
@@ -46,17 +64,18 @@ class OrganizationSearcher:
             Please provide actual information, not the placeholder text in brackets.
             """
 
-            response = self.groq_client.chat.completions.create(
+            content = await acached_completion(
+                self._get_async_groq(),
+                self.completion_cache,
                 model="llama-3.2-90b-vision-preview",
                 messages=[
                     {"role": "system", "content": "You are a research analyst providing factual information about organizations."},
                     {"role": "user", "content": org_prompt}
                 ],
                 temperature=0.3,
-                max_tokens=2000
+                max_tokens=2000,
+                timeout=self.llm_timeout
             )
-
-            content = response.choices[0].message.content
             self.logger.info("Received response from LLM")
 
             # Parse organization profile
@@ -80,6 +99,9 @@ class OrganizationSearcher:
             self.logger.info(f"Parsed data - Org: {bool(org_info)}, Leaders: {len(leaders)}, News: {len(news)}")
             return result
 
+        except asyncio.TimeoutError:
+            self.logger.error(f"LLM request for {org_name} timed out after {self.llm_timeout}s")
+            return None
         except Exception as e:
             self.logger.error(f"Error in fetch_organization_data: {str(e)}")
             return None
@@ -87,83 +109,79 @@ class OrganizationSearcher:
     async def _gather_web_data(self, org_name: str) -> str:
         """Gather data from multiple sources with better error handling"""
         try:
-            async with aiohttp.ClientSession() as session:
-                results = []
+            results = []
+            
+            # Company and news searches are independent, so run them together
+            company_data, news_data = await asyncio.gather(
+                self._search_company_info(org_name),
+                self._search_news(org_name)
+            )
+            if company_data:
+                results.extend(company_data)
                 
-                # First try direct company search
-                company_data = await self._search_company_info(session, org_name)
-                if company_data:
-                    results.extend(company_data)
-                    
-                # If no results, try broader search
-                if not results:
-                    self.logger.info(f"No direct company results for {org_name}, trying broader search...")
-                    broader_data = await self._search_broader_info(session, org_name)
-                    results.extend(broader_data)
+            # If no results, try broader search
+            if not results:
+                self.logger.info(f"No direct company results for {org_name}, trying broader search...")
+                broader_data = await self._search_broader_info(org_name)
+                results.extend(broader_data)
 
-                # Always try to get news
-                news_data = await self._search_news(session, org_name)
-                if news_data:
-                    results.extend(news_data)
+            # Always include news
+            if news_data:
+                results.extend(news_data)
 
-                # Add debug logging
-                self.logger.info(f"Number of results gathered: {len(results)}")
+            # Add debug logging
+            self.logger.info(f"Number of results gathered: {len(results)}")
 
-                if not results:
-                    self.logger.warning(f"No results found for {org_name} from any source")
-                    return ""
+            if not results:
+                self.logger.warning(f"No results found for {org_name} from any source")
+                return ""
 
-                return "\n\n".join(results)
+            return "\n\n".join(results)
 
         except Exception as e:
             self.logger.error(f"Error in _gather_web_data: {str(e)}")
             return ""
 
-    async def _search_company_info(self, session: aiohttp.ClientSession, org_name: str) -> List[str]:
+    async def _search_company_info(self, org_name: str) -> List[str]:
         """Search specifically for company information"""
         results = []
         try:
             # Basic company search
             params = {
-                "api_key": self.serpapi_key,
                 "q": f'"{org_name}" company OR business OR organization',
                 "num": 10,
                 "gl": "us",
                 "hl": "en"
             }
-            
-            async with session.get("https://serpapi.com/search", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if "organic_results" in data:
-                        for result in data["organic_results"]:
-                            snippet = result.get("snippet", "")
-                            title = result.get("title", "")
-                            link = result.get("link", "")
-                            
-                            # Less strict matching to ensure we get results
-                            if any(term.lower() in title.lower() or term.lower() in snippet.lower() 
-                                  for term in org_name.lower().split()):
-                                results.append(f"""
-COMPANY INFORMATION:
-Title: {title}
-Description: {snippet}
-Source: {link}
-""")
                                 
             # Try LinkedIn search as well
             linkedin_params = {
-                "api_key": self.serpapi_key,
                 "q": f'site:linkedin.com/company {org_name}',
                 "num": 3
             }
             
-            async with session.get("https://serpapi.com/search", params=linkedin_params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if "organic_results" in data:
-                        for result in data["organic_results"]:
-                            results.append(f"""
+            # Both queries go out concurrently; gather keeps the company results first
+            data, linkedin_data = await self.serpapi_client.search_many([params, linkedin_params])
+
+            if data and "organic_results" in data:
+                for result in data["organic_results"]:
+                    snippet = result.get("snippet", "")
+                    title = result.get("title", "")
+                    link = result.get("link", "")
+                    
+                    # Less strict matching to ensure we get results
+                    if any(term.lower() in title.lower() or term.lower() in snippet.lower() 
+                          for term in org_name.lower().split()):
+                        results.append(f"""
+COMPANY INFORMATION:
+Title: {title}
+Description: {snippet}
+Source: {link}
+""")
+            
+            if linkedin_data and "organic_results" in linkedin_data:
+                for result in linkedin_data["organic_results"]:
+                    results.append(f"""
 LINKEDIN PROFILE:
 {result.get('title', '')}
 {result.get('snippet', '')}
@@ -175,7 +193,7 @@ URL: {result.get('link', '')}
         
         return results
 
-    async def _search_broader_info(self, session: aiohttp.ClientSession, org_name: str) -> List[str]:
+    async def _search_broader_info(self, org_name: str) -> List[str]:
         """Perform a broader search for information"""
         results = []
         try:
@@ -185,52 +203,43 @@ URL: {result.get('link', '')}
                 f'{org_name} description'
             ]
             
-            for query in search_queries:
-                params = {
-                    "api_key": self.serpapi_key,
-                    "q": query,
-                    "num": 5
-                }
-                
-                async with session.get("https://serpapi.com/search", params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "organic_results" in data:
-                            for result in data["organic_results"]:
-                                snippet = result.get("snippet", "")
-                                if snippet:
-                                    results.append(f"""
+            # Rate limiting and the concurrency cap are applied inside the SerpAPI client
+            responses = await self.serpapi_client.search_many(
+                [{"q": query, "num": 5} for query in search_queries]
+            )
+            
+            for data in responses:
+                if data and "organic_results" in data:
+                    for result in data["organic_results"]:
+                        snippet = result.get("snippet", "")
+                        if snippet:
+                            results.append(f"""
 GENERAL INFORMATION:
 Source: {result.get('title', '')}
 Content: {snippet}
 URL: {result.get('link', '')}
 """)
-                                
-            await asyncio.sleep(0.2)  # Small delay between requests
             
         except Exception as e:
             self.logger.error(f"Error in broader search: {str(e)}")
         
         return results
 
-    async def _search_news(self, session: aiohttp.ClientSession, org_name: str) -> List[str]:
+    async def _search_news(self, org_name: str) -> List[str]:
         """Search for news articles"""
         results = []
         try:
             params = {
-                "api_key": self.serpapi_key,
                 "q": org_name,
                 "tbm": "nws",
                 "num": 5,
                 "tbs": "qdr:m"  # Last month
             }
             
-            async with session.get("https://serpapi.com/search", params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    if "news_results" in data:
-                        for item in data["news_results"]:
-                            results.append(f"""
+            data = await self.serpapi_client.search(params)
+            if data and "news_results" in data:
+                for item in data["news_results"]:
+                    results.append(f"""
 NEWS:
 Title: {item['title']}
 Summary: {item['snippet']}
@@ -0,0 +1,637 @@
+import io
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+import psycopg2.extensions
+from psycopg2 import sql
+from psycopg2.extras import Json, RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from storage_backend import (StorageBackend, ORGANIZATION_COLUMNS, LEADER_COLUMNS, NEWS_COLUMNS, SUMMARY_COLUMNS,
+                             UNDATED_PUBLICATION_DATE, news_window_start)
+
+# Full rows without the generated search_vector columns
+LEADER_ROW_COLUMNS = "id,name,position,organization_id,background,education,political_history,achievements,source_url,created_at"
+NEWS_ROW_COLUMNS = "id,title,content,source_url,publication_date,publication_date_raw,organization_id,created_at"
+
+# Hot reads, PREPAREd once per pooled connection and run with EXECUTE
+PREPARED_STATEMENTS = {
+    "organization_by_name": f"SELECT {ORGANIZATION_COLUMNS} FROM organizations WHERE name = $1",
+    "leaders_by_organization": (
+        f"SELECT {LEADER_ROW_COLUMNS} FROM leaders "
+        "WHERE organization_id = (SELECT id FROM organizations WHERE name = $1) ORDER BY id"
+    ),
+    # The date bound lets the planner skip monthly partitions before $2 (NULL reads them all)
+    "news_by_organization": (
+        f"SELECT {NEWS_ROW_COLUMNS} FROM news_articles "
+        "WHERE organization_id = (SELECT id FROM organizations WHERE name = $1) "
+        "AND publication_date >= COALESCE($2, '-infinity'::TIMESTAMPTZ) "
+        "ORDER BY publication_date DESC"
+    ),
+    "detail_leaders": f"SELECT {LEADER_COLUMNS} FROM leaders WHERE organization_id = $1 ORDER BY id",
+    # LIMIT NULL returns every row; as above, $3 bounds the partitions read
+    "detail_news": (
+        f"SELECT {NEWS_COLUMNS} FROM news_articles WHERE organization_id = $1 "
+        "AND publication_date >= COALESCE($3, '-infinity'::TIMESTAMPTZ) "
+        "ORDER BY publication_date DESC LIMIT $2"
+    ),
+    "search_directory": "SELECT * FROM search_directory($1, $2, $3)",
+    "news_history": (
+        "SELECT month, article_count, first_publication_date, latest_publication_date, headlines "
+        "FROM news_monthly_summaries "
+        "WHERE organization_id = (SELECT id FROM organizations WHERE name = $1) ORDER BY month DESC"
+    ),
+    "news_between": (
+        "SELECT n.id, n.title, n.content, n.source_url, n.publication_date, n.publication_date_raw, "
+        "o.name AS organization_name "
+        "FROM news_articles n JOIN organizations o ON o.id = n.organization_id "
+        "WHERE n.publication_date >= $1 AND n.publication_date < $2 "
+        "ORDER BY n.publication_date DESC LIMIT $3"
+    ),
+}
+
+ORGANIZATION_UPSERT_SQL = """
+INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+VALUES %s
+ON CONFLICT (name) DO UPDATE SET
+    description = EXCLUDED.description,
+    ideology = EXCLUDED.ideology,
+    founding_date = EXCLUDED.founding_date,
+    headquarters = EXCLUDED.headquarters,
+    website = EXCLUDED.website
+WHERE (organizations.description, organizations.ideology, organizations.founding_date,
+       organizations.headquarters, organizations.website)
+      IS DISTINCT FROM
+      (EXCLUDED.description, EXCLUDED.ideology, EXCLUDED.founding_date,
+       EXCLUDED.headquarters, EXCLUDED.website)
+"""
+
+# Imported organizations count as researched even when nothing about them changed
+SUMMARY_TOUCH_SQL = """
+UPDATE organization_summaries s
+SET last_researched_at = now()
+FROM organizations o
+WHERE o.id = s.organization_id AND o.name = ANY(%s)
+"""
+
+# Staging tables filled with COPY; dropped when the import transaction commits
+STAGING_DDL = """
+CREATE TEMP TABLE leaders_stage (
+    ordinal INTEGER, organization TEXT, name TEXT, position TEXT, background TEXT
+) ON COMMIT DROP;
+CREATE TEMP TABLE news_stage (
+    ordinal INTEGER, organization TEXT, title TEXT, content TEXT, source_url TEXT,
+    publication_date TIMESTAMPTZ, publication_date_raw TEXT
+) ON COMMIT DROP;
+"""
+
+# The diff sync of save_organization_bundle, applied to every staged organization at
+# once. Staged rows carry the organization name, mapped to organization_id here.
+# Organizations without staged rows keep their stored leaders/news.
+LEADER_SYNC_SQL = """
+WITH incoming AS (
+    SELECT DISTINCT ON (o.id, leader_natural_key(s.name, s.position))
+        o.id AS organization_id,
+        leader_natural_key(s.name, s.position) AS natural_key,
+        COALESCE(s.name, '') AS name,
+        s.position,
+        s.background
+    FROM leaders_stage s
+    JOIN organizations o ON o.name = s.organization
+    ORDER BY o.id, leader_natural_key(s.name, s.position), s.ordinal
+),
+removed AS (
+    DELETE FROM leaders l
+    WHERE l.organization_id IN (SELECT organization_id FROM incoming)
+      AND NOT EXISTS (
+          SELECT 1 FROM incoming i
+          WHERE i.organization_id = l.organization_id
+            AND i.natural_key = leader_natural_key(l.name, l.position)
+      )
+    RETURNING 1
+),
+changed AS (
+    UPDATE leaders l
+    SET name = i.name, position = i.position, background = i.background
+    FROM incoming i
+    WHERE l.organization_id = i.organization_id
+      AND leader_natural_key(l.name, l.position) = i.natural_key
+      AND (l.name, l.position, l.background) IS DISTINCT FROM (i.name, i.position, i.background)
+    RETURNING 1
+),
+added AS (
+    INSERT INTO leaders (name, position, background, organization_id)
+    SELECT i.name, i.position, i.background, i.organization_id
+    FROM incoming i
+    WHERE NOT EXISTS (
+        SELECT 1 FROM leaders l
+        WHERE l.organization_id = i.organization_id
+          AND leader_natural_key(l.name, l.position) = i.natural_key
+    )
+    RETURNING 1
+)
+SELECT
+    (SELECT count(*) FROM added) AS inserted,
+    (SELECT count(*) FROM changed) AS updated,
+    (SELECT count(*) FROM removed) AS deleted
+"""
+
+NEWS_SYNC_SQL = """
+WITH incoming AS (
+    SELECT DISTINCT ON (o.id, news_natural_key(s.source_url, s.title))
+        o.id AS organization_id,
+        news_natural_key(s.source_url, s.title) AS natural_key,
+        COALESCE(s.title, '') AS title,
+        s.content,
+        s.source_url,
+        s.publication_date,
+        s.publication_date_raw
+    FROM news_stage s
+    JOIN organizations o ON o.name = s.organization
+    LEFT JOIN news_compaction_watermarks w ON w.organization_id = o.id
+    -- Articles from months already folded into news_monthly_summaries are not stored again
+    WHERE NOT COALESCE(s.publication_date < w.compacted_before, false)
+    ORDER BY o.id, news_natural_key(s.source_url, s.title), s.ordinal
+),
+removed AS (
+    DELETE FROM news_articles n
+    WHERE n.organization_id IN (SELECT organization_id FROM incoming)
+      AND NOT EXISTS (
+          SELECT 1 FROM incoming i
+          WHERE i.organization_id = n.organization_id
+            AND i.natural_key = news_natural_key(n.source_url, n.title)
+      )
+    RETURNING 1
+),
+changed AS (
+    UPDATE news_articles n
+    SET title = i.title, content = i.content, source_url = i.source_url,
+        publication_date = CASE WHEN i.publication_date_raw IS NOT DISTINCT FROM n.publication_date_raw
+                                THEN n.publication_date
+                                ELSE COALESCE(i.publication_date, n.publication_date) END,
+        publication_date_raw = i.publication_date_raw
+    FROM incoming i
+    WHERE n.organization_id = i.organization_id
+      AND news_natural_key(n.source_url, n.title) = i.natural_key
+      AND (n.title, n.content, n.source_url, n.publication_date_raw)
+          IS DISTINCT FROM (i.title, i.content, i.source_url, i.publication_date_raw)
+    RETURNING 1
+),
+added AS (
+    INSERT INTO news_articles (title, content, source_url, publication_date, publication_date_raw, organization_id)
+    SELECT i.title, i.content, i.source_url, COALESCE(i.publication_date, '-infinity'), i.publication_date_raw,
+           i.organization_id
+    FROM incoming i
+    WHERE NOT EXISTS (
+        SELECT 1 FROM news_articles n
+        WHERE n.organization_id = i.organization_id
+          AND news_natural_key(n.source_url, n.title) = i.natural_key
+    )
+    RETURNING 1
+)
+SELECT
+    (SELECT count(*) FROM added) AS inserted,
+    (SELECT count(*) FROM changed) AS updated,
+    (SELECT count(*) FROM removed) AS deleted
+"""
+
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements it has PREPAREd"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
+
+def _copy_value(value) -> str:
+    """Encode one value for COPY ... FROM STDIN in text format"""
+    if value is None:
+        return "\\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def _copy_buffer(rows: List[tuple]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(value) for value in row) + "\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _plain(row: Dict) -> Dict:
+    """Timestamps as ISO strings, the same as PostgREST returns them (TIMESTAMPTZ in UTC)"""
+    return {
+        key: _iso(value) if isinstance(value, (date, datetime)) else value
+        for key, value in row.items()
+    }
+
+
+def _iso(value) -> str:
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        # psycopg2 reads -infinity as datetime.min; PostgREST returns the literal
+        if value.replace(tzinfo=None) == datetime.min:
+            return UNDATED_PUBLICATION_DATE
+        value = value.astimezone(timezone.utc)
+    return value.isoformat()
+
+
+class PostgresDatabaseManager(StorageBackend):
+    """DatabaseManager that talks to Postgres directly instead of going through PostgREST.
+
+    Uses a bounded connection pool, prepared statements for the hot reads and COPY for
+    bulk_import. It runs against the Supabase schema and calls the same SQL functions.
+    """
+
+    def __init__(self, dsn: Optional[str] = None, min_connections: int = None, max_connections: int = None):
+        self.logger = logging.getLogger(__name__)
+        dsn = dsn or os.getenv("DATABASE_URL")
+        if not dsn:
+            raise ValueError("DATABASE_URL is required for the postgres storage backend")
+
+        min_connections = min_connections or int(os.getenv("DB_POOL_MIN", 1))
+        max_connections = max_connections or int(os.getenv("DB_POOL_MAX", 10))
+        # Organizations per transaction in bulk_import
+        self.import_chunk_size = int(os.getenv("DB_IMPORT_CHUNK", 1000))
+
+        self.pool = ThreadedConnectionPool(
+            min_connections, max_connections, dsn, connection_factory=PreparingConnection
+        )
+        # The pool raises when exhausted; the semaphore makes callers wait for a connection instead
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def close(self):
+        self.pool.closeall()
+
+    @contextmanager
+    def _cursor(self) -> Iterator[RealDictCursor]:
+        """Cursor on a pooled connection; commits on success, rolls back on error"""
+        with self._slots:
+            conn = self.pool.getconn()
+            try:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    yield cur
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                self.pool.putconn(conn, close=bool(conn.closed))
+
+    @staticmethod
+    def _execute_prepared(cur: RealDictCursor, name: str, *params) -> List[Dict]:
+        conn = cur.connection
+        if name not in conn.prepared:
+            cur.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            conn.prepared.add(name)
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        return [_plain(row) for row in cur.fetchall()]
+
+    def _prepared(self, name: str, *params) -> List[Dict]:
+        with self._cursor() as cur:
+            return self._execute_prepared(cur, name, *params)
+
+    def _query(self, query, params=None) -> List[Dict]:
+        with self._cursor() as cur:
+            cur.execute(query, params)
+            return [_plain(row) for row in cur.fetchall()]
+
+    def save_organization_data(self, data: Dict) -> bool:
+        """Save organization data including leaders and news"""
+        return self.save_organization_bundle(data) is not None
+
+    def save_organization_bundle(self, data: Dict) -> Optional[Dict]:
+        """Save organization, leaders and news in one transaction through save_organization_bundle()"""
+        try:
+            bundle = self._build_records(data)
+            if bundle is None:
+                return None
+            with self._cursor() as cur:
+                cur.execute("SELECT save_organization_bundle(%s) AS result", (Json(bundle),))
+                result = cur.fetchone()["result"]
+            self.logger.info(
+                f"Saved {bundle['organization']['name']}: "
+                f"leaders {result.get('leaders')}, news {result.get('news')}"
+            )
+            return result
+        except Exception as e:
+            self.logger.error(f"Error in save_organization_bundle: {str(e)}")
+            return None
+
+    def bulk_import(self, bundles: Iterable[Dict]) -> Dict:
+        """Save many researched bundles with COPY, one transaction per import_chunk_size organizations"""
+        records = {}
+        for data in bundles:
+            bundle = self._build_records(data)
+            if bundle is not None:
+                # A later bundle for the same organization replaces an earlier one
+                records.pop(bundle["organization"]["name"], None)
+                records[bundle["organization"]["name"]] = bundle
+
+        totals = {
+            "organizations": 0,
+            "leaders": {"inserted": 0, "updated": 0, "deleted": 0},
+            "news": {"inserted": 0, "updated": 0, "deleted": 0}
+        }
+        chunk_list = list(records.values())
+        for start in range(0, len(chunk_list), self.import_chunk_size):
+            chunk = chunk_list[start:start + self.import_chunk_size]
+            changes = self._import_chunk(chunk)
+            totals["organizations"] += len(chunk)
+            for table in ("leaders", "news"):
+                for action, count in changes[table].items():
+                    totals[table][action] += count
+            self.logger.info(f"Imported {totals['organizations']}/{len(chunk_list)} organizations")
+        return totals
+
+    def _import_chunk(self, chunk: List[Dict]) -> Dict:
+        org_fields = ("name", "description", "ideology", "founding_date", "headquarters", "website")
+        leader_rows = [
+            (ordinal, bundle["organization"]["name"], leader["name"], leader["position"], leader["background"])
+            for bundle in chunk
+            for ordinal, leader in enumerate(bundle["leaders"])
+        ]
+        news_rows = [
+            (ordinal, bundle["organization"]["name"], article["title"], article["content"],
+             article["source_url"], article["publication_date"], article["publication_date_raw"])
+            for bundle in chunk
+            for ordinal, article in enumerate(bundle["news"])
+        ]
+
+        with self._cursor() as cur:
+            execute_values(
+                cur, ORGANIZATION_UPSERT_SQL,
+                [tuple(bundle["organization"][field] for field in org_fields) for bundle in chunk],
+                page_size=len(chunk)
+            )
+            cur.execute(SUMMARY_TOUCH_SQL, ([bundle["organization"]["name"] for bundle in chunk],))
+            cur.execute(STAGING_DDL)
+            cur.copy_expert(
+                "COPY leaders_stage (ordinal, organization, name, position, background) FROM STDIN",
+                _copy_buffer(leader_rows)
+            )
+            cur.copy_expert(
+                "COPY news_stage (ordinal, organization, title, content, source_url, publication_date, "
+                "publication_date_raw) FROM STDIN",
+                _copy_buffer(news_rows)
+            )
+            cur.execute(LEADER_SYNC_SQL)
+            leaders = dict(cur.fetchone())
+            cur.execute(NEWS_SYNC_SQL)
+            news = dict(cur.fetchone())
+        return {"leaders": leaders, "news": news}
+
+    def get_organization_data(self, org_name: str) -> Dict:
+        """Get complete organization data including leaders and news"""
+        return self._organization_detail(org_name, None, None)
+
+    def get_organization_detail(self,
+                                org_name: str,
+                                news_limit: Optional[int] = 10,
+                                news_since: Optional[datetime] = None) -> Dict:
+        """Get an organization with its leaders and latest news over one connection"""
+        return self._organization_detail(org_name, news_limit, news_since or news_window_start())
+
+    def _organization_detail(self, org_name: str, news_limit: Optional[int], news_since: Optional[datetime]) -> Dict:
+        try:
+            with self._cursor() as cur:
+                organization = self._execute_prepared(cur, "organization_by_name", org_name)
+                if not organization:
+                    return {}
+                org_id = organization[0]["id"]
+                return {
+                    "organization": organization[0],
+                    "leaders": self._execute_prepared(cur, "detail_leaders", org_id),
+                    "news": self._execute_prepared(cur, "detail_news", org_id, news_limit, news_since)
+                }
+        except Exception as e:
+            self.logger.error(f"Error retrieving organization data: {str(e)}")
+            return {}
+
+    def get_all_organizations(self) -> List[Dict]:
+        """Fetch all organizations"""
+        try:
+            return self._query(f"SELECT {ORGANIZATION_COLUMNS} FROM organizations ORDER BY name")
+        except Exception as e:
+            self.logger.error(f"Error fetching organizations: {e}")
+            return []
+
+    def list_organizations(self,
+                           after: Optional[str] = None,
+                           limit: int = 50,
+                           search: Optional[str] = None,
+                           columns: str = "name") -> Dict:
+        """List organizations ordered by name, one page at a time (keyset pagination on name)"""
+        try:
+            return self._fetch_name_page('organizations', after, limit, search, columns)
+        except Exception as e:
+            self.logger.error(f"Error listing organizations: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def get_organization_summaries(self,
+                                   after: Optional[str] = None,
+                                   limit: int = 50,
+                                   search: Optional[str] = None) -> Dict:
+        """Page through organization_summaries; same paging contract as list_organizations"""
+        try:
+            return self._fetch_name_page('organization_summaries', after, limit, search, SUMMARY_COLUMNS)
+        except Exception as e:
+            self.logger.error(f"Error listing organization summaries: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def _fetch_name_page(self, table: str, after: Optional[str], limit: int, search: Optional[str], columns: str) -> Dict:
+        """One keyset page of a table with a unique name column, ordered by name"""
+        fields = [field.strip() for field in columns.split(",")]
+        if "name" not in fields:
+            fields.insert(0, "name")
+
+        conditions, params = [], []
+        if search:
+            conditions.append(sql.SQL("name ILIKE %s"))
+            params.append(f"%{search}%")
+        count_where = sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL("")
+        if after is not None:
+            conditions.append(sql.SQL("name > %s"))
+        page_where = sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions) if conditions else sql.SQL("")
+
+        # One extra row tells whether a next page exists without a second query
+        page_query = sql.SQL("SELECT {} FROM {}{} ORDER BY name LIMIT %s").format(
+            sql.SQL(", ").join(sql.Identifier(field) for field in fields), sql.Identifier(table), page_where
+        )
+        with self._cursor() as cur:
+            cur.execute(page_query, params + ([after] if after is not None else []) + [limit + 1])
+            items = [_plain(row) for row in cur.fetchall()]
+            total = None
+            if after is None:
+                cur.execute(
+                    sql.SQL("SELECT count(*) AS total FROM {}{}").format(sql.Identifier(table), count_where), params
+                )
+                total = cur.fetchone()["total"]
+        has_more = len(items) > limit
+        items = items[:limit]
+        return {
+            "items": items,
+            "next_cursor": items[-1]["name"] if has_more else None,
+            "total": total
+        }
+
+    def get_organization_by_name(self, name: str) -> Optional[Dict]:
+        """Fetch organization by name"""
+        try:
+            rows = self._prepared("organization_by_name", name)
+            return rows[0] if rows else None
+        except Exception as e:
+            self.logger.error(f"Error fetching organization by name: {e}")
+            return None
+
+    def _upsert_organization(self, org_data: Dict) -> Optional[Dict]:
+        fields = list(org_data)
+        updates = [field for field in fields if field != "name"]
+        query = sql.SQL("INSERT INTO organizations ({}) VALUES ({}) ON CONFLICT (name) DO {} RETURNING {}").format(
+            sql.SQL(", ").join(sql.Identifier(field) for field in fields),
+            sql.SQL(", ").join(sql.Placeholder() for _ in fields),
+            sql.SQL("UPDATE SET ") + sql.SQL(", ").join(
+                sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(field)) for field in updates
+            ) if updates else sql.SQL("UPDATE SET name = EXCLUDED.name"),
+            sql.SQL(ORGANIZATION_COLUMNS)
+        )
+        rows = self._query(query, [org_data[field] for field in fields])
+        return rows[0] if rows else None
+
+    def add_organization(self, org_data: Dict) -> Optional[Dict]:
+        """Add an organization, updating the existing row if the name is already taken"""
+        try:
+            return self._upsert_organization(org_data)
+        except Exception as e:
+            self.logger.error(f"Error adding organization: {e}")
+            return None
+
+    def add_leader(self, leader_data: Dict) -> Optional[Dict]:
+        """Add a new leader"""
+        try:
+            leader_data = self._with_organization_id(leader_data)
+            query = sql.SQL("INSERT INTO leaders ({}) VALUES ({}) RETURNING {}").format(
+                sql.SQL(", ").join(sql.Identifier(field) for field in leader_data),
+                sql.SQL(", ").join(sql.Placeholder() for _ in leader_data),
+                sql.SQL(LEADER_ROW_COLUMNS)
+            )
+            rows = self._query(query, list(leader_data.values()))
+            return rows[0] if rows else None
+        except Exception as e:
+            self.logger.error(f"Error adding leader: {e}")
+            return None
+
+    def get_leaders_by_organization(self, organization_name: str) -> List[Dict]:
+        """Fetch all leaders for a specific organization"""
+        try:
+            return self._prepared("leaders_by_organization", organization_name)
+        except Exception as e:
+            self.logger.error(f"Error fetching leaders for organization: {e}")
+            return []
+
+    def update_organization(self, name: str, update_data: Dict) -> Optional[Dict]:
+        """Update an existing organization; returns None when no organization has that name"""
+        try:
+            if not update_data:
+                rows = self._prepared("organization_by_name", name)
+                return rows[0] if rows else None
+            query = sql.SQL("UPDATE organizations SET {} WHERE name = %s RETURNING {}").format(
+                sql.SQL(", ").join(
+                    sql.SQL("{} = %s").format(sql.Identifier(field)) for field in update_data
+                ),
+                sql.SQL(ORGANIZATION_COLUMNS)
+            )
+            rows = self._query(query, list(update_data.values()) + [name])
+            return rows[0] if rows else None
+        except Exception as e:
+            self.logger.error(f"Error updating organization: {e}")
+            return None
+
+    def delete_organization(self, name: str) -> bool:
+        """Delete an organization; its leaders and news go with it (ON DELETE CASCADE)"""
+        try:
+            return bool(self._query("DELETE FROM organizations WHERE name = %s RETURNING id", (name,)))
+        except Exception as e:
+            self.logger.error(f"Error deleting organization: {e}")
+            return False
+
+    def search_organizations(self, search_term: str) -> List[Dict]:
+        """Search organizations by name, description, or ideology"""
+        try:
+            query = f"%{search_term}%"
+            return self._query(
+                f"SELECT {ORGANIZATION_COLUMNS} FROM organizations "
+                "WHERE name ILIKE %s OR description ILIKE %s OR ideology ILIKE %s",
+                (query, query, query)
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching organizations: {e}")
+            return []
+
+    def search_members(self, search_term: str) -> List[Dict]:
+        """Search leaders/members by name or position"""
+        try:
+            query = f"%{search_term}%"
+            return self._query(
+                f"SELECT {LEADER_ROW_COLUMNS}, "
+                "(SELECT name FROM organizations o WHERE o.id = leaders.organization_id) AS organization_name "
+                "FROM leaders WHERE name ILIKE %s OR position ILIKE %s",
+                (query, query)
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching members: {e}")
+            return []
+
+    def search_directory(self, search_term: str, limit: int = 20, offset: int = 0) -> Dict:
+        """Ranked full-text search over organizations and leaders through search_directory()"""
+        try:
+            rows = self._prepared("search_directory", search_term, limit, offset)
+            return {"results": rows, "total": rows[0]["total_count"] if rows else 0}
+        except Exception as e:
+            self.logger.error(f"Error in search_directory: {e}")
+            return {"results": [], "total": 0}
+
+    def get_organization_members(self, organization_name: str) -> List[Dict]:
+        """Get all members/leaders for a specific organization"""
+        return self.get_leaders_by_organization(organization_name)
+
+    def get_organization_news(self, org_name: str, since: Optional[datetime] = None) -> List[Dict]:
+        """Get news articles for an organization, newest first; `since` skips older partitions"""
+        try:
+            news = self._prepared("news_by_organization", org_name, since or news_window_start())
+            self.logger.info(f"Retrieved {len(news)} news articles for {org_name}")
+            return news
+        except Exception as e:
+            self.logger.error(f"Error fetching organization news: {str(e)}")
+            return []
+
+    def get_news_between(self, start: datetime, end: datetime, limit: int = 100) -> List[Dict]:
+        """News published in [start, end) across all organizations, newest first, with organization_name"""
+        try:
+            return self._prepared("news_between", start, end, limit)
+        except Exception as e:
+            self.logger.error(f"Error fetching news between {start} and {end}: {str(e)}")
+            return []
+
+    def get_news_history(self, org_name: str) -> List[Dict]:
+        """Monthly article counts and headlines kept for news past retention, newest month first"""
+        try:
+            return self._prepared("news_history", org_name)
+        except Exception as e:
+            self.logger.error(f"Error fetching news history: {str(e)}")
+            return []
+
+    def maintain_news(self, retention_months: Optional[int] = None, archive: bool = False) -> Dict:
+        """Create upcoming news partitions and compact old news with the maintain_news_partitions function"""
+        with self._cursor() as cur:
+            cur.execute(
+                "SELECT maintain_news_partitions(retention_months => %s, archive => %s) AS result",
+                (retention_months, archive)
+            )
+            result = cur.fetchone()["result"]
+        self.logger.info(f"News maintenance: {result}")
+        return result
@@ -0,0 +1,41 @@
+import os
+import streamlit as st
+from groq import Groq
+from websearcher import WebSearcher
+from storage_backend import StorageBackend, create_database_manager
+from data_processor import DataProcessor
+from organization_searcher import OrganizationSearcher
+
+# Shared clients, created once per process and reused by every session and rerun.
+# st.cache_resource keeps a single instance, so the underlying HTTP connection
+# pools and the database schema check are not rebuilt on each widget interaction.
+
+
+@st.cache_resource(show_spinner=False)
+def get_groq_client() -> Groq:
+    """Return the shared Groq client"""
+    return Groq(api_key=os.getenv('GROQ_API_KEY'))
+
+
+@st.cache_resource(show_spinner=False)
+def get_web_searcher() -> WebSearcher:
+    """Return the shared web searcher"""
+    return WebSearcher()
+
+
+@st.cache_resource(show_spinner="Connecting to database...")
+def get_database_manager() -> StorageBackend:
+    """Return the shared storage backend chosen by STORAGE_BACKEND; the schema check runs on first use only"""
+    return create_database_manager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_data_processor() -> DataProcessor:
+    """Return the shared data processor"""
+    return DataProcessor(groq_client=get_groq_client())
+
+
+@st.cache_resource(show_spinner=False)
+def get_org_searcher() -> OrganizationSearcher:
+    """Return the shared organization searcher"""
+    return OrganizationSearcher()
@@ -0,0 +1,142 @@
+import logging
+import os
+import re
+import threading
+from typing import List, Optional, Set, Tuple
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "supabase", "migrations")
+
+# Files are named <version>_<name>.sql, e.g. 20250104162955_create_tables.sql
+MIGRATION_FILE = re.compile(r"^(\d+)_(.+)\.sql$")
+
+# Creates schema_version and exec_sql; the runner cannot apply anything before it has run
+BOOTSTRAP_VERSION = "20261015140000"
+
+
+class MigrationRunner:
+    """Applies pending files from supabase/migrations and records them in schema_version.
+
+    Pending files are executed through the exec_sql RPC, which is restricted to the
+    service role. With any other key the runner only verifies the schema and logs
+    which migrations still need to be applied (e.g. with `supabase db push`).
+
+    exec_sql and schema_version both come from the bootstrap migration, so a database
+    that does not have them yet must be brought up to that version with the Supabase CLI.
+    When schema_version cannot be read the state is unknown and nothing is applied.
+    """
+
+    def __init__(self, supabase, migrations_dir: str = MIGRATIONS_DIR):
+        self.supabase = supabase
+        self.migrations_dir = migrations_dir
+        self.logger = logging.getLogger(__name__)
+
+    def available(self) -> List[Tuple[str, str, str]]:
+        """(version, name, path) for every migration file, oldest first"""
+        migrations = []
+        for filename in sorted(os.listdir(self.migrations_dir)):
+            match = MIGRATION_FILE.match(filename)
+            if match:
+                migrations.append((match.group(1), match.group(2), os.path.join(self.migrations_dir, filename)))
+        return migrations
+
+    def applied_versions(self) -> Set[str]:
+        """Versions recorded in schema_version; raises if the table does not exist"""
+        response = self.supabase.table('schema_version').select("version").execute()
+        return {row["version"] for row in response.data or []}
+
+    def pending(self) -> Optional[List[Tuple[str, str, str]]]:
+        """Migrations not recorded in schema_version, or None when that cannot be determined"""
+        try:
+            applied = self.applied_versions()
+        except Exception as e:
+            self.logger.warning(f"schema_version not readable, schema state unknown: {e}")
+            return None
+        return [migration for migration in self.available() if migration[0] not in applied]
+
+    def check_can_apply(self, pending: Optional[List[Tuple[str, str, str]]]):
+        """Raise unless the applied versions are known and exec_sql exists"""
+        if pending is None:
+            raise RuntimeError("schema_version is not readable; apply migrations with `supabase db push`")
+        if any(version <= BOOTSTRAP_VERSION for version, _, _ in pending):
+            raise RuntimeError(
+                f"migrations up to {BOOTSTRAP_VERSION} (which creates exec_sql) are missing; "
+                "apply them with `supabase db push`"
+            )
+
+    def apply(self, version: str, name: str, path: str):
+        """Run one migration file and record it in the same exec_sql call (one transaction)"""
+        with open(path, encoding='utf-8') as f:
+            migration_sql = f.read()
+        safe_name = name.replace("'", "''")
+        sql = migration_sql + (
+            "\nINSERT INTO schema_version (version, name) "
+            f"VALUES ('{version}', '{safe_name}') ON CONFLICT (version) DO NOTHING;\n"
+        )
+        self.supabase.rpc('exec_sql', {'query': sql}).execute()
+        self.logger.info(f"Applied migration {version}_{name}")
+
+    def run(self) -> List[str]:
+        """Apply every pending migration in order; returns the versions applied"""
+        pending = self.pending()
+        self.check_can_apply(pending)
+        applied = []
+        for version, name, path in pending:
+            self.apply(version, name, path)
+            applied.append(version)
+        return applied
+
+
+# Result of the one-time schema check; None until it has run in this process
+_schema_ok = None
+_schema_lock = threading.Lock()
+
+
+def ensure_schema(supabase, auto_migrate: bool = None) -> bool:
+    """Check (and, if allowed, migrate) the schema once per process.
+
+    Returns True when no migrations are pending. Failures are logged rather than raised
+    so the app keeps working against an older schema.
+    """
+    global _schema_ok
+    if auto_migrate is None:
+        auto_migrate = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"
+
+    with _schema_lock:
+        if _schema_ok is not None:
+            return _schema_ok
+
+        logger = logging.getLogger(__name__)
+        runner = MigrationRunner(supabase)
+        pending = runner.pending()
+        if pending is None:
+            _schema_ok = False
+            return _schema_ok
+
+        versions = [version for version, _, _ in pending]
+        _schema_ok = not pending
+
+        if pending and not auto_migrate:
+            logger.warning(f"Database schema is missing migrations: {versions}")
+        elif pending:
+            try:
+                runner.check_can_apply(pending)
+                for version, name, path in pending:
+                    runner.apply(version, name, path)
+                _schema_ok = True
+            except Exception as e:
+                logger.warning(
+                    f"Could not apply migrations {versions} ({e}); "
+                    "apply them with `supabase db push` or a service role key"
+                )
+        return _schema_ok
+
+
+if __name__ == "__main__":
+    # Apply pending migrations from the command line using the Streamlit secrets
+    import streamlit as st
+    from supabase import create_client
+
+    logging.basicConfig(level=logging.INFO)
+    client = create_client(st.secrets["SUPABASE_URL"], st.secrets["SUPABASE_KEY"])
+    applied = MigrationRunner(client).run()
+    print(f"Applied {len(applied)} migration(s): {applied}" if applied else "Schema is up to date")
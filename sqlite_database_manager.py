@@ -0,0 +1,855 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional
+from dateutil.relativedelta import relativedelta
+from date_utils import format_timestamp, parse_publication_date
+from storage_backend import (StorageBackend, ORGANIZATION_COLUMNS, LEADER_COLUMNS, NEWS_COLUMNS, SUMMARY_COLUMNS,
+                             NEWS_DERIVED_FIELDS, UNDATED_PUBLICATION_DATE, news_window_start)
+
+ORGANIZATION_FIELDS = ("name", "description", "ideology", "founding_date", "headquarters", "website")
+LEADER_FIELDS = ("name", "position", "organization_id", "background", "education",
+                 "political_history", "achievements", "source_url")
+NEWS_FIELDS = ("title", "content", "source_url", "publication_date", "publication_date_raw", "organization_id")
+
+# Version 1: the tables as in supabase/migrations at the time, plus external-content
+# FTS5 indexes kept in sync by triggers
+SQLITE_SCHEMA_V1 = """
+CREATE TABLE IF NOT EXISTS organizations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT,
+    ideology TEXT,
+    founding_date TEXT,
+    headquarters TEXT,
+    website TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS leaders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    position TEXT,
+    organization TEXT REFERENCES organizations(name) ON UPDATE CASCADE ON DELETE CASCADE,
+    background TEXT,
+    education TEXT,
+    political_history TEXT,
+    achievements TEXT,
+    source_url TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS news_articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT,
+    source_url TEXT,
+    publication_date TEXT,
+    organization TEXT REFERENCES organizations(name) ON UPDATE CASCADE ON DELETE CASCADE,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_leaders_organization ON leaders (organization);
+CREATE INDEX IF NOT EXISTS idx_news_articles_organization_publication_date
+    ON news_articles (organization, publication_date DESC);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS organizations_fts USING fts5(
+    name, ideology, description,
+    content='organizations', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS leaders_fts USING fts5(
+    name, position,
+    content='leaders', content_rowid='id', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS organizations_fts_insert AFTER INSERT ON organizations BEGIN
+    INSERT INTO organizations_fts (rowid, name, ideology, description)
+    VALUES (new.id, new.name, new.ideology, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS organizations_fts_delete AFTER DELETE ON organizations BEGIN
+    INSERT INTO organizations_fts (organizations_fts, rowid, name, ideology, description)
+    VALUES ('delete', old.id, old.name, old.ideology, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS organizations_fts_update AFTER UPDATE ON organizations BEGIN
+    INSERT INTO organizations_fts (organizations_fts, rowid, name, ideology, description)
+    VALUES ('delete', old.id, old.name, old.ideology, old.description);
+    INSERT INTO organizations_fts (rowid, name, ideology, description)
+    VALUES (new.id, new.name, new.ideology, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS leaders_fts_insert AFTER INSERT ON leaders BEGIN
+    INSERT INTO leaders_fts (rowid, name, position) VALUES (new.id, new.name, new.position);
+END;
+CREATE TRIGGER IF NOT EXISTS leaders_fts_delete AFTER DELETE ON leaders BEGIN
+    INSERT INTO leaders_fts (leaders_fts, rowid, name, position)
+    VALUES ('delete', old.id, old.name, old.position);
+END;
+CREATE TRIGGER IF NOT EXISTS leaders_fts_update AFTER UPDATE ON leaders BEGIN
+    INSERT INTO leaders_fts (leaders_fts, rowid, name, position)
+    VALUES ('delete', old.id, old.name, old.position);
+    INSERT INTO leaders_fts (rowid, name, position) VALUES (new.id, new.name, new.position);
+END;
+"""
+
+# Mirrors 20261015150000_integer_organization_fks.sql. SQLite cannot drop a foreign key
+# column, so both tables are rebuilt; ids are kept so the FTS index stays valid.
+SQLITE_INTEGER_ORGANIZATION_FKS = """
+CREATE TABLE leaders_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    position TEXT,
+    organization_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE,
+    background TEXT,
+    education TEXT,
+    political_history TEXT,
+    achievements TEXT,
+    source_url TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO leaders_new (id, name, position, organization_id, background, education,
+                         political_history, achievements, source_url, created_at)
+SELECT l.id, l.name, l.position, o.id, l.background, l.education,
+       l.political_history, l.achievements, l.source_url, l.created_at
+FROM leaders l LEFT JOIN organizations o ON o.name = l.organization;
+DROP TABLE leaders;
+ALTER TABLE leaders_new RENAME TO leaders;
+
+CREATE TABLE news_articles_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT,
+    source_url TEXT,
+    publication_date TEXT,
+    organization_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+INSERT INTO news_articles_new (id, title, content, source_url, publication_date, organization_id, created_at)
+SELECT n.id, n.title, n.content, n.source_url, n.publication_date, o.id, n.created_at
+FROM news_articles n LEFT JOIN organizations o ON o.name = n.organization;
+DROP TABLE news_articles;
+ALTER TABLE news_articles_new RENAME TO news_articles;
+
+CREATE INDEX idx_leaders_organization_id ON leaders (organization_id);
+CREATE INDEX idx_news_articles_organization_id_publication_date
+    ON news_articles (organization_id, publication_date DESC);
+
+CREATE TRIGGER leaders_fts_insert AFTER INSERT ON leaders BEGIN
+    INSERT INTO leaders_fts (rowid, name, position) VALUES (new.id, new.name, new.position);
+END;
+CREATE TRIGGER leaders_fts_delete AFTER DELETE ON leaders BEGIN
+    INSERT INTO leaders_fts (leaders_fts, rowid, name, position)
+    VALUES ('delete', old.id, old.name, old.position);
+END;
+CREATE TRIGGER leaders_fts_update AFTER UPDATE ON leaders BEGIN
+    INSERT INTO leaders_fts (leaders_fts, rowid, name, position)
+    VALUES ('delete', old.id, old.name, old.position);
+    INSERT INTO leaders_fts (rowid, name, position) VALUES (new.id, new.name, new.position);
+END;
+"""
+
+# News summary triggers; later migrations drop them around backfills and recreate them
+SQLITE_NEWS_SUMMARY_DELETE_TRIGGER = """
+CREATE TRIGGER news_articles_summary_delete AFTER DELETE ON news_articles BEGIN
+    UPDATE organization_summaries
+    SET news_count = news_count - 1,
+        latest_publication_date = (
+            SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+            WHERE n.organization_id = old.organization_id
+        ),
+        last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id = old.organization_id;
+END;
+"""
+SQLITE_NEWS_SUMMARY_UPDATE_TRIGGER = """
+CREATE TRIGGER news_articles_summary_update AFTER UPDATE ON news_articles BEGIN
+    UPDATE organization_summaries
+    SET news_count = (
+            SELECT count(*) FROM news_articles n WHERE n.organization_id = organization_summaries.organization_id
+        ),
+        latest_publication_date = (
+            SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+            WHERE n.organization_id = organization_summaries.organization_id
+        ),
+        last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id IN (old.organization_id, new.organization_id);
+END;
+"""
+
+# Mirrors 20261015160000_organization_summaries.sql with row-level triggers
+SQLITE_ORGANIZATION_SUMMARIES = """
+CREATE TABLE organization_summaries (
+    organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+    name TEXT NOT NULL UNIQUE,
+    ideology TEXT,
+    leader_count INTEGER NOT NULL DEFAULT 0,
+    news_count INTEGER NOT NULL DEFAULT 0,
+    latest_publication_date TEXT,
+    last_researched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO organization_summaries (organization_id, name, ideology, leader_count, news_count,
+                                    latest_publication_date, last_researched_at)
+SELECT
+    o.id,
+    o.name,
+    o.ideology,
+    (SELECT count(*) FROM leaders l WHERE l.organization_id = o.id),
+    (SELECT count(*) FROM news_articles n WHERE n.organization_id = o.id),
+    (SELECT max(n.publication_date) FROM news_articles n WHERE n.organization_id = o.id),
+    COALESCE(o.created_at, CURRENT_TIMESTAMP)
+FROM organizations o;
+
+CREATE TRIGGER organizations_summary_insert AFTER INSERT ON organizations BEGIN
+    INSERT INTO organization_summaries (organization_id, name, ideology) VALUES (new.id, new.name, new.ideology);
+END;
+CREATE TRIGGER organizations_summary_update AFTER UPDATE ON organizations BEGIN
+    UPDATE organization_summaries
+    SET name = new.name, ideology = new.ideology, last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id = new.id;
+END;
+
+CREATE TRIGGER leaders_summary_insert AFTER INSERT ON leaders BEGIN
+    UPDATE organization_summaries
+    SET leader_count = leader_count + 1, last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id = new.organization_id;
+END;
+CREATE TRIGGER leaders_summary_delete AFTER DELETE ON leaders BEGIN
+    UPDATE organization_summaries
+    SET leader_count = leader_count - 1, last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id = old.organization_id;
+END;
+CREATE TRIGGER leaders_summary_update AFTER UPDATE ON leaders BEGIN
+    UPDATE organization_summaries
+    SET leader_count = (SELECT count(*) FROM leaders l WHERE l.organization_id = organization_summaries.organization_id),
+        last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id IN (old.organization_id, new.organization_id);
+END;
+
+CREATE TRIGGER news_articles_summary_insert AFTER INSERT ON news_articles BEGIN
+    UPDATE organization_summaries
+    SET news_count = news_count + 1,
+        latest_publication_date = CASE
+            WHEN new.publication_date > '-infinity'
+                 AND (latest_publication_date IS NULL OR new.publication_date > latest_publication_date)
+            THEN new.publication_date ELSE latest_publication_date END,
+        last_researched_at = CURRENT_TIMESTAMP
+    WHERE organization_id = new.organization_id;
+END;
+""" + SQLITE_NEWS_SUMMARY_DELETE_TRIGGER + SQLITE_NEWS_SUMMARY_UPDATE_TRIGGER
+
+# Mirrors 20261015170000_typed_publication_date.sql. Dates are stored as ISO 8601 UTC text in
+# the format date_utils.format_timestamp writes, so text order is time order. Existing rows are
+# parsed with date_utils (relative dates against when the row was stored); text it cannot read
+# becomes NULL. The summary trigger is dropped for the backfill so it does not
+# touch last_researched_at.
+SQLITE_TYPED_PUBLICATION_DATE = """
+ALTER TABLE news_articles ADD COLUMN publication_date_raw TEXT;
+
+DROP TRIGGER news_articles_summary_update;
+UPDATE news_articles
+SET publication_date_raw = publication_date,
+    publication_date = parse_publication_date(publication_date, created_at);
+""" + SQLITE_NEWS_SUMMARY_UPDATE_TRIGGER + """
+UPDATE organization_summaries
+SET latest_publication_date = (
+    SELECT max(n.publication_date) FROM news_articles n
+    WHERE n.organization_id = organization_summaries.organization_id
+);
+
+CREATE INDEX idx_news_articles_publication_date ON news_articles (publication_date DESC);
+"""
+
+# Mirrors 20261015180000_partition_news_articles.sql without the partitions: articles without
+# a readable date get publication_date = '-infinity' (storage_backend.UNDATED_PUBLICATION_DATE),
+# which sorts before every ISO date and is left out of latest_publication_date. maintain_news()
+# folds old months into news_monthly_summaries (moving the articles to news_articles_archive
+# with archive=True) and raises the organization's compaction watermark; saves leave out dated
+# articles before it so re-research cannot count them twice.
+SQLITE_NEWS_RETENTION = """
+DROP TRIGGER news_articles_summary_update;
+UPDATE news_articles SET publication_date = '-infinity' WHERE publication_date IS NULL;
+""" + SQLITE_NEWS_SUMMARY_UPDATE_TRIGGER + """
+UPDATE organization_summaries
+SET latest_publication_date = (
+    SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+    WHERE n.organization_id = organization_summaries.organization_id
+);
+
+CREATE TABLE news_monthly_summaries (
+    organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    month TEXT NOT NULL,
+    article_count INTEGER NOT NULL,
+    first_publication_date TEXT NOT NULL,
+    latest_publication_date TEXT NOT NULL,
+    headlines TEXT NOT NULL DEFAULT '[]',
+    PRIMARY KEY (organization_id, month)
+);
+
+CREATE TABLE news_articles_archive AS SELECT * FROM news_articles WHERE 0;
+
+CREATE TABLE news_compaction_watermarks (
+    organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+    compacted_before TEXT NOT NULL
+);
+"""
+
+# Applied in order; PRAGMA user_version records how many have run on a database file
+SQLITE_MIGRATIONS = [
+    SQLITE_SCHEMA_V1,
+    SQLITE_INTEGER_ORGANIZATION_FKS,
+    SQLITE_ORGANIZATION_SUMMARIES,
+    SQLITE_TYPED_PUBLICATION_DATE,
+    SQLITE_NEWS_RETENTION,
+]
+
+# Column weights follow the setweight() labels in search_directory: A = 1.0, B = 0.4, C = 0.2
+SEARCH_DIRECTORY_SQL = """
+WITH hits AS (
+    SELECT 'organization' AS kind, o.id, o.name, o.name AS organization_name,
+           -bm25(organizations_fts, 1.0, 0.4, 0.2) AS rank
+    FROM organizations_fts JOIN organizations o ON o.id = organizations_fts.rowid
+    WHERE organizations_fts MATCH :query
+    UNION ALL
+    SELECT 'leader', l.id, l.name, o.name, -bm25(leaders_fts, 1.0, 0.4)
+    FROM leaders_fts
+    JOIN leaders l ON l.id = leaders_fts.rowid
+    LEFT JOIN organizations o ON o.id = l.organization_id
+    WHERE leaders_fts MATCH :query
+)
+SELECT kind, id, name, organization_name, rank, count(*) OVER () AS total_count
+FROM hits
+ORDER BY rank DESC, kind DESC, name, id
+LIMIT :limit OFFSET :offset
+"""
+
+
+def _sqlite_publication_date(raw: Optional[str], created_at: Optional[str]) -> Optional[str]:
+    """parse_publication_date for migrations, resolving relative dates against when the row was stored"""
+    try:
+        stored = datetime.fromisoformat(created_at).replace(tzinfo=timezone.utc) if created_at else None
+    except ValueError:
+        stored = None
+    parsed = parse_publication_date(raw, now=stored)
+    return format_timestamp(parsed) if parsed else None
+
+
+class SQLiteDatabaseManager(StorageBackend):
+    """DatabaseManager on an embedded SQLite file, for single-node deployments and offline runs.
+
+    Needs no network or Supabase credentials. search_directory uses FTS5 with bm25 ranking
+    in place of the Postgres full-text search function.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path or os.getenv("SQLITE_PATH", os.path.join("data", "research.sqlite3"))
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # One connection shared by Streamlit's script threads; the lock serializes access
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.create_function("parse_publication_date", 2, _sqlite_publication_date, deterministic=True)
+        self._migrate()
+        self.conn.execute("PRAGMA foreign_keys=ON")
+
+    def _migrate(self):
+        """Apply the SQLITE_MIGRATIONS this file has not seen yet, each in its own transaction"""
+        # Runs before foreign keys are enabled so tables can be rebuilt
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(SQLITE_MIGRATIONS[version:], start=version + 1):
+            self.conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {number};\nCOMMIT;")
+            self.logger.info(f"Applied SQLite migration {number}")
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    def _query(self, sql: str, params=()) -> List[Dict]:
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    @staticmethod
+    def _checked_fields(data: Dict, allowed: tuple) -> List[str]:
+        """Column names in data; unknown ones are rejected since they are interpolated into SQL"""
+        unknown = [field for field in data if field not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown columns: {unknown}")
+        return list(data)
+
+    def _upsert_organization(self, conn: sqlite3.Connection, org_data: Dict) -> Dict:
+        fields = self._checked_fields(org_data, ORGANIZATION_FIELDS)
+        updates = [field for field in fields if field != "name"]
+        sql = f"INSERT INTO organizations ({', '.join(fields)}) VALUES ({', '.join('?' for _ in fields)})"
+        if updates:
+            # Skip the row rewrite (and FTS reindex) when nothing changed
+            sql += (
+                " ON CONFLICT (name) DO UPDATE SET "
+                + ", ".join(f"{field} = excluded.{field}" for field in updates)
+                + " WHERE " + " OR ".join(f"organizations.{field} IS NOT excluded.{field}" for field in updates)
+            )
+        else:
+            sql += " ON CONFLICT (name) DO NOTHING"
+        conn.execute(sql, [org_data[field] for field in fields])
+        return dict(conn.execute("SELECT * FROM organizations WHERE name = ?", (org_data["name"],)).fetchone())
+
+    def _sync_rows(self,
+                   conn: sqlite3.Connection,
+                   table: str,
+                   org_id: int,
+                   incoming: List[Dict],
+                   key_fn: Callable[[Dict], str],
+                   defaults: Optional[Dict] = None,
+                   derived: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+        """Apply only the inserts, updates and deletes needed to make stored rows match incoming"""
+        fields = list(incoming[0])
+        existing = [
+            dict(row) for row in conn.execute(
+                f"SELECT id, {', '.join(fields)} FROM {table} WHERE organization_id = ?", (org_id,)
+            )
+        ]
+        to_insert, to_update, to_delete = self._diff_rows(existing, incoming, key_fn, fields, defaults, derived)
+
+        conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in to_delete])
+        conn.executemany(
+            f"UPDATE {table} SET {', '.join(f'{field} = ?' for field in fields)} WHERE id = ?",
+            [[changes[field] for field in fields] + [row_id] for row_id, changes in to_update]
+        )
+        if to_insert:
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(fields)}, organization_id) "
+                f"VALUES ({', '.join('?' for _ in fields)}, ?)",
+                [[record.get(field) for field in fields] + [org_id] for record in to_insert]
+            )
+        return {"inserted": len(to_insert), "updated": len(to_update), "deleted": len(to_delete)}
+
+    def _save_bundle(self, bundle: Dict) -> Dict:
+        """Same contract as the save_organization_bundle database function"""
+        empty = {"inserted": 0, "updated": 0, "deleted": 0}
+        with self._transaction() as conn:
+            organization = self._upsert_organization(conn, bundle["organization"])
+            org_id = organization["id"]
+            # Every save is a research run, even when nothing changed and no trigger fired
+            conn.execute(
+                "UPDATE organization_summaries SET last_researched_at = CURRENT_TIMESTAMP WHERE organization_id = ?",
+                (org_id,)
+            )
+            leaders = (self._sync_rows(conn, 'leaders', org_id, bundle["leaders"], self._leader_key)
+                       if bundle["leaders"] else empty)
+            watermark = conn.execute(
+                "SELECT compacted_before FROM news_compaction_watermarks WHERE organization_id = ?", (org_id,)
+            ).fetchone()
+            news = self._drop_compacted_news(bundle["news"], watermark[0] if watermark else None)
+            news = (self._sync_rows(conn, 'news_articles', org_id, news, self._news_key,
+                                    self._undated_news_defaults(), NEWS_DERIVED_FIELDS)
+                    if news else empty)
+        return {"organization": organization, "leaders": leaders, "news": news}
+
+    def save_organization_data(self, data: Dict) -> bool:
+        """Save organization data including leaders and news"""
+        return self.save_organization_bundle(data) is not None
+
+    def save_organization_bundle(self, data: Dict) -> Optional[Dict]:
+        """Save organization, leaders and news in one transaction"""
+        try:
+            bundle = self._build_records(data)
+            if bundle is None:
+                return None
+            result = self._save_bundle(bundle)
+            self.logger.info(
+                f"Saved {bundle['organization']['name']}: "
+                f"leaders {result['leaders']}, news {result['news']}"
+            )
+            return result
+        except Exception as e:
+            self.logger.error(f"Error in save_organization_bundle: {str(e)}")
+            return None
+
+    def get_organization_data(self, org_name: str) -> Dict:
+        """Get complete organization data including leaders and news"""
+        return self._organization_detail(org_name, None, None)
+
+    def get_organization_detail(self,
+                                org_name: str,
+                                news_limit: Optional[int] = 10,
+                                news_since: Optional[datetime] = None) -> Dict:
+        """Get an organization with its leaders and latest news"""
+        return self._organization_detail(org_name, news_limit, news_since or news_window_start())
+
+    def _organization_detail(self, org_name: str, news_limit: Optional[int], news_since: Optional[datetime]) -> Dict:
+        try:
+            with self._lock:
+                organization = self._query(
+                    f"SELECT {ORGANIZATION_COLUMNS} FROM organizations WHERE name = ?", (org_name,)
+                )
+                if not organization:
+                    return {}
+                org_id = organization[0]["id"]
+                leaders = self._query(
+                    f"SELECT {LEADER_COLUMNS} FROM leaders WHERE organization_id = ? ORDER BY id", (org_id,)
+                )
+                news = self._query(
+                    f"SELECT {NEWS_COLUMNS} FROM news_articles WHERE organization_id = ? "
+                    "AND publication_date >= ? ORDER BY publication_date DESC LIMIT ?",
+                    (org_id, format_timestamp(news_since) if news_since else UNDATED_PUBLICATION_DATE,
+                     -1 if news_limit is None else news_limit)
+                )
+            return {"organization": organization[0], "leaders": leaders, "news": news}
+        except Exception as e:
+            self.logger.error(f"Error retrieving organization data: {str(e)}")
+            return {}
+
+    def get_all_organizations(self) -> List[Dict]:
+        """Fetch all organizations"""
+        try:
+            return self._query("SELECT * FROM organizations ORDER BY name")
+        except Exception as e:
+            self.logger.error(f"Error fetching organizations: {e}")
+            return []
+
+    def list_organizations(self,
+                           after: Optional[str] = None,
+                           limit: int = 50,
+                           search: Optional[str] = None,
+                           columns: str = "name") -> Dict:
+        """List organizations ordered by name, one page at a time (keyset pagination on name)"""
+        try:
+            return self._fetch_name_page(
+                'organizations', ORGANIZATION_FIELDS + ("id", "created_at"), after, limit, search, columns
+            )
+        except Exception as e:
+            self.logger.error(f"Error listing organizations: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def get_organization_summaries(self,
+                                   after: Optional[str] = None,
+                                   limit: int = 50,
+                                   search: Optional[str] = None) -> Dict:
+        """Page through organization_summaries; same paging contract as list_organizations"""
+        try:
+            return self._fetch_name_page(
+                'organization_summaries', tuple(SUMMARY_COLUMNS.split(",")), after, limit, search, SUMMARY_COLUMNS
+            )
+        except Exception as e:
+            self.logger.error(f"Error listing organization summaries: {e}")
+            return {"items": [], "next_cursor": None, "total": None}
+
+    def _fetch_name_page(self,
+                         table: str,
+                         allowed: tuple,
+                         after: Optional[str],
+                         limit: int,
+                         search: Optional[str],
+                         columns: str) -> Dict:
+        """One keyset page of a table with a unique name column, ordered by name"""
+        fields = [field.strip() for field in columns.split(",")]
+        self._checked_fields(dict.fromkeys(fields), allowed)
+        if "name" not in fields:
+            fields.insert(0, "name")
+
+        where, params = [], []
+        if search:
+            where.append("name LIKE ?")
+            params.append(f"%{search}%")
+        filters = f" WHERE {' AND '.join(where)}" if where else ""
+        page_filters = f" WHERE {' AND '.join(where + ['name > ?'])}" if after is not None else filters
+
+        with self._lock:
+            # One extra row tells whether a next page exists without a second query
+            items = self._query(
+                f"SELECT {', '.join(fields)} FROM {table}{page_filters} ORDER BY name LIMIT ?",
+                params + ([after] if after is not None else []) + [limit + 1]
+            )
+            total = None
+            if after is None:
+                total = self.conn.execute(f"SELECT count(*) FROM {table}{filters}", params).fetchone()[0]
+        has_more = len(items) > limit
+        items = items[:limit]
+        return {
+            "items": items,
+            "next_cursor": items[-1]["name"] if has_more else None,
+            "total": total
+        }
+
+    def get_organization_by_name(self, name: str) -> Optional[Dict]:
+        """Fetch organization by name"""
+        try:
+            rows = self._query("SELECT * FROM organizations WHERE name = ?", (name,))
+            return rows[0] if rows else None
+        except Exception as e:
+            self.logger.error(f"Error fetching organization by name: {e}")
+            return None
+
+    def add_organization(self, org_data: Dict) -> Optional[Dict]:
+        """Add an organization, updating the existing row if the name is already taken"""
+        try:
+            with self._transaction() as conn:
+                return self._upsert_organization(conn, org_data)
+        except Exception as e:
+            self.logger.error(f"Error adding organization: {e}")
+            return None
+
+    def add_leader(self, leader_data: Dict) -> Optional[Dict]:
+        """Add a new leader"""
+        try:
+            leader_data = self._with_organization_id(leader_data)
+            fields = self._checked_fields(leader_data, LEADER_FIELDS)
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    f"INSERT INTO leaders ({', '.join(fields)}) VALUES ({', '.join('?' for _ in fields)})",
+                    [leader_data[field] for field in fields]
+                )
+                return dict(conn.execute("SELECT * FROM leaders WHERE id = ?", (cursor.lastrowid,)).fetchone())
+        except Exception as e:
+            self.logger.error(f"Error adding leader: {e}")
+            return None
+
+    def get_leaders_by_organization(self, organization_name: str) -> List[Dict]:
+        """Fetch all leaders for a specific organization"""
+        try:
+            return self._query(
+                "SELECT * FROM leaders WHERE organization_id = (SELECT id FROM organizations WHERE name = ?) "
+                "ORDER BY id",
+                (organization_name,)
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching leaders for organization: {e}")
+            return []
+
+    def update_organization(self, name: str, update_data: Dict) -> Optional[Dict]:
+        """Update an existing organization; returns None when no organization has that name"""
+        try:
+            fields = self._checked_fields(update_data, ORGANIZATION_FIELDS)
+            with self._transaction() as conn:
+                if fields:
+                    cursor = conn.execute(
+                        f"UPDATE organizations SET {', '.join(f'{field} = ?' for field in fields)} WHERE name = ?",
+                        [update_data[field] for field in fields] + [name]
+                    )
+                    if not cursor.rowcount:
+                        return None
+                row = conn.execute(
+                    "SELECT * FROM organizations WHERE name = ?", (update_data.get('name', name),)
+                ).fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            self.logger.error(f"Error updating organization: {e}")
+            return None
+
+    def delete_organization(self, name: str) -> bool:
+        """Delete an organization; its leaders and news go with it (ON DELETE CASCADE)"""
+        try:
+            with self._transaction() as conn:
+                return conn.execute("DELETE FROM organizations WHERE name = ?", (name,)).rowcount > 0
+        except Exception as e:
+            self.logger.error(f"Error deleting organization: {e}")
+            return False
+
+    def search_organizations(self, search_term: str) -> List[Dict]:
+        """Search organizations by name, description, or ideology"""
+        try:
+            query = f"%{search_term}%"
+            return self._query(
+                "SELECT * FROM organizations WHERE name LIKE ? OR description LIKE ? OR ideology LIKE ?",
+                (query, query, query)
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching organizations: {e}")
+            return []
+
+    def search_members(self, search_term: str) -> List[Dict]:
+        """Search leaders/members by name or position"""
+        try:
+            query = f"%{search_term}%"
+            return self._query(
+                "SELECT l.*, o.name AS organization_name FROM leaders l "
+                "LEFT JOIN organizations o ON o.id = l.organization_id "
+                "WHERE l.name LIKE ? OR l.position LIKE ?",
+                (query, query)
+            )
+        except Exception as e:
+            self.logger.error(f"Error searching members: {e}")
+            return []
+
+    @staticmethod
+    def _fts_query(search_term: str) -> str:
+        """Quote every word so user input cannot use (or break) FTS5 query syntax; each word matches as a prefix"""
+        return " ".join(f'"{word}"*' for word in re.findall(r"\w+", search_term))
+
+    def search_directory(self, search_term: str, limit: int = 20, offset: int = 0) -> Dict:
+        """Ranked full-text search over organizations and leaders.
+
+        Returns the same shape as DatabaseManager.search_directory.
+        """
+        try:
+            query = self._fts_query(search_term)
+            if not query:
+                return {"results": [], "total": 0}
+
+            with self._lock:
+                hits = self._query(SEARCH_DIRECTORY_SQL, {
+                    "query": query, "limit": max(limit, 0), "offset": max(offset, 0)
+                })
+                details = {}
+                for kind, table in (("organization", "organizations"), ("leader", "leaders")):
+                    ids = [hit["id"] for hit in hits if hit["kind"] == kind]
+                    if ids:
+                        rows = self._query(
+                            f"SELECT * FROM {table} WHERE id IN ({', '.join('?' for _ in ids)})", ids
+                        )
+                        details.update({(kind, row["id"]): row for row in rows})
+
+            results = []
+            for hit in hits:
+                row = details[(hit["kind"], hit["id"])]
+                if hit["kind"] == "leader":
+                    row = {**row, "organization_name": hit["organization_name"]}
+                results.append({**hit, "details": row})
+            return {"results": results, "total": hits[0]["total_count"] if hits else 0}
+        except Exception as e:
+            self.logger.error(f"Error in search_directory: {e}")
+            return {"results": [], "total": 0}
+
+    def get_organization_members(self, organization_name: str) -> List[Dict]:
+        """Get all members/leaders for a specific organization"""
+        return self.get_leaders_by_organization(organization_name)
+
+    def get_organization_news(self, org_name: str, since: Optional[datetime] = None) -> List[Dict]:
+        """Get news articles for an organization, newest first"""
+        try:
+            query = "SELECT * FROM news_articles WHERE organization_id = (SELECT id FROM organizations WHERE name = ?)"
+            query += " AND publication_date >= ? ORDER BY publication_date DESC"
+            news = self._query(query, [org_name, format_timestamp(since or news_window_start())])
+            self.logger.info(f"Retrieved {len(news)} news articles for {org_name}")
+            return news
+        except Exception as e:
+            self.logger.error(f"Error fetching organization news: {str(e)}")
+            return []
+
+    def get_news_between(self, start: datetime, end: datetime, limit: int = 100) -> List[Dict]:
+        """News published in [start, end) across all organizations, newest first, with organization_name"""
+        try:
+            return self._query(
+                "SELECT n.id, n.title, n.content, n.source_url, n.publication_date, n.publication_date_raw, "
+                "o.name AS organization_name FROM news_articles n "
+                "JOIN organizations o ON o.id = n.organization_id "
+                "WHERE n.publication_date >= ? AND n.publication_date < ? "
+                "ORDER BY n.publication_date DESC LIMIT ?",
+                (format_timestamp(start), format_timestamp(end), limit)
+            )
+        except Exception as e:
+            self.logger.error(f"Error fetching news between {start} and {end}: {str(e)}")
+            return []
+
+    def get_news_history(self, org_name: str) -> List[Dict]:
+        """Monthly article counts and headlines kept for news past retention, newest month first"""
+        try:
+            rows = self._query(
+                "SELECT month, article_count, first_publication_date, latest_publication_date, headlines "
+                "FROM news_monthly_summaries "
+                "WHERE organization_id = (SELECT id FROM organizations WHERE name = ?) ORDER BY month DESC",
+                (org_name,)
+            )
+            return [{**row, "headlines": json.loads(row["headlines"])} for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error fetching news history: {str(e)}")
+            return []
+
+    def maintain_news(self, retention_months: Optional[int] = None, archive: bool = False) -> Dict:
+        """Compact news older than `retention_months` whole months; there are no partitions to create"""
+        if retention_months is None:
+            return {"partitions": [], "compacted": None}
+
+        month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        cutoff = format_timestamp(month_start - relativedelta(months=retention_months))
+        # Undated articles are not summarized; they expire once first stored before the cutoff
+        expired = "publication_date < :cutoff AND (publication_date > '-infinity' OR created_at < datetime(:cutoff))"
+        with self._transaction() as conn:
+            monthly = conn.execute(
+                "SELECT organization_id, month, count(*) AS article_count, "
+                "min(publication_date) AS first_publication_date, "
+                "max(publication_date) AS latest_publication_date, "
+                "json_group_array(json_array(publication_date, title)) FILTER (WHERE rank <= 5) AS headlines "
+                "FROM (SELECT organization_id, title, publication_date, "
+                "      substr(publication_date, 1, 7) || '-01' AS month, "
+                "      row_number() OVER (PARTITION BY organization_id, substr(publication_date, 1, 7) "
+                "                         ORDER BY publication_date DESC) AS rank "
+                "      FROM news_articles WHERE publication_date > '-infinity' AND publication_date < ? "
+                "      AND organization_id IS NOT NULL) "
+                "GROUP BY organization_id, month",
+                (cutoff,)
+            ).fetchall()
+            # Saves skip articles before the organization's watermark; this merge only matters
+            # after retention_months was lowered
+            conn.executemany(
+                "INSERT INTO news_monthly_summaries (organization_id, month, article_count, "
+                "first_publication_date, latest_publication_date, headlines) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (organization_id, month) DO UPDATE SET "
+                "article_count = article_count + excluded.article_count, "
+                "first_publication_date = min(first_publication_date, excluded.first_publication_date), "
+                "latest_publication_date = max(latest_publication_date, excluded.latest_publication_date), "
+                "headlines = (SELECT json_group_array(value) FROM (SELECT value FROM json_each(excluded.headlines) "
+                "             UNION ALL SELECT value FROM json_each(news_monthly_summaries.headlines) LIMIT 5))",
+                [
+                    (row["organization_id"], row["month"], row["article_count"], row["first_publication_date"],
+                     row["latest_publication_date"],
+                     json.dumps([title for _, title in sorted(json.loads(row["headlines"]), reverse=True)]))
+                    for row in monthly
+                ]
+            )
+
+            organization_ids = [
+                row[0] for row in conn.execute(
+                    f"SELECT DISTINCT organization_id FROM news_articles WHERE {expired}", {"cutoff": cutoff}
+                )
+            ]
+            if archive:
+                conn.execute(f"INSERT INTO news_articles_archive SELECT * FROM news_articles WHERE {expired}",
+                             {"cutoff": cutoff})
+            # Retention is not research activity: skip the per-row summary trigger and recount once
+            conn.execute("DROP TRIGGER news_articles_summary_delete")
+            removed = conn.execute(f"DELETE FROM news_articles WHERE {expired}", {"cutoff": cutoff}).rowcount
+            conn.execute(SQLITE_NEWS_SUMMARY_DELETE_TRIGGER)
+            conn.executemany(
+                "INSERT INTO news_compaction_watermarks (organization_id, compacted_before) VALUES (?, ?) "
+                "ON CONFLICT (organization_id) DO UPDATE SET "
+                "compacted_before = max(compacted_before, excluded.compacted_before)",
+                [(organization_id, cutoff) for organization_id in organization_ids if organization_id is not None]
+            )
+            conn.execute(
+                "UPDATE organization_summaries SET "
+                "news_count = (SELECT count(*) FROM news_articles n "
+                "              WHERE n.organization_id = organization_summaries.organization_id), "
+                "latest_publication_date = (SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n "
+                "                           WHERE n.organization_id = organization_summaries.organization_id) "
+                f"WHERE organization_id IN ({', '.join('?' for _ in organization_ids)})",
+                organization_ids
+            )
+
+        result = {
+            "partitions": [],
+            "compacted": {"cutoff": cutoff, "summarized_months": len(monthly), "archived": archive,
+                          "deleted_rows": removed}
+        }
+        self.logger.info(f"News maintenance: {result}")
+        return result
@@ -0,0 +1,329 @@
+import hashlib
+import os
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from date_utils import normalize_publication_date
+
+# Column projections for the detail view; avoids shipping search vectors and unused columns
+ORGANIZATION_COLUMNS = "id,name,description,ideology,founding_date,headquarters,website,created_at"
+LEADER_COLUMNS = "id,name,position,background,education,political_history,achievements,source_url"
+NEWS_COLUMNS = "id,title,content,source_url,publication_date,publication_date_raw"
+SUMMARY_COLUMNS = "organization_id,name,ideology,leader_count,news_count,latest_publication_date,last_researched_at"
+
+# Fields parsed from another field. They keep their stored value while the source text is
+# unchanged, so "3 days ago" is not re-resolved against a later save time on every resave.
+NEWS_DERIVED_FIELDS = {"publication_date": "publication_date_raw"}
+
+# publication_date of articles whose date could not be read. news_articles is partitioned on
+# publication_date, so they need a value: it sorts before every real date, lands in the default
+# partition and falls outside every date range. Readers show publication_date_raw instead.
+UNDATED_PUBLICATION_DATE = "-infinity"
+
+# Default bound on per-organization news reads, so they only scan the recent monthly partitions
+NEWS_WINDOW_DAYS = int(os.getenv("NEWS_WINDOW_DAYS", 365))
+
+
+def news_window_start(days: Optional[int] = None) -> datetime:
+    """Start of the UTC day `days` (default NEWS_WINDOW_DAYS) days ago; stable within a day for caching"""
+    start = datetime.now(timezone.utc) - timedelta(days=NEWS_WINDOW_DAYS if days is None else days)
+    return start.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class StorageBackend(ABC):
+    """Interface shared by every persistence backend used by the app and the batch CLI.
+
+    Subclasses store organizations, their leaders and news articles; the helpers here
+    turn researched data into rows and work out which stored rows a save must touch.
+    """
+
+    def invalidate_cache(self):
+        """Drop every cached read after a write; no-op for backends without a read cache"""
+
+    def _build_records(self, data: Dict) -> Optional[Dict]:
+        """Turn researched data into table rows; returns None if it cannot be saved"""
+        # Extract data
+        org_data = data.get("organization", {})
+        leaders_data = data.get("leaders", [])
+        news_data = data.get("news", [])
+
+        # Validate organization data
+        if not org_data:
+            self.logger.error("No organization data to save")
+            return None
+
+        # Ensure required fields exist
+        org_name = org_data.get("name", "").strip()
+        if not org_name:
+            self.logger.error("Organization name is required")
+            return None
+
+        # Prepare organization data
+        org_record = {
+            "name": org_name,
+            "description": org_data.get("description", ""),
+            "ideology": org_data.get("ideology", ""),
+            "founding_date": org_data.get("founded", ""),
+            "headquarters": org_data.get("headquarters", ""),
+            "website": org_data.get("website", "")
+        }
+
+        leader_records = [
+            {
+                "name": leader.get("name", ""),
+                "position": leader.get("position", ""),
+                "background": leader.get("background", "")
+            }
+            for leader in leaders_data
+        ]
+
+        news_records = [
+            {
+                "title": article.get("title", ""),
+                "content": article.get("content", ""),
+                "source_url": article.get("source_url", ""),
+                # Parsed UTC timestamp (None if unreadable) next to the text the research returned
+                "publication_date": normalize_publication_date(article.get("publication_date")),
+                "publication_date_raw": article.get("publication_date")
+            }
+            for article in news_data
+        ]
+
+        return {"organization": org_record, "leaders": leader_records, "news": news_records}
+
+    @staticmethod
+    def _leader_key(record: Dict) -> str:
+        """Natural key for a leader; mirrors leader_natural_key() in the database"""
+        name = (record.get("name") or "").strip().lower()
+        position = (record.get("position") or "").strip().lower()
+        return f"{name}|{position}"
+
+    @staticmethod
+    def _news_key(record: Dict) -> str:
+        """Natural key for a news article; mirrors news_natural_key() in the database"""
+        source_url = (record.get("source_url") or "").strip()
+        if re.match(r"^https?://", source_url, re.IGNORECASE):
+            return source_url
+        title = (record.get("title") or "").strip().lower()
+        return "md5:" + hashlib.md5(title.encode("utf-8")).hexdigest()
+
+    def _with_organization_id(self, leader_data: Dict) -> Dict:
+        """Map the {"organization": name} form of a leader to its organization_id"""
+        if "organization" not in leader_data:
+            return leader_data
+        leader_data = dict(leader_data)
+        org_name = leader_data.pop("organization")
+        organization = self.get_organization_by_name(org_name)
+        if organization is None:
+            raise ValueError(f"Unknown organization: {org_name}")
+        leader_data["organization_id"] = organization["id"]
+        return leader_data
+
+    @staticmethod
+    def _undated_news_defaults() -> Dict:
+        """Undated articles are stored with the UNDATED_PUBLICATION_DATE sentinel"""
+        return {"publication_date": UNDATED_PUBLICATION_DATE}
+
+    @staticmethod
+    def _drop_compacted_news(news: List[Dict], compacted_before: Optional[str]) -> List[Dict]:
+        """Leave out dated articles from before the organization's news_compaction_watermarks entry.
+
+        Their months are already counted in news_monthly_summaries, so storing them again would
+        count them twice at the next compaction.
+        """
+        if not compacted_before:
+            return news
+        cutoff = datetime.fromisoformat(compacted_before)
+        return [
+            article for article in news
+            if not article.get("publication_date") or datetime.fromisoformat(article["publication_date"]) >= cutoff
+        ]
+
+    @staticmethod
+    def _diff_rows(existing: List[Dict],
+                   incoming: List[Dict],
+                   key_fn: Callable[[Dict], str],
+                   fields: List[str],
+                   defaults: Optional[Dict] = None,
+                   derived: Optional[Dict[str, str]] = None) -> Tuple[List[Dict], List[Tuple[int, Dict]], List[int]]:
+        """Compare stored rows with incoming records by natural key.
+
+        Fields in `defaults` that an incoming record leaves as None take the default on
+        insert and keep their stored value on update. Fields in `derived` (field -> source
+        field) keep their stored value on update while the source field is unchanged.
+        Returns (records to insert, (id, changes) pairs to update, ids to delete).
+        """
+        defaults = defaults or {}
+        derived = derived or {}
+
+        def value(field: str, record: Dict, row: Optional[Dict]):
+            if row is not None and field in derived and record.get(derived[field]) == row.get(derived[field]):
+                return row.get(field)
+            if field in defaults and record.get(field) is None:
+                return row.get(field) if row is not None else defaults[field]
+            return record.get(field)
+
+        def values(record: Dict, row: Optional[Dict]) -> Dict:
+            return {field: value(field, record, row) for field in fields}
+
+        stored = {}
+        for row in existing:
+            stored.setdefault(key_fn(row), []).append(row)
+
+        wanted = {}
+        for record in incoming:
+            # First occurrence wins when the payload repeats a key
+            wanted.setdefault(key_fn(record), record)
+
+        to_insert = [{**record, **values(record, None)} for key, record in wanted.items() if key not in stored]
+        to_delete = [row["id"] for key, rows in stored.items() if key not in wanted for row in rows]
+        to_update = []
+        for key, rows in stored.items():
+            if key not in wanted:
+                continue
+            for row in rows:
+                changes = values(wanted[key], row)
+                if any(row.get(field) != changes[field] for field in fields):
+                    to_update.append((row["id"], changes))
+        return to_insert, to_update, to_delete
+
+    def bulk_import(self, bundles: Iterable[Dict]) -> Dict:
+        """Save many researched bundles one at a time; backends with a bulk path override this"""
+        totals = {
+            "organizations": 0,
+            "leaders": {"inserted": 0, "updated": 0, "deleted": 0},
+            "news": {"inserted": 0, "updated": 0, "deleted": 0}
+        }
+        for data in bundles:
+            result = self.save_organization_bundle(data)
+            if not result:
+                continue
+            totals["organizations"] += 1
+            for table in ("leaders", "news"):
+                for action, count in (result.get(table) or {}).items():
+                    totals[table][action] += count
+        return totals
+
+    @abstractmethod
+    def save_organization_data(self, data: Dict) -> bool:
+        """Save organization data including leaders and news"""
+
+    @abstractmethod
+    def save_organization_bundle(self, data: Dict) -> Optional[Dict]:
+        """Save organization, leaders and news in one transaction; returns per-table change counts"""
+
+    @abstractmethod
+    def get_organization_data(self, org_name: str) -> Dict:
+        """Get complete organization data including leaders and news"""
+
+    @abstractmethod
+    def get_organization_detail(self,
+                                org_name: str,
+                                news_limit: Optional[int] = 10,
+                                news_since: Optional[datetime] = None) -> Dict:
+        """Get an organization with its leaders and latest news published since `news_since`.
+
+        news_since defaults to news_window_start(); undated articles fall outside the window.
+        get_organization_data reads every article.
+        """
+
+    @abstractmethod
+    def get_all_organizations(self) -> List[Dict]:
+        """Fetch all organizations"""
+
+    @abstractmethod
+    def list_organizations(self,
+                           after: Optional[str] = None,
+                           limit: int = 50,
+                           search: Optional[str] = None,
+                           columns: str = "name") -> Dict:
+        """List organizations ordered by name as {"items", "next_cursor", "total"}"""
+
+    @abstractmethod
+    def get_organization_summaries(self,
+                                   after: Optional[str] = None,
+                                   limit: int = 50,
+                                   search: Optional[str] = None) -> Dict:
+        """Page through per-organization leader/news counts and latest activity, ordered by name"""
+
+    @abstractmethod
+    def get_organization_by_name(self, name: str) -> Optional[Dict]:
+        """Fetch organization by name"""
+
+    @abstractmethod
+    def add_organization(self, org_data: Dict) -> Optional[Dict]:
+        """Add an organization, updating the existing row if the name is already taken"""
+
+    @abstractmethod
+    def add_leader(self, leader_data: Dict) -> Optional[Dict]:
+        """Add a new leader; accepts organization_id or an organization name"""
+
+    @abstractmethod
+    def get_leaders_by_organization(self, organization_name: str) -> List[Dict]:
+        """Fetch all leaders for a specific organization"""
+
+    @abstractmethod
+    def update_organization(self, name: str, update_data: Dict) -> Optional[Dict]:
+        """Update an existing organization; returns None when no organization has that name"""
+
+    @abstractmethod
+    def delete_organization(self, name: str) -> bool:
+        """Delete an organization; its leaders and news are removed with it"""
+
+    @abstractmethod
+    def search_organizations(self, search_term: str) -> List[Dict]:
+        """Search organizations by name, description, or ideology"""
+
+    @abstractmethod
+    def search_members(self, search_term: str) -> List[Dict]:
+        """Search leaders/members by name or position"""
+
+    @abstractmethod
+    def search_directory(self, search_term: str, limit: int = 20, offset: int = 0) -> Dict:
+        """Ranked search over organizations and leaders as {"results", "total"}"""
+
+    @abstractmethod
+    def get_organization_members(self, organization_name: str) -> List[Dict]:
+        """Get all members/leaders for a specific organization"""
+
+    @abstractmethod
+    def get_organization_news(self, org_name: str, since: Optional[datetime] = None) -> List[Dict]:
+        """Get news articles for an organization, newest first, published since `since` (default news_window_start())"""
+
+    @abstractmethod
+    def get_news_between(self, start: datetime, end: datetime, limit: int = 100) -> List[Dict]:
+        """News published in [start, end) across all organizations, newest first, with organization_name"""
+
+    def get_recent_news(self, days: int = 30, limit: int = 100) -> List[Dict]:
+        """News published in the last `days` days across all organizations, newest first"""
+        end = datetime.now(timezone.utc)
+        return self.get_news_between(end - timedelta(days=days), end, limit)
+
+    @abstractmethod
+    def get_news_history(self, org_name: str) -> List[Dict]:
+        """Monthly article counts and headlines kept for news past retention, newest month first"""
+
+    @abstractmethod
+    def maintain_news(self, retention_months: Optional[int] = None, archive: bool = False) -> Dict:
+        """Create upcoming news partitions and compact news older than `retention_months` whole months.
+
+        Compacted months are summarized into news_monthly_summaries; their articles are
+        dropped, or kept in archive tables with archive=True.
+        """
+
+
+def create_database_manager(backend: Optional[str] = None) -> StorageBackend:
+    """Create the storage backend named by `backend` or STORAGE_BACKEND (supabase, postgres or sqlite)"""
+    backend = (backend or os.getenv("STORAGE_BACKEND", "supabase")).strip().lower()
+    # Imported lazily so the sqlite backend works without supabase/streamlit installed
+    if backend == "supabase":
+        from database_manager import DatabaseManager
+        return DatabaseManager()
+    if backend == "postgres":
+        from postgres_database_manager import PostgresDatabaseManager
+        return PostgresDatabaseManager()
+    if backend == "sqlite":
+        from sqlite_database_manager import SQLiteDatabaseManager
+        return SQLiteDatabaseManager()
+    raise ValueError(f"Unknown storage backend: {backend}")
@@ -0,0 +1,109 @@
+-- Query plans for the DatabaseManager read paths at 100k+ rows.
+--
+-- Usage (against a database with all migrations applied):
+--   psql "$DATABASE_URL" -f supabase/benchmarks/query_plans.sql
+--
+-- Synthetic rows are inserted inside a transaction that is rolled back at the
+-- end, so the script leaves existing data untouched. Compare the output with
+-- and without the indexes from 20261015120000_add_read_indexes.sql to see the
+-- switch from sequential scans to index scans.
+
+\timing on
+BEGIN;
+
+INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+SELECT
+    'Bench Org ' || g,
+    'Synthetic organization number ' || g || ' focused on ' || (ARRAY['trade', 'climate', 'labor', 'housing', 'health'])[1 + g % 5] || ' policy',
+    (ARRAY['Liberal', 'Conservative', 'Green', 'Socialist', 'Libertarian', 'Centrist'])[1 + g % 6],
+    (1900 + g % 120)::TEXT,
+    'City ' || (g % 500),
+    'https://example.org/' || g
+FROM generate_series(1, 100000) AS g;
+
+INSERT INTO leaders (name, position, background, organization_id)
+SELECT
+    'Leader ' || g || '-' || n,
+    (ARRAY['Chair', 'Secretary', 'Treasurer', 'Spokesperson'])[n],
+    'Synthetic background',
+    o.id
+FROM generate_series(1, 100000) AS g
+JOIN organizations o ON o.name = 'Bench Org ' || g
+CROSS JOIN generate_series(1, 3) AS n;
+
+-- Monthly partitions for the synthetic dates (2024-01 to 2025-08)
+SELECT create_news_partition(month::DATE)
+FROM generate_series(DATE '2024-01-01', DATE '2025-08-01', INTERVAL '1 month') AS month;
+
+INSERT INTO news_articles (title, content, source_url, publication_date, publication_date_raw, organization_id)
+SELECT
+    'Bench headline ' || g || '-' || n,
+    'Synthetic article body',
+    'https://news.example.org/' || g || '/' || n,
+    TIMESTAMPTZ '2024-01-01 00:00:00+00' + ((g * 7 + n) % 600) * INTERVAL '1 day',
+    to_char(DATE '2024-01-01' + (g * 7 + n) % 600, 'YYYY-MM-DD'),
+    o.id
+FROM generate_series(1, 100000) AS g
+JOIN organizations o ON o.name = 'Bench Org ' || g
+CROSS JOIN generate_series(1, 3) AS n;
+
+ANALYZE organizations;
+ANALYZE leaders;
+ANALYZE news_articles;
+ANALYZE organization_summaries;
+
+-- get_organization_summaries (Browse tab page)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM organization_summaries WHERE name > 'Bench Org 42424' ORDER BY name LIMIT 50;
+
+-- get_organization_members / get_leaders_by_organization
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM leaders
+WHERE organization_id = (SELECT id FROM organizations WHERE name = 'Bench Org 42424');
+
+-- get_organization_news
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM news_articles
+WHERE organization_id = (SELECT id FROM organizations WHERE name = 'Bench Org 42424')
+ORDER BY publication_date DESC;
+
+-- get_organization_news with since: partitions before the bound are pruned
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM news_articles
+WHERE organization_id = (SELECT id FROM organizations WHERE name = 'Bench Org 42424')
+  AND publication_date >= COALESCE(TIMESTAMPTZ '2025-06-01 00:00:00+00', '-infinity'::TIMESTAMPTZ)
+ORDER BY publication_date DESC;
+
+-- get_organization_detail (latest 10): Merge Append over the per-partition indexes
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT id, title, content, source_url, publication_date, publication_date_raw FROM news_articles
+WHERE organization_id = (SELECT id FROM organizations WHERE name = 'Bench Org 42424')
+ORDER BY publication_date DESC
+LIMIT 10;
+
+-- get_news_between / get_recent_news (30 days across all organizations)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT n.id, n.title, n.content, n.source_url, n.publication_date, n.publication_date_raw,
+       o.name AS organization_name
+FROM news_articles n
+JOIN organizations o ON o.id = n.organization_id
+WHERE n.publication_date >= TIMESTAMPTZ '2025-06-01 00:00:00+00'
+  AND n.publication_date < TIMESTAMPTZ '2025-07-01 00:00:00+00'
+ORDER BY n.publication_date DESC
+LIMIT 100;
+
+-- delete_organization (leaders and news cascade through organization_id)
+EXPLAIN (ANALYZE, BUFFERS)
+DELETE FROM organizations WHERE name = 'Bench Org 42425';
+
+-- search_organizations
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM organizations
+WHERE name ILIKE '%Org 4242%' OR description ILIKE '%Org 4242%' OR ideology ILIKE '%Org 4242%';
+
+-- search_members
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM leaders
+WHERE name ILIKE '%Leader 4242-%' OR position ILIKE '%Leader 4242-%';
+
+ROLLBACK;
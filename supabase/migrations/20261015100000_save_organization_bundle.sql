@@ -0,0 +1,81 @@
+-- news_articles is used by DatabaseManager but was never captured in a migration
+CREATE TABLE IF NOT EXISTS news_articles (
+    id SERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT,
+    source_url TEXT,
+    publication_date TEXT,
+    organization VARCHAR(255) REFERENCES organizations(name),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Save an organization together with its leaders and news in a single transaction.
+-- payload: {"organization": {...}, "leaders": [{...}], "news": [{...}]}
+-- Leaders/news are replaced only when the payload contains some, matching the
+-- client-side save path in DatabaseManager.
+CREATE OR REPLACE FUNCTION save_organization_bundle(payload JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    org JSONB := payload -> 'organization';
+    org_name TEXT := btrim(org ->> 'name');
+    saved organizations%ROWTYPE;
+    leader_count INTEGER := 0;
+    news_count INTEGER := 0;
+BEGIN
+    IF org_name IS NULL OR org_name = '' THEN
+        RAISE EXCEPTION 'Organization name is required';
+    END IF;
+
+    INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+    VALUES (
+        org_name,
+        org ->> 'description',
+        org ->> 'ideology',
+        org ->> 'founding_date',
+        org ->> 'headquarters',
+        org ->> 'website'
+    )
+    ON CONFLICT (name) DO UPDATE SET
+        description = EXCLUDED.description,
+        ideology = EXCLUDED.ideology,
+        founding_date = EXCLUDED.founding_date,
+        headquarters = EXCLUDED.headquarters,
+        website = EXCLUDED.website
+    RETURNING * INTO saved;
+
+    IF jsonb_array_length(COALESCE(payload -> 'leaders', '[]'::JSONB)) > 0 THEN
+        DELETE FROM leaders WHERE organization = org_name;
+
+        INSERT INTO leaders (name, position, background, organization)
+        SELECT
+            COALESCE(leader ->> 'name', ''),
+            leader ->> 'position',
+            leader ->> 'background',
+            org_name
+        FROM jsonb_array_elements(payload -> 'leaders') AS leader;
+        GET DIAGNOSTICS leader_count = ROW_COUNT;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'news', '[]'::JSONB)) > 0 THEN
+        DELETE FROM news_articles WHERE organization = org_name;
+
+        INSERT INTO news_articles (title, content, source_url, publication_date, organization)
+        SELECT
+            COALESCE(article ->> 'title', ''),
+            article ->> 'content',
+            article ->> 'source_url',
+            article ->> 'publication_date',
+            org_name
+        FROM jsonb_array_elements(payload -> 'news') AS article;
+        GET DIAGNOSTICS news_count = ROW_COUNT;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'organization', to_jsonb(saved),
+        'leaders', leader_count,
+        'news', news_count
+    );
+END;
+$$;
@@ -0,0 +1,169 @@
+-- Natural keys used to match incoming leaders/news against stored rows.
+-- Must stay in sync with DatabaseManager._leader_key / _news_key.
+CREATE OR REPLACE FUNCTION leader_natural_key(leader_name TEXT, leader_position TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT lower(btrim(COALESCE(leader_name, ''))) || '|' || lower(btrim(COALESCE(leader_position, '')))
+$$;
+
+-- News is keyed on its URL when it has a real one, otherwise on a hash of the title
+CREATE OR REPLACE FUNCTION news_natural_key(article_url TEXT, article_title TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT CASE
+        WHEN btrim(COALESCE(article_url, '')) ~* '^https?://' THEN btrim(article_url)
+        ELSE 'md5:' || md5(lower(btrim(COALESCE(article_title, ''))))
+    END
+$$;
+
+-- Replaces the delete-and-reinsert version: leaders and news are diffed against
+-- the stored rows by natural key, and only inserts, updates and deletes that are
+-- actually needed are applied. Unchanged rows keep their ids and are not rewritten.
+CREATE OR REPLACE FUNCTION save_organization_bundle(payload JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    org JSONB := payload -> 'organization';
+    org_name TEXT := btrim(org ->> 'name');
+    saved organizations%ROWTYPE;
+    leader_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+    news_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+BEGIN
+    IF org_name IS NULL OR org_name = '' THEN
+        RAISE EXCEPTION 'Organization name is required';
+    END IF;
+
+    INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+    VALUES (
+        org_name,
+        org ->> 'description',
+        org ->> 'ideology',
+        org ->> 'founding_date',
+        org ->> 'headquarters',
+        org ->> 'website'
+    )
+    ON CONFLICT (name) DO UPDATE SET
+        description = EXCLUDED.description,
+        ideology = EXCLUDED.ideology,
+        founding_date = EXCLUDED.founding_date,
+        headquarters = EXCLUDED.headquarters,
+        website = EXCLUDED.website
+    -- Skip the row rewrite entirely when nothing changed
+    WHERE (organizations.description, organizations.ideology, organizations.founding_date,
+           organizations.headquarters, organizations.website)
+          IS DISTINCT FROM
+          (EXCLUDED.description, EXCLUDED.ideology, EXCLUDED.founding_date,
+           EXCLUDED.headquarters, EXCLUDED.website)
+    RETURNING * INTO saved;
+
+    IF saved.id IS NULL THEN
+        SELECT * INTO saved FROM organizations WHERE name = org_name;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'leaders', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (leader_natural_key(leader ->> 'name', leader ->> 'position'))
+                leader_natural_key(leader ->> 'name', leader ->> 'position') AS natural_key,
+                COALESCE(leader ->> 'name', '') AS name,
+                leader ->> 'position' AS position,
+                leader ->> 'background' AS background
+            FROM jsonb_array_elements(payload -> 'leaders') WITH ORDINALITY AS items(leader, ordinal)
+            ORDER BY leader_natural_key(leader ->> 'name', leader ->> 'position'), ordinal
+        ),
+        removed AS (
+            DELETE FROM leaders l
+            WHERE l.organization = org_name
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = leader_natural_key(l.name, l.position)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE leaders l
+            SET name = i.name, position = i.position, background = i.background
+            FROM incoming i
+            WHERE l.organization = org_name
+              AND leader_natural_key(l.name, l.position) = i.natural_key
+              AND (l.name, l.position, l.background) IS DISTINCT FROM (i.name, i.position, i.background)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO leaders (name, position, background, organization)
+            SELECT i.name, i.position, i.background, org_name
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM leaders l
+                WHERE l.organization = org_name
+                  AND leader_natural_key(l.name, l.position) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO leader_changes;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'news', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (news_natural_key(article ->> 'source_url', article ->> 'title'))
+                news_natural_key(article ->> 'source_url', article ->> 'title') AS natural_key,
+                COALESCE(article ->> 'title', '') AS title,
+                article ->> 'content' AS content,
+                article ->> 'source_url' AS source_url,
+                article ->> 'publication_date' AS publication_date
+            FROM jsonb_array_elements(payload -> 'news') WITH ORDINALITY AS items(article, ordinal)
+            ORDER BY news_natural_key(article ->> 'source_url', article ->> 'title'), ordinal
+        ),
+        removed AS (
+            DELETE FROM news_articles n
+            WHERE n.organization = org_name
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = news_natural_key(n.source_url, n.title)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE news_articles n
+            SET title = i.title, content = i.content, source_url = i.source_url,
+                publication_date = i.publication_date
+            FROM incoming i
+            WHERE n.organization = org_name
+              AND news_natural_key(n.source_url, n.title) = i.natural_key
+              AND (n.title, n.content, n.source_url, n.publication_date)
+                  IS DISTINCT FROM (i.title, i.content, i.source_url, i.publication_date)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO news_articles (title, content, source_url, publication_date, organization)
+            SELECT i.title, i.content, i.source_url, i.publication_date, org_name
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM news_articles n
+                WHERE n.organization = org_name
+                  AND news_natural_key(n.source_url, n.title) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO news_changes;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'organization', to_jsonb(saved),
+        'leaders', leader_changes,
+        'news', news_changes
+    );
+END;
+$$;
@@ -0,0 +1,24 @@
+-- Secondary indexes for the read paths in DatabaseManager
+
+-- Leaders are always fetched per organization
+CREATE INDEX IF NOT EXISTS idx_leaders_organization
+    ON leaders (organization);
+
+-- News is fetched per organization, newest first
+CREATE INDEX IF NOT EXISTS idx_news_articles_organization_publication_date
+    ON news_articles (organization, publication_date DESC);
+
+-- Trigram indexes let the ilike '%term%' searches use an index instead of a sequential scan
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_organizations_name_trgm
+    ON organizations USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_organizations_description_trgm
+    ON organizations USING GIN (description gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_organizations_ideology_trgm
+    ON organizations USING GIN (ideology gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_leaders_name_trgm
+    ON leaders USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_leaders_position_trgm
+    ON leaders USING GIN (position gin_trgm_ops);
@@ -0,0 +1,82 @@
+-- Ranked full-text search across organizations and leaders
+
+ALTER TABLE organizations
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(name, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(ideology, '')), 'B') ||
+        setweight(to_tsvector('english', COALESCE(description, '')), 'C')
+    ) STORED;
+
+ALTER TABLE leaders
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(name, '')), 'A') ||
+        setweight(to_tsvector('english', COALESCE(position, '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_organizations_search_vector
+    ON organizations USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_leaders_search_vector
+    ON leaders USING GIN (search_vector);
+
+-- Every word of the input as a prefix ("smi" matches "Smith"), all required. Stemming
+-- still applies, and input cannot inject tsquery operators.
+CREATE OR REPLACE FUNCTION prefix_tsquery(search_query TEXT)
+RETURNS TSQUERY
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT to_tsquery('english', string_agg(quote_literal(lower(word[1])) || ':*', ' & '))
+    FROM regexp_matches(search_query, '\w+', 'g') AS word
+$$;
+
+-- One ranked, paginated result list for the Search Database tab.
+-- Each hit carries its row as JSON in `details`; total_count is the number of
+-- hits before pagination.
+CREATE OR REPLACE FUNCTION search_directory(
+    search_query TEXT,
+    page_size INTEGER DEFAULT 20,
+    page_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    kind TEXT,
+    id INTEGER,
+    name TEXT,
+    organization_name TEXT,
+    rank REAL,
+    details JSONB,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH query AS (
+        SELECT prefix_tsquery(search_query) AS tsq
+    ),
+    hits AS (
+        SELECT
+            'organization'::TEXT AS kind,
+            o.id,
+            o.name::TEXT AS name,
+            o.name::TEXT AS organization_name,
+            ts_rank_cd(o.search_vector, query.tsq) AS rank,
+            to_jsonb(o) - 'search_vector' AS details
+        FROM organizations o, query
+        WHERE o.search_vector @@ query.tsq
+        UNION ALL
+        SELECT
+            'leader'::TEXT,
+            l.id,
+            l.name::TEXT,
+            l.organization::TEXT,
+            ts_rank_cd(l.search_vector, query.tsq),
+            (to_jsonb(l) - 'search_vector') || jsonb_build_object('organization_name', l.organization)
+        FROM leaders l, query
+        WHERE l.search_vector @@ query.tsq
+    )
+    SELECT hits.kind, hits.id, hits.name, hits.organization_name, hits.rank, hits.details,
+           count(*) OVER () AS total_count
+    FROM hits
+    ORDER BY hits.rank DESC, hits.kind DESC, hits.name, hits.id
+    LIMIT GREATEST(page_size, 0)
+    OFFSET GREATEST(page_offset, 0)
+$$;
@@ -0,0 +1,43 @@
+-- Tracks which files from supabase/migrations have been applied (see schema_migrations.py)
+CREATE TABLE IF NOT EXISTS schema_version (
+    version VARCHAR(32) PRIMARY KEY,
+    name TEXT NOT NULL,
+    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- exec_sql lets the migration runner apply pending files over PostgREST.
+-- Keep any existing definition; in every case only the service role may call it.
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'exec_sql') THEN
+        CREATE FUNCTION exec_sql(query TEXT)
+        RETURNS VOID
+        LANGUAGE plpgsql
+        SECURITY DEFINER
+        SET search_path = public
+        AS $fn$
+        BEGIN
+            EXECUTE query;
+        END;
+        $fn$;
+    END IF;
+
+    REVOKE ALL ON FUNCTION exec_sql(TEXT) FROM PUBLIC;
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        REVOKE ALL ON FUNCTION exec_sql(TEXT) FROM anon, authenticated;
+    END IF;
+    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'service_role') THEN
+        GRANT EXECUTE ON FUNCTION exec_sql(TEXT) TO service_role;
+    END IF;
+END;
+$$;
+
+-- Migrations up to and including this one
+INSERT INTO schema_version (version, name) VALUES
+    ('20250104162955', 'create_tables'),
+    ('20261015100000', 'save_organization_bundle'),
+    ('20261015110000', 'diff_sync_organization_bundle'),
+    ('20261015120000', 'add_read_indexes'),
+    ('20261015130000', 'full_text_search'),
+    ('20261015140000', 'schema_version')
+ON CONFLICT (version) DO NOTHING;
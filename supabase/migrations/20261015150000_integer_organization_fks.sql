@@ -0,0 +1,244 @@
+-- Key leaders and news_articles on organizations(id) instead of the organization name.
+-- Deleting an organization now removes its leaders and news in the same statement.
+
+ALTER TABLE leaders
+    ADD COLUMN IF NOT EXISTS organization_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE;
+ALTER TABLE news_articles
+    ADD COLUMN IF NOT EXISTS organization_id INTEGER REFERENCES organizations(id) ON DELETE CASCADE;
+
+-- Backfill and drop the name columns only while they still exist, so rerunning this file
+-- cannot fail or touch the already converted tables. Dropping them takes the name foreign
+-- keys and the indexes on the name columns with them.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'leaders' AND column_name = 'organization'
+    ) THEN
+        UPDATE leaders l
+        SET organization_id = o.id
+        FROM organizations o
+        WHERE o.name = l.organization
+          AND l.organization_id IS NULL;
+        ALTER TABLE leaders DROP COLUMN organization;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'news_articles' AND column_name = 'organization'
+    ) THEN
+        UPDATE news_articles n
+        SET organization_id = o.id
+        FROM organizations o
+        WHERE o.name = n.organization
+          AND n.organization_id IS NULL;
+        ALTER TABLE news_articles DROP COLUMN organization;
+    END IF;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_leaders_organization_id
+    ON leaders (organization_id);
+CREATE INDEX IF NOT EXISTS idx_news_articles_organization_id_publication_date
+    ON news_articles (organization_id, publication_date DESC);
+
+-- Same diff sync as before, matching child rows on the organization id
+CREATE OR REPLACE FUNCTION save_organization_bundle(payload JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    org JSONB := payload -> 'organization';
+    org_name TEXT := btrim(org ->> 'name');
+    saved organizations%ROWTYPE;
+    leader_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+    news_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+BEGIN
+    IF org_name IS NULL OR org_name = '' THEN
+        RAISE EXCEPTION 'Organization name is required';
+    END IF;
+
+    INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+    VALUES (
+        org_name,
+        org ->> 'description',
+        org ->> 'ideology',
+        org ->> 'founding_date',
+        org ->> 'headquarters',
+        org ->> 'website'
+    )
+    ON CONFLICT (name) DO UPDATE SET
+        description = EXCLUDED.description,
+        ideology = EXCLUDED.ideology,
+        founding_date = EXCLUDED.founding_date,
+        headquarters = EXCLUDED.headquarters,
+        website = EXCLUDED.website
+    -- Skip the row rewrite entirely when nothing changed
+    WHERE (organizations.description, organizations.ideology, organizations.founding_date,
+           organizations.headquarters, organizations.website)
+          IS DISTINCT FROM
+          (EXCLUDED.description, EXCLUDED.ideology, EXCLUDED.founding_date,
+           EXCLUDED.headquarters, EXCLUDED.website)
+    RETURNING * INTO saved;
+
+    IF saved.id IS NULL THEN
+        SELECT * INTO saved FROM organizations WHERE name = org_name;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'leaders', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (leader_natural_key(leader ->> 'name', leader ->> 'position'))
+                leader_natural_key(leader ->> 'name', leader ->> 'position') AS natural_key,
+                COALESCE(leader ->> 'name', '') AS name,
+                leader ->> 'position' AS position,
+                leader ->> 'background' AS background
+            FROM jsonb_array_elements(payload -> 'leaders') WITH ORDINALITY AS items(leader, ordinal)
+            ORDER BY leader_natural_key(leader ->> 'name', leader ->> 'position'), ordinal
+        ),
+        removed AS (
+            DELETE FROM leaders l
+            WHERE l.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = leader_natural_key(l.name, l.position)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE leaders l
+            SET name = i.name, position = i.position, background = i.background
+            FROM incoming i
+            WHERE l.organization_id = saved.id
+              AND leader_natural_key(l.name, l.position) = i.natural_key
+              AND (l.name, l.position, l.background) IS DISTINCT FROM (i.name, i.position, i.background)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO leaders (name, position, background, organization_id)
+            SELECT i.name, i.position, i.background, saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM leaders l
+                WHERE l.organization_id = saved.id
+                  AND leader_natural_key(l.name, l.position) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO leader_changes;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'news', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (news_natural_key(article ->> 'source_url', article ->> 'title'))
+                news_natural_key(article ->> 'source_url', article ->> 'title') AS natural_key,
+                COALESCE(article ->> 'title', '') AS title,
+                article ->> 'content' AS content,
+                article ->> 'source_url' AS source_url,
+                article ->> 'publication_date' AS publication_date
+            FROM jsonb_array_elements(payload -> 'news') WITH ORDINALITY AS items(article, ordinal)
+            ORDER BY news_natural_key(article ->> 'source_url', article ->> 'title'), ordinal
+        ),
+        removed AS (
+            DELETE FROM news_articles n
+            WHERE n.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = news_natural_key(n.source_url, n.title)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE news_articles n
+            SET title = i.title, content = i.content, source_url = i.source_url,
+                publication_date = i.publication_date
+            FROM incoming i
+            WHERE n.organization_id = saved.id
+              AND news_natural_key(n.source_url, n.title) = i.natural_key
+              AND (n.title, n.content, n.source_url, n.publication_date)
+                  IS DISTINCT FROM (i.title, i.content, i.source_url, i.publication_date)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO news_articles (title, content, source_url, publication_date, organization_id)
+            SELECT i.title, i.content, i.source_url, i.publication_date, saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM news_articles n
+                WHERE n.organization_id = saved.id
+                  AND news_natural_key(n.source_url, n.title) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO news_changes;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'organization', to_jsonb(saved) - 'search_vector',
+        'leaders', leader_changes,
+        'news', news_changes
+    );
+END;
+$$;
+
+-- Leader hits take their organization name from the join on organization_id
+CREATE OR REPLACE FUNCTION search_directory(
+    search_query TEXT,
+    page_size INTEGER DEFAULT 20,
+    page_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    kind TEXT,
+    id INTEGER,
+    name TEXT,
+    organization_name TEXT,
+    rank REAL,
+    details JSONB,
+    total_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH query AS (
+        SELECT prefix_tsquery(search_query) AS tsq
+    ),
+    hits AS (
+        SELECT
+            'organization'::TEXT AS kind,
+            o.id,
+            o.name::TEXT AS name,
+            o.name::TEXT AS organization_name,
+            ts_rank_cd(o.search_vector, query.tsq) AS rank,
+            to_jsonb(o) - 'search_vector' AS details
+        FROM organizations o, query
+        WHERE o.search_vector @@ query.tsq
+        UNION ALL
+        SELECT
+            'leader'::TEXT,
+            l.id,
+            l.name::TEXT,
+            o.name::TEXT,
+            ts_rank_cd(l.search_vector, query.tsq),
+            (to_jsonb(l) - 'search_vector') || jsonb_build_object('organization_name', o.name)
+        FROM leaders l
+        CROSS JOIN query
+        LEFT JOIN organizations o ON o.id = l.organization_id
+        WHERE l.search_vector @@ query.tsq
+    )
+    SELECT hits.kind, hits.id, hits.name, hits.organization_name, hits.rank, hits.details,
+           count(*) OVER () AS total_count
+    FROM hits
+    ORDER BY hits.rank DESC, hits.kind DESC, hits.name, hits.id
+    LIMIT GREATEST(page_size, 0)
+    OFFSET GREATEST(page_offset, 0)
+$$;
+
+INSERT INTO schema_version (version, name) VALUES ('20261015150000', 'integer_organization_fks')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,119 @@
+-- One row per organization with the figures the Browse tab and dashboards need,
+-- kept current by triggers so listing never touches leaders or news_articles.
+-- last_researched_at is the last time the organization was saved (see save_organization_bundle)
+-- or any of its leaders/news changed.
+CREATE TABLE IF NOT EXISTS organization_summaries (
+    organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+    name VARCHAR(255) NOT NULL,
+    ideology VARCHAR(255),
+    leader_count INTEGER NOT NULL DEFAULT 0,
+    news_count INTEGER NOT NULL DEFAULT 0,
+    latest_publication_date TEXT,
+    last_researched_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Keyset pagination and name filters, as for organizations
+CREATE UNIQUE INDEX IF NOT EXISTS idx_organization_summaries_name
+    ON organization_summaries (name);
+
+INSERT INTO organization_summaries (organization_id, name, ideology, leader_count, news_count,
+                                    latest_publication_date, last_researched_at)
+SELECT
+    o.id,
+    o.name,
+    o.ideology,
+    (SELECT count(*) FROM leaders l WHERE l.organization_id = o.id),
+    (SELECT count(*) FROM news_articles n WHERE n.organization_id = o.id),
+    (SELECT max(n.publication_date) FROM news_articles n WHERE n.organization_id = o.id),
+    COALESCE(o.created_at::TIMESTAMPTZ, now())
+FROM organizations o
+ON CONFLICT (organization_id) DO NOTHING;
+
+-- Summary rows follow inserts and updates of organizations; deletes cascade
+CREATE OR REPLACE FUNCTION sync_organization_summary()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO organization_summaries (organization_id, name, ideology, last_researched_at)
+    VALUES (NEW.id, NEW.name, NEW.ideology, now())
+    ON CONFLICT (organization_id) DO UPDATE SET
+        name = EXCLUDED.name,
+        ideology = EXCLUDED.ideology,
+        last_researched_at = EXCLUDED.last_researched_at;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS organizations_summary ON organizations;
+CREATE TRIGGER organizations_summary
+    AFTER INSERT OR UPDATE ON organizations
+    FOR EACH ROW EXECUTE FUNCTION sync_organization_summary();
+
+-- Recount only the organizations touched by a statement. Statement-level triggers with
+-- transition tables handle a COPY or bulk upsert of thousands of rows in one pass.
+CREATE OR REPLACE FUNCTION refresh_organization_summaries(organization_ids INTEGER[])
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE organization_summaries s
+    SET leader_count = (SELECT count(*) FROM leaders l WHERE l.organization_id = s.organization_id),
+        news_count = (SELECT count(*) FROM news_articles n WHERE n.organization_id = s.organization_id),
+        latest_publication_date = (
+            SELECT max(n.publication_date) FROM news_articles n WHERE n.organization_id = s.organization_id
+        ),
+        last_researched_at = now()
+    WHERE s.organization_id = ANY(organization_ids)
+$$;
+
+CREATE OR REPLACE FUNCTION refresh_summaries_for_changed_rows()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    organization_ids INTEGER[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT organization_id) INTO organization_ids FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT organization_id) INTO organization_ids FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT organization_id) INTO organization_ids
+        FROM (SELECT organization_id FROM new_rows UNION SELECT organization_id FROM old_rows) changed;
+    END IF;
+
+    IF organization_ids IS NOT NULL THEN
+        PERFORM refresh_organization_summaries(organization_ids);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS leaders_summary_insert ON leaders;
+CREATE TRIGGER leaders_summary_insert
+    AFTER INSERT ON leaders REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+DROP TRIGGER IF EXISTS leaders_summary_update ON leaders;
+CREATE TRIGGER leaders_summary_update
+    AFTER UPDATE ON leaders REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+DROP TRIGGER IF EXISTS leaders_summary_delete ON leaders;
+CREATE TRIGGER leaders_summary_delete
+    AFTER DELETE ON leaders REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+
+DROP TRIGGER IF EXISTS news_articles_summary_insert ON news_articles;
+CREATE TRIGGER news_articles_summary_insert
+    AFTER INSERT ON news_articles REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+DROP TRIGGER IF EXISTS news_articles_summary_update ON news_articles;
+CREATE TRIGGER news_articles_summary_update
+    AFTER UPDATE ON news_articles REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+DROP TRIGGER IF EXISTS news_articles_summary_delete ON news_articles;
+CREATE TRIGGER news_articles_summary_delete
+    AFTER DELETE ON news_articles REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+
+INSERT INTO schema_version (version, name) VALUES ('20261015160000', 'organization_summaries')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,200 @@
+-- Store news publication dates as TIMESTAMPTZ so date-range queries can use an index.
+-- The text the research returned is kept in publication_date_raw; values Postgres cannot
+-- read become NULL. Clients normalize dates before saving (date_utils.py), but existing
+-- rows are converted here in SQL, so text only date_utils understands ("3 days ago")
+-- leaves them undated. The SQLite backend converts with date_utils and keeps those dates.
+SET LOCAL TimeZone = 'UTC';
+
+-- NULL instead of an error for text that is not a timestamp
+CREATE OR REPLACE FUNCTION parse_timestamptz(value TEXT)
+RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql
+STABLE
+AS $$
+BEGIN
+    RETURN NULLIF(btrim(value), '')::TIMESTAMPTZ;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$;
+
+ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS publication_date_raw TEXT;
+-- A backfill is not research activity; keep last_researched_at as it is
+ALTER TABLE news_articles DISABLE TRIGGER news_articles_summary_update;
+UPDATE news_articles SET publication_date_raw = publication_date WHERE publication_date_raw IS NULL;
+ALTER TABLE news_articles ENABLE TRIGGER news_articles_summary_update;
+
+-- Rewrites the table and rebuilds idx_news_articles_organization_id_publication_date
+ALTER TABLE news_articles
+    ALTER COLUMN publication_date TYPE TIMESTAMPTZ USING parse_timestamptz(publication_date);
+
+-- "News in the last 30 days" across all organizations
+CREATE INDEX IF NOT EXISTS idx_news_articles_publication_date
+    ON news_articles (publication_date DESC);
+
+ALTER TABLE organization_summaries
+    ALTER COLUMN latest_publication_date TYPE TIMESTAMPTZ USING NULL;
+UPDATE organization_summaries s
+SET latest_publication_date = (
+    SELECT max(n.publication_date) FROM news_articles n WHERE n.organization_id = s.organization_id
+);
+
+-- Same diff sync, parsing the incoming date and keeping the raw text. Clients resolve
+-- relative dates ("3 days ago") against the time of the save, so a stored date is kept
+-- while publication_date_raw is unchanged; otherwise every resave would move it.
+CREATE OR REPLACE FUNCTION save_organization_bundle(payload JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    org JSONB := payload -> 'organization';
+    org_name TEXT := btrim(org ->> 'name');
+    saved organizations%ROWTYPE;
+    leader_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+    news_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+BEGIN
+    IF org_name IS NULL OR org_name = '' THEN
+        RAISE EXCEPTION 'Organization name is required';
+    END IF;
+
+    INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+    VALUES (
+        org_name,
+        org ->> 'description',
+        org ->> 'ideology',
+        org ->> 'founding_date',
+        org ->> 'headquarters',
+        org ->> 'website'
+    )
+    ON CONFLICT (name) DO UPDATE SET
+        description = EXCLUDED.description,
+        ideology = EXCLUDED.ideology,
+        founding_date = EXCLUDED.founding_date,
+        headquarters = EXCLUDED.headquarters,
+        website = EXCLUDED.website
+    -- Skip the row rewrite entirely when nothing changed
+    WHERE (organizations.description, organizations.ideology, organizations.founding_date,
+           organizations.headquarters, organizations.website)
+          IS DISTINCT FROM
+          (EXCLUDED.description, EXCLUDED.ideology, EXCLUDED.founding_date,
+           EXCLUDED.headquarters, EXCLUDED.website)
+    RETURNING * INTO saved;
+
+    IF saved.id IS NULL THEN
+        SELECT * INTO saved FROM organizations WHERE name = org_name;
+    END IF;
+
+    -- Every save is a research run, even when nothing changed and no trigger fired
+    UPDATE organization_summaries SET last_researched_at = now() WHERE organization_id = saved.id;
+
+    IF jsonb_array_length(COALESCE(payload -> 'leaders', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (leader_natural_key(leader ->> 'name', leader ->> 'position'))
+                leader_natural_key(leader ->> 'name', leader ->> 'position') AS natural_key,
+                COALESCE(leader ->> 'name', '') AS name,
+                leader ->> 'position' AS position,
+                leader ->> 'background' AS background
+            FROM jsonb_array_elements(payload -> 'leaders') WITH ORDINALITY AS items(leader, ordinal)
+            ORDER BY leader_natural_key(leader ->> 'name', leader ->> 'position'), ordinal
+        ),
+        removed AS (
+            DELETE FROM leaders l
+            WHERE l.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = leader_natural_key(l.name, l.position)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE leaders l
+            SET name = i.name, position = i.position, background = i.background
+            FROM incoming i
+            WHERE l.organization_id = saved.id
+              AND leader_natural_key(l.name, l.position) = i.natural_key
+              AND (l.name, l.position, l.background) IS DISTINCT FROM (i.name, i.position, i.background)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO leaders (name, position, background, organization_id)
+            SELECT i.name, i.position, i.background, saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM leaders l
+                WHERE l.organization_id = saved.id
+                  AND leader_natural_key(l.name, l.position) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO leader_changes;
+    END IF;
+
+    IF jsonb_array_length(COALESCE(payload -> 'news', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (news_natural_key(article ->> 'source_url', article ->> 'title'))
+                news_natural_key(article ->> 'source_url', article ->> 'title') AS natural_key,
+                COALESCE(article ->> 'title', '') AS title,
+                article ->> 'content' AS content,
+                article ->> 'source_url' AS source_url,
+                parse_timestamptz(article ->> 'publication_date') AS publication_date,
+                article ->> 'publication_date_raw' AS publication_date_raw
+            FROM jsonb_array_elements(payload -> 'news') WITH ORDINALITY AS items(article, ordinal)
+            ORDER BY news_natural_key(article ->> 'source_url', article ->> 'title'), ordinal
+        ),
+        removed AS (
+            DELETE FROM news_articles n
+            WHERE n.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = news_natural_key(n.source_url, n.title)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE news_articles n
+            SET title = i.title, content = i.content, source_url = i.source_url,
+                publication_date = CASE WHEN i.publication_date_raw IS NOT DISTINCT FROM n.publication_date_raw
+                                        THEN n.publication_date
+                                        ELSE COALESCE(i.publication_date, n.publication_date) END,
+                publication_date_raw = i.publication_date_raw
+            FROM incoming i
+            WHERE n.organization_id = saved.id
+              AND news_natural_key(n.source_url, n.title) = i.natural_key
+              AND (n.title, n.content, n.source_url, n.publication_date_raw)
+                  IS DISTINCT FROM (i.title, i.content, i.source_url, i.publication_date_raw)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO news_articles (title, content, source_url, publication_date, publication_date_raw,
+                                       organization_id)
+            SELECT i.title, i.content, i.source_url, i.publication_date, i.publication_date_raw,
+                   saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM news_articles n
+                WHERE n.organization_id = saved.id
+                  AND news_natural_key(n.source_url, n.title) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO news_changes;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'organization', to_jsonb(saved) - 'search_vector',
+        'leaders', leader_changes,
+        'news', news_changes
+    );
+END;
+$$;
+
+INSERT INTO schema_version (version, name) VALUES ('20261015170000', 'typed_publication_date')
+ON CONFLICT (version) DO NOTHING;
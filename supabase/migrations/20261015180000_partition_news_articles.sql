@@ -0,0 +1,480 @@
+-- Partition news_articles by publication month and add a retention job that folds old
+-- months into news_monthly_summaries before dropping (or archiving) their partitions.
+-- publication_date becomes the partition key, so it is NOT NULL: undated articles get
+-- '-infinity', which lands them in the default partition, sorts them last and keeps them
+-- out of every date range and of latest_publication_date (publication_date_raw keeps the
+-- text). Each organization also keeps the cutoff of its last compaction, and saves leave
+-- out dated articles from before it so re-research cannot count them twice.
+SET LOCAL TimeZone = 'UTC';
+
+-- One partition per calendar month (UTC), named news_articles_pYYYYMM. Rows of that month
+-- already sitting in the default partition are moved into it.
+CREATE OR REPLACE FUNCTION create_news_partition(month_start DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+SET TimeZone = 'UTC'
+AS $$
+DECLARE
+    lower_bound DATE := date_trunc('month', month_start)::DATE;
+    upper_bound DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+    partition_name TEXT := 'news_articles_p' || to_char(month_start, 'YYYYMM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM news_articles_default
+        WHERE publication_date >= lower_bound AND publication_date < upper_bound
+    ) THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF news_articles FOR VALUES FROM (%L) TO (%L)',
+            partition_name, lower_bound, upper_bound
+        );
+        RETURN partition_name;
+    END IF;
+
+    -- Direct partition writes do not fire the summary triggers on news_articles; the
+    -- rows only change partition, so the counts stay correct
+    EXECUTE format('CREATE TABLE %I (LIKE news_articles INCLUDING DEFAULTS)', partition_name);
+    EXECUTE format(
+        'INSERT INTO %I SELECT * FROM news_articles_default '
+        'WHERE publication_date >= %L AND publication_date < %L',
+        partition_name, lower_bound, upper_bound
+    );
+    DELETE FROM news_articles_default
+    WHERE publication_date >= lower_bound AND publication_date < upper_bound;
+    EXECUTE format(
+        'ALTER TABLE news_articles ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name, lower_bound, upper_bound
+    );
+    RETURN partition_name;
+END;
+$$;
+
+-- Undated articles ('-infinity') do not count as the latest news
+CREATE OR REPLACE FUNCTION refresh_organization_summaries(organization_ids INTEGER[])
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE organization_summaries s
+    SET leader_count = (SELECT count(*) FROM leaders l WHERE l.organization_id = s.organization_id),
+        news_count = (SELECT count(*) FROM news_articles n WHERE n.organization_id = s.organization_id),
+        latest_publication_date = (
+            SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+            WHERE n.organization_id = s.organization_id
+        ),
+        last_researched_at = now()
+    WHERE s.organization_id = ANY(organization_ids)
+$$;
+
+-- Convert the table once; rerunning this file against an already partitioned
+-- news_articles leaves it (and its rows) alone
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'news_articles'::REGCLASS) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE news_articles DISABLE TRIGGER news_articles_summary_update;
+    UPDATE news_articles SET publication_date = '-infinity' WHERE publication_date IS NULL;
+    ALTER TABLE news_articles ENABLE TRIGGER news_articles_summary_update;
+
+    ALTER TABLE news_articles RENAME TO news_articles_unpartitioned;
+    ALTER TABLE news_articles_unpartitioned RENAME CONSTRAINT news_articles_pkey TO news_articles_unpartitioned_pkey;
+    DROP INDEX IF EXISTS idx_news_articles_organization_id_publication_date;
+    DROP INDEX IF EXISTS idx_news_articles_publication_date;
+
+    -- The primary key of a partitioned table must include the partition key; ids still come
+    -- from the same sequence and stay unique
+    CREATE TABLE news_articles (
+        id INTEGER NOT NULL DEFAULT nextval('news_articles_id_seq'),
+        title TEXT NOT NULL,
+        content TEXT,
+        source_url TEXT,
+        publication_date TIMESTAMPTZ NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        organization_id INTEGER,
+        publication_date_raw TEXT,
+        PRIMARY KEY (id, publication_date),
+        CONSTRAINT news_articles_organization_id_fkey
+            FOREIGN KEY (organization_id) REFERENCES organizations(id) ON DELETE CASCADE
+    ) PARTITION BY RANGE (publication_date);
+
+    ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id;
+
+    -- Rows outside every monthly partition (very old or far-future dates)
+    CREATE TABLE news_articles_default PARTITION OF news_articles DEFAULT;
+
+    -- Months that have articles, plus this month and the next three
+    PERFORM create_news_partition(month)
+    FROM (
+        SELECT DISTINCT date_trunc('month', publication_date)::DATE AS month FROM news_articles_unpartitioned
+        WHERE isfinite(publication_date)
+        UNION
+        SELECT month::DATE
+        FROM generate_series(date_trunc('month', now()), date_trunc('month', now()) + INTERVAL '3 months',
+                             INTERVAL '1 month') AS month
+    ) months
+    ORDER BY month;
+
+    INSERT INTO news_articles (id, title, content, source_url, publication_date, created_at,
+                               organization_id, publication_date_raw)
+    SELECT id, title, content, source_url, publication_date, created_at, organization_id, publication_date_raw
+    FROM news_articles_unpartitioned;
+
+    DROP TABLE news_articles_unpartitioned;
+
+    -- Created on the parent, so every partition gets them
+    CREATE INDEX IF NOT EXISTS idx_news_articles_organization_id_publication_date
+        ON news_articles (organization_id, publication_date DESC);
+    CREATE INDEX IF NOT EXISTS idx_news_articles_publication_date
+        ON news_articles (publication_date DESC);
+
+    -- The summary triggers went with the old table; statement-level triggers with transition
+    -- tables are allowed on a partitioned table and see rows routed to every partition
+    CREATE TRIGGER news_articles_summary_insert
+        AFTER INSERT ON news_articles REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+    CREATE TRIGGER news_articles_summary_update
+        AFTER UPDATE ON news_articles REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+    CREATE TRIGGER news_articles_summary_delete
+        AFTER DELETE ON news_articles REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION refresh_summaries_for_changed_rows();
+
+    UPDATE organization_summaries s
+    SET latest_publication_date = (
+        SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+        WHERE n.organization_id = s.organization_id
+    );
+END;
+$$;
+
+-- What is left of a month of news once its articles are past retention
+CREATE TABLE IF NOT EXISTS news_monthly_summaries (
+    organization_id INTEGER NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+    month DATE NOT NULL,
+    article_count INTEGER NOT NULL,
+    first_publication_date TIMESTAMPTZ NOT NULL,
+    latest_publication_date TIMESTAMPTZ NOT NULL,
+    headlines TEXT[] NOT NULL DEFAULT '{}',
+    PRIMARY KEY (organization_id, month)
+);
+
+-- Per organization, the cutoff of its last compaction
+CREATE TABLE IF NOT EXISTS news_compaction_watermarks (
+    organization_id INTEGER PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+    compacted_before TIMESTAMPTZ NOT NULL
+);
+
+-- Summarize every dated article published before the month of `cutoff`, then drop the
+-- monthly partitions entirely before it and delete the older rows of the default partition,
+-- including undated articles first stored before the cutoff month. With archive the
+-- partitions are detached and kept as news_articles_archive_pYYYYMM, and default-partition
+-- rows are moved to news_articles_archive_default. The watermark of every organization
+-- touched is raised to the cutoff month.
+CREATE OR REPLACE FUNCTION compact_news_before(cutoff DATE, archive BOOLEAN DEFAULT false)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET TimeZone = 'UTC'
+AS $$
+DECLARE
+    cutoff_month DATE := date_trunc('month', cutoff)::DATE;
+    organization_ids INTEGER[];
+    summarized INTEGER;
+    part RECORD;
+    removed_partitions TEXT[] := '{}';
+    removed_rows INTEGER;
+BEGIN
+    SELECT array_agg(DISTINCT organization_id) INTO organization_ids
+    FROM news_articles
+    WHERE publication_date < cutoff_month
+      AND (publication_date > '-infinity' OR created_at < cutoff_month);
+
+    WITH monthly AS (
+        SELECT
+            organization_id,
+            date_trunc('month', publication_date)::DATE AS month,
+            count(*) AS article_count,
+            min(publication_date) AS first_publication_date,
+            max(publication_date) AS latest_publication_date,
+            (array_agg(title ORDER BY publication_date DESC))[1:5] AS headlines
+        FROM news_articles
+        WHERE publication_date > '-infinity'
+          AND publication_date < cutoff_month
+          AND organization_id IS NOT NULL
+        GROUP BY 1, 2
+    ),
+    saved AS (
+        INSERT INTO news_monthly_summaries AS s (organization_id, month, article_count,
+                                                 first_publication_date, latest_publication_date, headlines)
+        SELECT * FROM monthly
+        -- Saves skip articles before the watermark; this merge only matters after
+        -- retention_months was lowered
+        ON CONFLICT (organization_id, month) DO UPDATE SET
+            article_count = s.article_count + EXCLUDED.article_count,
+            first_publication_date = LEAST(s.first_publication_date, EXCLUDED.first_publication_date),
+            latest_publication_date = GREATEST(s.latest_publication_date, EXCLUDED.latest_publication_date),
+            headlines = (EXCLUDED.headlines || s.headlines)[1:5]
+        RETURNING organization_id
+    )
+    SELECT count(*) INTO summarized FROM saved;
+
+    FOR part IN
+        SELECT c.relname AS name, to_date(substring(c.relname FROM '(\d{6})$'), 'YYYYMM') AS month
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = 'news_articles'::REGCLASS
+          AND c.relname ~ '^news_articles_p\d{6}$'
+        ORDER BY 2
+    LOOP
+        EXIT WHEN part.month >= cutoff_month;
+        EXECUTE format('ALTER TABLE news_articles DETACH PARTITION %I', part.name);
+        IF archive THEN
+            EXECUTE format('ALTER TABLE %I RENAME TO %I',
+                           part.name, 'news_articles_archive_' || substring(part.name FROM 'p\d{6}$'));
+        ELSE
+            EXECUTE format('DROP TABLE %I', part.name);
+        END IF;
+        removed_partitions := removed_partitions || part.name;
+    END LOOP;
+
+    -- Writing to the partition directly keeps the per-statement summary triggers quiet;
+    -- the counts are corrected below without touching last_researched_at
+    IF archive THEN
+        CREATE TABLE IF NOT EXISTS news_articles_archive_default (LIKE news_articles);
+        INSERT INTO news_articles_archive_default
+        SELECT * FROM news_articles_default
+        WHERE publication_date < cutoff_month
+          AND (publication_date > '-infinity' OR created_at < cutoff_month);
+    END IF;
+    DELETE FROM news_articles_default
+    WHERE publication_date < cutoff_month
+      AND (publication_date > '-infinity' OR created_at < cutoff_month);
+    GET DIAGNOSTICS removed_rows = ROW_COUNT;
+
+    INSERT INTO news_compaction_watermarks AS w (organization_id, compacted_before)
+    SELECT DISTINCT organization_id, cutoff_month
+    FROM unnest(organization_ids) AS organization_id
+    WHERE organization_id IS NOT NULL
+    ON CONFLICT (organization_id) DO UPDATE SET
+        compacted_before = GREATEST(w.compacted_before, EXCLUDED.compacted_before);
+
+    UPDATE organization_summaries s
+    SET news_count = (SELECT count(*) FROM news_articles n WHERE n.organization_id = s.organization_id),
+        latest_publication_date = (
+            SELECT NULLIF(max(n.publication_date), '-infinity') FROM news_articles n
+            WHERE n.organization_id = s.organization_id
+        )
+    WHERE s.organization_id = ANY(organization_ids);
+
+    RETURN jsonb_build_object(
+        'cutoff', cutoff_month,
+        'summarized_months', summarized,
+        'partitions', removed_partitions,
+        'archived', archive,
+        'default_rows', removed_rows
+    );
+END;
+$$;
+
+-- Scheduled job: keep partitions `months_ahead` months ahead of today and, when
+-- retention_months is given, compact everything older than that many whole months
+CREATE OR REPLACE FUNCTION maintain_news_partitions(
+    retention_months INTEGER DEFAULT NULL,
+    months_ahead INTEGER DEFAULT 3,
+    archive BOOLEAN DEFAULT false
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SET TimeZone = 'UTC'
+AS $$
+DECLARE
+    created TEXT[];
+    compacted JSONB;
+BEGIN
+    SELECT array_agg(create_news_partition(month::DATE)) INTO created
+    FROM generate_series(
+        date_trunc('month', now()),
+        date_trunc('month', now()) + make_interval(months => GREATEST(months_ahead, 0)),
+        INTERVAL '1 month'
+    ) AS month;
+
+    IF retention_months IS NOT NULL THEN
+        compacted := compact_news_before(
+            (date_trunc('month', now()) - make_interval(months => retention_months))::DATE,
+            archive
+        );
+    END IF;
+
+    RETURN jsonb_build_object('partitions', created, 'compacted', compacted);
+END;
+$$;
+
+-- Same diff sync; articles without a readable date are stored as '-infinity', and
+-- articles from before the organization's watermark are not stored again
+CREATE OR REPLACE FUNCTION save_organization_bundle(payload JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    org JSONB := payload -> 'organization';
+    org_name TEXT := btrim(org ->> 'name');
+    saved organizations%ROWTYPE;
+    leader_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+    news_changes JSONB := jsonb_build_object('inserted', 0, 'updated', 0, 'deleted', 0);
+    news_cutoff TIMESTAMPTZ;
+    news JSONB;
+BEGIN
+    IF org_name IS NULL OR org_name = '' THEN
+        RAISE EXCEPTION 'Organization name is required';
+    END IF;
+
+    INSERT INTO organizations (name, description, ideology, founding_date, headquarters, website)
+    VALUES (
+        org_name,
+        org ->> 'description',
+        org ->> 'ideology',
+        org ->> 'founding_date',
+        org ->> 'headquarters',
+        org ->> 'website'
+    )
+    ON CONFLICT (name) DO UPDATE SET
+        description = EXCLUDED.description,
+        ideology = EXCLUDED.ideology,
+        founding_date = EXCLUDED.founding_date,
+        headquarters = EXCLUDED.headquarters,
+        website = EXCLUDED.website
+    -- Skip the row rewrite entirely when nothing changed
+    WHERE (organizations.description, organizations.ideology, organizations.founding_date,
+           organizations.headquarters, organizations.website)
+          IS DISTINCT FROM
+          (EXCLUDED.description, EXCLUDED.ideology, EXCLUDED.founding_date,
+           EXCLUDED.headquarters, EXCLUDED.website)
+    RETURNING * INTO saved;
+
+    IF saved.id IS NULL THEN
+        SELECT * INTO saved FROM organizations WHERE name = org_name;
+    END IF;
+
+    -- Every save is a research run, even when nothing changed and no trigger fired
+    UPDATE organization_summaries SET last_researched_at = now() WHERE organization_id = saved.id;
+
+    IF jsonb_array_length(COALESCE(payload -> 'leaders', '[]'::JSONB)) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (leader_natural_key(leader ->> 'name', leader ->> 'position'))
+                leader_natural_key(leader ->> 'name', leader ->> 'position') AS natural_key,
+                COALESCE(leader ->> 'name', '') AS name,
+                leader ->> 'position' AS position,
+                leader ->> 'background' AS background
+            FROM jsonb_array_elements(payload -> 'leaders') WITH ORDINALITY AS items(leader, ordinal)
+            ORDER BY leader_natural_key(leader ->> 'name', leader ->> 'position'), ordinal
+        ),
+        removed AS (
+            DELETE FROM leaders l
+            WHERE l.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = leader_natural_key(l.name, l.position)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE leaders l
+            SET name = i.name, position = i.position, background = i.background
+            FROM incoming i
+            WHERE l.organization_id = saved.id
+              AND leader_natural_key(l.name, l.position) = i.natural_key
+              AND (l.name, l.position, l.background) IS DISTINCT FROM (i.name, i.position, i.background)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO leaders (name, position, background, organization_id)
+            SELECT i.name, i.position, i.background, saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM leaders l
+                WHERE l.organization_id = saved.id
+                  AND leader_natural_key(l.name, l.position) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO leader_changes;
+    END IF;
+
+    -- Articles from months already folded into news_monthly_summaries are not stored again
+    SELECT compacted_before INTO news_cutoff FROM news_compaction_watermarks WHERE organization_id = saved.id;
+    SELECT COALESCE(jsonb_agg(article ORDER BY ordinal), '[]'::JSONB) INTO news
+    FROM jsonb_array_elements(COALESCE(payload -> 'news', '[]'::JSONB)) WITH ORDINALITY AS items(article, ordinal)
+    WHERE NOT COALESCE(parse_timestamptz(article ->> 'publication_date') < news_cutoff, false);
+
+    IF jsonb_array_length(news) > 0 THEN
+        WITH incoming AS (
+            SELECT DISTINCT ON (news_natural_key(article ->> 'source_url', article ->> 'title'))
+                news_natural_key(article ->> 'source_url', article ->> 'title') AS natural_key,
+                COALESCE(article ->> 'title', '') AS title,
+                article ->> 'content' AS content,
+                article ->> 'source_url' AS source_url,
+                parse_timestamptz(article ->> 'publication_date') AS publication_date,
+                article ->> 'publication_date_raw' AS publication_date_raw
+            FROM jsonb_array_elements(news) WITH ORDINALITY AS items(article, ordinal)
+            ORDER BY news_natural_key(article ->> 'source_url', article ->> 'title'), ordinal
+        ),
+        removed AS (
+            DELETE FROM news_articles n
+            WHERE n.organization_id = saved.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM incoming i
+                  WHERE i.natural_key = news_natural_key(n.source_url, n.title)
+              )
+            RETURNING 1
+        ),
+        changed AS (
+            UPDATE news_articles n
+            SET title = i.title, content = i.content, source_url = i.source_url,
+                publication_date = CASE WHEN i.publication_date_raw IS NOT DISTINCT FROM n.publication_date_raw
+                                        THEN n.publication_date
+                                        ELSE COALESCE(i.publication_date, n.publication_date) END,
+                publication_date_raw = i.publication_date_raw
+            FROM incoming i
+            WHERE n.organization_id = saved.id
+              AND news_natural_key(n.source_url, n.title) = i.natural_key
+              AND (n.title, n.content, n.source_url, n.publication_date_raw)
+                  IS DISTINCT FROM (i.title, i.content, i.source_url, i.publication_date_raw)
+            RETURNING 1
+        ),
+        added AS (
+            INSERT INTO news_articles (title, content, source_url, publication_date, publication_date_raw,
+                                       organization_id)
+            SELECT i.title, i.content, i.source_url, COALESCE(i.publication_date, '-infinity'), i.publication_date_raw,
+                   saved.id
+            FROM incoming i
+            WHERE NOT EXISTS (
+                SELECT 1 FROM news_articles n
+                WHERE n.organization_id = saved.id
+                  AND news_natural_key(n.source_url, n.title) = i.natural_key
+            )
+            RETURNING 1
+        )
+        SELECT jsonb_build_object(
+            'inserted', (SELECT count(*) FROM added),
+            'updated', (SELECT count(*) FROM changed),
+            'deleted', (SELECT count(*) FROM removed)
+        ) INTO news_changes;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'organization', to_jsonb(saved) - 'search_vector',
+        'leaders', leader_changes,
+        'news', news_changes
+    );
+END;
+$$;
+
+INSERT INTO schema_version (version, name) VALUES ('20261015180000', 'partition_news_articles')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+# The modules live at the repository root, not in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_database_manager import SQLiteDatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    """A fresh, fully migrated SQLite backend that needs no Supabase credentials"""
+    manager = SQLiteDatabaseManager(":memory:")
+    yield manager
+    manager.conn.close()
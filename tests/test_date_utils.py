@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from date_utils import format_timestamp, parse_publication_date
+
+NOW = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def test_relative_dates_resolve_against_now():
+    assert parse_publication_date("3 days ago", now=NOW) == datetime(2026, 10, 12, 12, 0, tzinfo=timezone.utc)
+    assert parse_publication_date("2 months ago", now=NOW) == datetime(2026, 8, 15, 12, 0, tzinfo=timezone.utc)
+    assert parse_publication_date("Yesterday", now=NOW) == datetime(2026, 10, 14, 12, 0, tzinfo=timezone.utc)
+
+
+def test_absolute_dates_become_utc():
+    assert format_timestamp(parse_publication_date("March 5, 2024", now=NOW)) == "2024-03-05T00:00:00+00:00"
+    assert parse_publication_date("2024-03-05T10:00:00+02:00", now=NOW) == datetime(2024, 3, 5, 8, 0, tzinfo=timezone.utc)
+
+
+def test_unreadable_dates_are_none():
+    for value in (None, "", "N/A", "sometime soon"):
+        assert parse_publication_date(value, now=NOW) is None
+
+
+def test_future_dates_are_rejected():
+    assert parse_publication_date("2027-01-01", now=NOW) is None
+    # Within a day of now is allowed, to absorb time zone differences
+    assert parse_publication_date("2026-10-16T06:00:00+00:00", now=NOW) is not None
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+
+from date_utils import format_timestamp
+
+NO_CHANGES = {"inserted": 0, "updated": 0, "deleted": 0}
+
+
+def bundle(name="Example Party", news=None):
+    recent = format_timestamp(datetime.now(timezone.utc) - timedelta(days=3))
+    return {
+        "organization": {"name": name, "description": "A party", "ideology": "Centrism"},
+        "leaders": [
+            {"name": "Ada Smith", "position": "Chair", "background": "Lawyer"},
+            {"name": "Ben Jones", "position": "Treasurer"},
+        ],
+        "news": news if news is not None else [
+            {"title": "Party wins seat", "content": "...", "source_url": "https://example.com/a",
+             "publication_date": recent},
+            {"title": "Relative date", "source_url": "https://example.com/b", "publication_date": "2 days ago"},
+            {"title": "Undated", "source_url": "https://example.com/c", "publication_date": "N/A"},
+        ],
+    }
+
+
+def count(db, table):
+    return db.conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
+
+
+def test_identical_resave_changes_nothing(db):
+    first = db.save_organization_bundle(bundle())
+    assert first["leaders"]["inserted"] == 2
+    assert first["news"]["inserted"] == 3
+    stored = db.get_organization_data("Example Party")
+
+    again = db.save_organization_bundle(bundle())
+
+    assert again["leaders"] == NO_CHANGES
+    assert again["news"] == NO_CHANGES
+    # "2 days ago" keeps the date it resolved to on the first save
+    assert db.get_organization_data("Example Party") == stored
+
+
+def test_delete_cascades_to_leaders_news_and_summary(db):
+    db.save_organization_data(bundle())
+    db.save_organization_data(bundle("Other Party"))
+
+    assert db.delete_organization("Example Party")
+
+    assert db.get_organization_by_name("Example Party") is None
+    assert count(db, "leaders") == 2
+    assert count(db, "news_articles") == 3
+    assert [row["name"] for row in db.get_organization_summaries()["items"]] == ["Other Party"]
+
+
+def test_search_directory_ranks_and_pages(db):
+    for name, description in [("Green Alliance", "Environmental party"),
+                              ("Farmers Union", "Rural party with green roots"),
+                              ("Labour Front", "Trade unions")]:
+        db.save_organization_data({"organization": {"name": name, "description": description},
+                                   "leaders": [], "news": []})
+    db.save_organization_data({"organization": {"name": "Labour Front"},
+                               "leaders": [{"name": "Greta Green", "position": "Leader"}], "news": []})
+
+    first = db.search_directory("green", limit=2, offset=0)
+    second = db.search_directory("green", limit=2, offset=2)
+
+    assert first["total"] == second["total"] == 3
+    # A name hit outranks a description hit
+    assert first["results"][0]["name"] == "Green Alliance"
+    names = [hit["name"] for hit in first["results"] + second["results"]]
+    assert sorted(names) == ["Farmers Union", "Green Alliance", "Greta Green"]
+    # Words match as prefixes
+    assert db.search_directory("gre")["total"] == 3
+    assert db.search_directory("")["total"] == 0
+
+
+def test_maintain_news_watermark_skips_compacted_articles(db):
+    old_news = [
+        {"title": "Old story", "source_url": "https://example.com/old1", "publication_date": "2020-03-05"},
+        {"title": "Older story", "source_url": "https://example.com/old2", "publication_date": "2020-03-01"},
+    ]
+    db.save_organization_data(bundle(news=old_news))
+
+    result = db.maintain_news(retention_months=12)
+    assert result["compacted"]["summarized_months"] == 1
+    assert count(db, "news_articles") == 0
+
+    # Re-research returns the same old articles; they are not stored again
+    again = db.save_organization_bundle(bundle(news=old_news))
+    assert again["news"] == NO_CHANGES
+    db.maintain_news(retention_months=12)
+
+    history = db.get_news_history("Example Party")
+    assert [(month["month"], month["article_count"]) for month in history] == [("2020-03-01", 2)]
@@ -1,33 +1,42 @@
-from langchain_community.document_loaders import AsyncHtmlLoader, WebBaseLoader
 from langchain_community.document_transformers import Html2TextTransformer
+from langchain_core.documents import Document
 from serpapi import GoogleSearch
 from bs4 import BeautifulSoup
-import requests
 import logging
 import os
-import asyncio
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
+from cache import SearchCache, get_search_cache
+from http_client import PageFetcher, SerpApiClient, get_page_fetcher, get_serpapi_client
 
 class WebSearcher:
-    def __init__(self):
+    def __init__(self,
+                 search_cache: Optional[SearchCache] = None,
+                 serpapi_client: Optional[SerpApiClient] = None,
+                 page_fetcher: Optional[PageFetcher] = None):
         self.logger = logging.getLogger(__name__)
+        self.search_cache = search_cache or get_search_cache()
+        self.serpapi_client = serpapi_client or get_serpapi_client()
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
+        self.page_fetcher = page_fetcher or get_page_fetcher(headers=self.headers)
         self.html2text = Html2TextTransformer()
 
     async def search_company_info(self, query: str) -> Optional[Dict]:
         try:
             # Step 1: Get search URLs
-            urls = self.get_search_urls(query)
+            urls = await self.get_search_urls_async(query)
             if not urls:
                 self.logger.error(f"No URLs found for query: {query}")
                 return None
 
-            # Step 2: Load HTML content asynchronously
-            loader = AsyncHtmlLoader(urls)
-            docs = await loader.aload()
+            # Step 2: Load HTML content concurrently over the shared connection pool
+            pages = await self.page_fetcher.fetch_many(urls)
+            docs = [
+                Document(page_content=html, metadata={"source": url})
+                for url, html in zip(urls, pages) if html
+            ]
             
             if not docs:
                 self.logger.error(f"No documents loaded for query: {query}")
@@ -48,14 +57,15 @@ class WebSearcher:
                 'articles': []
             }
 
-            for i, doc in enumerate(processed_docs):
+            for doc in processed_docs:
                 if doc and hasattr(doc, 'page_content'):
                     text_content = doc.page_content.strip()
                     if text_content:
+                        url = doc.metadata.get("source", "")
                         article = {
-                            'url': urls[i],
+                            'url': url,
                             'text': text_content[:2000],  # Limit text length
-                            'source': urlparse(urls[i]).netloc
+                            'source': urlparse(url).netloc
                         }
                         result['articles'].append(article)
 
@@ -71,183 +81,72 @@ class WebSearcher:
             self.logger.error(f"Error in search_company_info: {str(e)}")
             return None
 
-    def get_search_urls(self, query: str, num_results: int = 5) -> List[str]:
-        """Get URLs from Google Search using SerpAPI"""
-        try:
-            params = {
-                "api_key": os.getenv("SERPAPI_KEY"),
-                "engine": "google",
-                "q": query,
-                "num": num_results,
-                "hl": "en",  # Language
-                "gl": "us"   # Country
-            }
-            
-            search = GoogleSearch(params)
-            results = search.get_dict()
-            
-            urls = []
-            if "organic_results" in results:
-                for result in results["organic_results"]:
-                    if "link" in result:
-                        urls.append(result["link"])
-            
-            if not urls:
-                self.logger.warning(f"No search results found for query: {query}")
-                
-            return urls[:num_results]
-            
-        except Exception as e:
-            self.logger.error(f"Error in get_search_urls: {str(e)}")
-            return []
-
-    async def fetch_page_content(self, url: str) -> Optional[str]:
-        """Fetch and parse content from a single URL"""
-        try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'iframe']):
-                element.decompose()
-            
-            # Get text content
-            text = soup.get_text(separator='\n', strip=True)
-            
-            # Basic text cleaning
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            text = '\n'.join(lines)
-            
-            return text[:5000]  # Limit length
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching {url}: {str(e)}")
-            return None
-
-    def clean_text(self, text: str) -> str:
-        """Clean and format extracted text"""
-        if not text:
-            return ""
-            
-        # Remove extra whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        text = ' '.join(lines)
-        
-        # Remove very short lines (likely noise)
-        text = ' '.join([line for line in text.split('.') if len(line.strip()) > 30])
-        
-        return text.strip()
-from langchain_community.document_transformers import Html2TextTransformer
-from serpapi import GoogleSearch
-from bs4 import BeautifulSoup
-import requests
-import logging
-import os
-import asyncio
-from typing import List, Dict, Optional
-from urllib.parse import urlparse
-
-class WebSearcher:
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    def _search_params(self, query: str, num_results: int) -> Dict:
+        """Build the SerpAPI parameters for an organic Google search"""
+        return {
+            "engine": "google",
+            "q": query,
+            "num": num_results,
+            "hl": "en",  # Language
+            "gl": "us"   # Country
         }
-        self.html2text = Html2TextTransformer()
-
-    async def search_company_info(self, query: str) -> Optional[Dict]:
-        try:
-            # Step 1: Get search URLs
-            urls = self.get_search_urls(query)
-            if not urls:
-                self.logger.error(f"No URLs found for query: {query}")
-                return None
 
-            # Step 2: Load HTML content asynchronously
-            loader = AsyncHtmlLoader(urls)
-            docs = await loader.aload()
+    def _extract_urls(self, results: Optional[Dict], query: str, num_results: int) -> List[str]:
+        """Pull result links out of a SerpAPI response"""
+        urls = []
+        if results and "organic_results" in results:
+            for result in results["organic_results"]:
+                if "link" in result:
+                    urls.append(result["link"])
+        
+        if not urls:
+            self.logger.warning(f"No search results found for query: {query}")
             
-            if not docs:
-                self.logger.error(f"No documents loaded for query: {query}")
-                return None
-
-            # Step 3: Transform HTML to text
-            processed_docs = []
-            for doc in docs:
-                if doc and hasattr(doc, 'page_content'):
-                    # Transform one document at a time
-                    transformed = self.html2text.transform_documents([doc])
-                    if transformed:
-                        processed_docs.extend(transformed)
-
-            # Step 4: Process and structure the results
-            result = {
-                'content': '',
-                'articles': []
-            }
-
-            for i, doc in enumerate(processed_docs):
-                if doc and hasattr(doc, 'page_content'):
-                    text_content = doc.page_content.strip()
-                    if text_content:
-                        article = {
-                            'url': urls[i],
-                            'text': text_content[:2000],  # Limit text length
-                            'source': urlparse(urls[i]).netloc
-                        }
-                        result['articles'].append(article)
-
-            if result['articles']:
-                # Combine all article texts for content
-                result['content'] = ' '.join([article['text'] for article in result['articles']])
-                return result
-
-            self.logger.error(f"No valid content found for query: {query}")
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error in search_company_info: {str(e)}")
-            return None
+        return urls[:num_results]
 
     def get_search_urls(self, query: str, num_results: int = 5) -> List[str]:
         """Get URLs from Google Search using SerpAPI"""
         try:
-            params = {
-                "api_key": os.getenv("SERPAPI_KEY"),
-                "engine": "google",
-                "q": query,
-                "num": num_results,
-                "hl": "en",  # Language
-                "gl": "us"   # Country
-            }
+            params = self._search_params(query, num_results)
             
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = self.search_cache.get(params)
+            if results is None:
+                search = GoogleSearch({**params, "api_key": os.getenv("SERPAPI_KEY")})
+                results = search.get_dict()
+                self.search_cache.set(params, results)
+            else:
+                self.logger.info(f"Search cache hit for query: {query}")
             
-            urls = []
-            if "organic_results" in results:
-                for result in results["organic_results"]:
-                    if "link" in result:
-                        urls.append(result["link"])
-            
-            if not urls:
-                self.logger.warning(f"No search results found for query: {query}")
-                
-            return urls[:num_results]
+            return self._extract_urls(results, query, num_results)
             
         except Exception as e:
             self.logger.error(f"Error in get_search_urls: {str(e)}")
             return []
 
+    async def get_search_urls_async(self, query: str, num_results: int = 5) -> List[str]:
+        """Get URLs from Google Search using SerpAPI without blocking the event loop"""
+        try:
+            results = await self.serpapi_client.search(self._search_params(query, num_results))
+            return self._extract_urls(results, query, num_results)
+        except Exception as e:
+            self.logger.error(f"Error in get_search_urls_async: {str(e)}")
+            return []
+
     async def fetch_page_content(self, url: str) -> Optional[str]:
         """Fetch and parse content from a single URL"""
+        html = await self.page_fetcher.fetch(url)
+        return self._extract_page_text(url, html) if html else None
+
+    async def fetch_many_page_content(self, urls: List[str]) -> List[Optional[str]]:
+        """Fetch and parse several URLs concurrently, preserving order"""
+        pages = await self.page_fetcher.fetch_many(urls)
+        return [self._extract_page_text(url, html) if html else None
+                for url, html in zip(urls, pages)]
+
+    def _extract_page_text(self, url: str, html: str) -> Optional[str]:
+        """Strip markup and boilerplate from a downloaded page"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # Remove unwanted elements
             for element in soup(['script', 'style', 'nav', 'footer', 'iframe']):
@@ -263,7 +162,7 @@ class WebSearcher:
             return text[:5000]  # Limit length
             
         except Exception as e:
-            self.logger.error(f"Error fetching {url}: {str(e)}")
+            self.logger.error(f"Error parsing {url}: {str(e)}")
             return None
 
     def clean_text(self, text: str) -> str:
@@ -278,4 +177,4 @@ class WebSearcher:
         # Remove very short lines (likely noise)
         text = ' '.join([line for line in text.split('.') if len(line.strip()) > 30])
         
-        return text.strip()
\ No newline at end of file
+        return text.strip()